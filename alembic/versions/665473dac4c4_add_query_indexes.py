@@ -0,0 +1,64 @@
+"""Add indexes for repository queries
+
+Revision ID: 665473dac4c4
+Revises: cf6965a762de
+Create Date: 2026-10-17 09:00:00.000000
+
+Indexes are built CONCURRENTLY so existing tables stay writable while they
+build. CREATE INDEX CONCURRENTLY cannot run inside a transaction, hence the
+autocommit blocks. If a build fails it leaves an INVALID index behind; drop it
+and rerun the migration.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '665473dac4c4'
+down_revision: Union[str, Sequence[str], None] = 'cf6965a762de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # (name, table, columns, partial index predicate)
+    ('ix_posts_published_at_id', 'posts', ['published_at', 'id'], 'published_at IS NOT NULL'),
+    ('ix_posts_author_id_published_at_id', 'posts', ['author_id', 'published_at', 'id'], None),
+    ('ix_comments_post_id_created_at_id', 'comments', ['post_id', 'created_at', 'id'], None),
+    ('ix_comments_approved_post_id_created_at_id', 'comments', ['post_id', 'created_at', 'id'], 'is_approved'),
+    ('ix_comments_parent_comment_id', 'comments', ['parent_comment_id'], None),
+    ('ix_comments_user_id', 'comments', ['user_id'], None),
+    ('ix_postcategorylink_category_id_post_id', 'postcategorylink', ['category_id', 'post_id'], None),
+    ('ix_posttaglink_tag_id_post_id', 'posttaglink', ['tag_id', 'post_id'], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+    for table in {table for _, table, _, _ in INDEXES}:
+        op.execute(f'ANALYZE {table}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark: JWT encode/decode inline vs. through the thread pool.
+
+Runs each policy with the anyio thread limiter idle and with it saturated by
+blocking work (standing in for bcrypt under a signup burst).
+
+Usage (from the repository root):
+    python -m benchmarks.jwt_policy
+"""
+
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import anyio
+import anyio.to_thread
+import jwt
+
+from src.common.handle_sync import SyncPolicy, _handle_sync
+
+SECRET_KEY = "benchmark-secret-key"
+ALGORITHM = "HS256"
+ITERATIONS = 2000
+LIMITER_TOKENS = 100
+
+
+def encode_decode() -> dict:
+    """
+    Encode and decode one access token.
+    """
+    token = jwt.encode(
+        {"sub": "user@example.com", "exp": datetime.now(timezone.utc) + timedelta(minutes=15)},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+inline_call = _handle_sync(policy=SyncPolicy.INLINE)(encode_decode)
+thread_call = _handle_sync(policy=SyncPolicy.THREAD)(encode_decode)
+
+
+async def measure(call) -> list[float]:
+    """
+    Time ITERATIONS sequential awaits of call, in microseconds.
+    """
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    """
+    Print latency percentiles for a run.
+    """
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{name:<28} mean={statistics.fmean(samples):9.1f}us "
+        f"p50={statistics.median(samples):9.1f}us p99={p99:9.1f}us"
+    )
+
+
+async def saturate() -> None:
+    """
+    Keep one limiter token busy with blocking work until cancelled.
+    """
+    while True:
+        await anyio.to_thread.run_sync(time.sleep, 0.002)
+
+
+async def main() -> None:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = LIMITER_TOKENS
+
+    for policy, call in (("inline", inline_call), ("thread", thread_call)):
+        report(f"{policy} / idle pool", await measure(call))
+
+        # Occupy every limiter token but one with blocking work
+        async with anyio.create_task_group() as tg:
+            for _ in range(LIMITER_TOKENS - 1):
+                tg.start_soon(saturate)
+            report(f"{policy} / saturated pool", await measure(call))
+            tg.cancel_scope.cancel()
+
+
+if __name__ == "__main__":
+    anyio.run(main)
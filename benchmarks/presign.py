@@ -0,0 +1,100 @@
+"""
+Micro-benchmark: presigned download URLs, minio client vs. in-process signer.
+
+Compares the previous path (minio's presigned_get_object through the thread
+pool) with S3Presigner inline on the event loop, with and without the cached
+signing key. Each iteration signs a page worth of URLs concurrently, the way
+an image-heavy listing does. No storage server is needed: the region is
+configured, so neither path makes a network call. (The previous download path
+also stat'ed every object first, which this does not measure.)
+
+Usage (from the repository root):
+    python -m benchmarks.presign
+"""
+
+import asyncio
+import statistics
+import time
+from datetime import timedelta
+
+from minio import Minio
+
+from src.common.handle_sync import SyncPolicy, _handle_sync
+from src.file.signer import S3Presigner
+
+ENDPOINT = "minio:9000"
+ACCESS_KEY = "benchmark-access-key"
+SECRET_KEY = "benchmark-secret-key"
+REGION = "us-east-1"
+URLS_PER_PAGE = 48
+ITERATIONS = 500
+EXPIRES = timedelta(hours=1)
+
+client = Minio(
+    ENDPOINT, access_key=ACCESS_KEY, secret_key=SECRET_KEY, secure=False, region=REGION
+)
+presigner = S3Presigner(ENDPOINT, ACCESS_KEY, SECRET_KEY, REGION, secure=False)
+
+
+def minio_presign(object_name: str) -> str:
+    return client.presigned_get_object("images", object_name, expires=EXPIRES)
+
+
+def local_presign(object_name: str) -> str:
+    return presigner.presign_url("GET", "images", object_name, EXPIRES)
+
+
+def local_presign_uncached(object_name: str) -> str:
+    presigner._signing_keys.clear()
+    return presigner.presign_url("GET", "images", object_name, EXPIRES)
+
+
+CALLS = {
+    "minio / thread pool": _handle_sync(policy=SyncPolicy.THREAD)(minio_presign),
+    "minio / inline": _handle_sync(policy=SyncPolicy.INLINE)(minio_presign),
+    "signer / no key cache": _handle_sync(policy=SyncPolicy.INLINE)(
+        local_presign_uncached
+    ),
+    "signer / inline": _handle_sync(policy=SyncPolicy.INLINE)(local_presign),
+}
+
+
+async def measure(call) -> list[float]:
+    """
+    Time ITERATIONS pages of URLS_PER_PAGE concurrent calls, in microseconds.
+    """
+    names = [f"2025/03/{i:04d}_featured image.jpg" for i in range(URLS_PER_PAGE)]
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        await asyncio.gather(*(call(name) for name in names))
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    """
+    Print per-page latency percentiles for a run.
+    """
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{name:<24} mean={statistics.fmean(samples):9.1f}us "
+        f"p50={statistics.median(samples):9.1f}us p99={p99:9.1f}us "
+        f"per-url={statistics.fmean(samples) / URLS_PER_PAGE:7.1f}us"
+    )
+
+
+async def main() -> None:
+    # Same URL from both implementations, so the comparison is like for like
+    assert minio_presign("check.jpg").split("&X-Amz-Date=")[0] == local_presign(
+        "check.jpg"
+    ).split("&X-Amz-Date=")[0]
+
+    print(f"{URLS_PER_PAGE} URLs per page, {ITERATIONS} pages")
+    for name, call in CALLS.items():
+        report(name, await measure(call))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,197 @@
+"""
+Check: repository queries must not fall back to sequential scans.
+
+Seeds a few thousand posts and tens of thousands of comments inside a
+transaction, runs the repository methods behind the list/detail endpoints,
+captures the SQL they send, and EXPLAINs each statement with the same
+parameters. Any Seq Scan on one of the large tables fails the check. The
+transaction is rolled back, so the database is left untouched.
+
+Needs a migrated database (alembic upgrade head) reachable through the usual
+POSTGRES_* settings.
+
+Usage (from the repository root):
+    python -m benchmarks.query_plans
+"""
+
+import asyncio
+import json
+import sys
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event, text
+
+import src.main  # noqa: F401  (configures every mapper)
+from src.comment.repository import CommentRepository
+from src.common.db import SessionLocal, async_engine
+from src.post.repository import PostRepository
+
+POSTS = 5_000
+ROOT_COMMENTS_PER_POST = 8
+REPLIES_PER_ROOT = 2
+CHECKED_TABLES = {"posts", "comments", "postcategorylink", "posttaglink"}
+
+SEED = [
+    """
+    INSERT INTO users (email, fname, lname, role, is_active, is_email_verified, hashed_password)
+    SELECT 'plancheck-' || g || '@example.com', 'Plan', 'Check', 'USER', true, true, '-'
+    FROM generate_series(1, 50) g
+    """,
+    """
+    INSERT INTO categories (name, slug)
+    SELECT 'plancheck-cat-' || g, 'plancheck-cat-' || g FROM generate_series(1, 20) g
+    """,
+    """
+    INSERT INTO tags (name, slug)
+    SELECT 'plancheck-tag-' || g, 'plancheck-tag-' || g FROM generate_series(1, 50) g
+    """,
+    f"""
+    INSERT INTO posts (published_at, title, slug, summary, featured_image, view_count, body, author_id)
+    SELECT
+        CASE WHEN g % 10 = 0 THEN NULL ELSE now() - g * interval '1 hour' END,
+        'plancheck-post-' || g, 'plancheck-post-' || g, 'summary', 'images/x.png', 0,
+        '{{}}'::jsonb, u.id
+    FROM generate_series(1, {POSTS}) g
+    JOIN (
+        SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+        FROM users WHERE email LIKE 'plancheck-%'
+    ) u ON u.n = g % 50
+    """,
+    """
+    INSERT INTO postcategorylink (post_id, category_id)
+    SELECT p.id, c.id
+    FROM posts p
+    JOIN (
+        SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+        FROM categories WHERE slug LIKE 'plancheck-%'
+    ) c ON c.n = p.id % 20 OR c.n = (p.id + 7) % 20
+    WHERE p.slug LIKE 'plancheck-%'
+    """,
+    """
+    INSERT INTO posttaglink (post_id, tag_id)
+    SELECT p.id, t.id
+    FROM posts p
+    JOIN (
+        SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+        FROM tags WHERE slug LIKE 'plancheck-%'
+    ) t ON t.n IN (p.id % 50, (p.id + 11) % 50, (p.id + 23) % 50)
+    WHERE p.slug LIKE 'plancheck-%'
+    """,
+    f"""
+    INSERT INTO comments (created_at, post_id, author_name, author_email, content, is_approved)
+    SELECT now() - g * interval '1 minute', p.id, 'Reader', 'reader@example.com', 'comment', g % 5 <> 0
+    FROM posts p CROSS JOIN generate_series(1, {ROOT_COMMENTS_PER_POST}) g
+    WHERE p.slug LIKE 'plancheck-%'
+    """,
+    f"""
+    INSERT INTO comments (created_at, post_id, author_name, author_email, content, is_approved, parent_comment_id)
+    SELECT c.created_at + g * interval '1 second', c.post_id, 'Reader', 'reader@example.com', 'reply', true, c.id
+    FROM comments c
+    JOIN posts p ON p.id = c.post_id AND p.slug LIKE 'plancheck-%'
+    CROSS JOIN generate_series(1, {REPLIES_PER_ROOT}) g
+    WHERE c.parent_comment_id IS NULL
+    """,
+    "ANALYZE users, categories, tags, posts, postcategorylink, posttaglink, comments",
+]
+
+
+def seq_scans(plan: dict[str, Any]) -> list[str]:
+    """
+    Collect the checked tables that a plan (or any sub-plan) scans sequentially.
+    """
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in CHECKED_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def capture(call: Callable[[], Awaitable[Any]]) -> list[tuple[str, Any]]:
+    """
+    Run a repository call and return the statements it executed.
+    """
+    statements: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await call()
+    finally:
+        event.remove(
+            async_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+        )
+    return statements
+
+
+async def main() -> int:
+    posts, comments = PostRepository(), CommentRepository()
+    failures = 0
+
+    async with SessionLocal() as session:
+        await session.begin()
+        try:
+            for statement in SEED:
+                await session.execute(text(statement))
+
+            post_id, author_id = (
+                await session.execute(
+                    text(
+                        "SELECT id, author_id FROM posts WHERE slug = 'plancheck-post-1'"
+                    )
+                )
+            ).one()
+
+            checks: dict[str, Callable[[], Awaitable[Any]]] = {
+                "post detail": lambda: posts.get_by_id(post_id, session),
+                "published posts": lambda: posts.list_published(session, limit=20),
+                "posts by category": lambda: posts.list_published(
+                    session, limit=20, category_slug="plancheck-cat-3"
+                ),
+                "posts by tag": lambda: posts.list_published(
+                    session, limit=20, tag_slug="plancheck-tag-7"
+                ),
+                "posts by author": lambda: posts.list_published(
+                    session, limit=20, author_id=author_id
+                ),
+                "approved comments": lambda: comments.get_by_post_id(
+                    post_id, session, limit=20, is_approved=True
+                ),
+                "all comments": lambda: comments.get_by_post_id(
+                    post_id, session, limit=20
+                ),
+                "comment count": lambda: comments.count_by_post_id(
+                    post_id, session, is_approved=True
+                ),
+                "comment tree": lambda: comments.get_thread_page(
+                    post_id, session, limit=20, max_depth=3
+                ),
+            }
+
+            for name, call in checks.items():
+                connection = await session.connection()
+                for statement, parameters in await capture(call):
+                    result = await connection.exec_driver_sql(
+                        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                    )
+                    explained = result.scalar_one()
+                    if isinstance(explained, str):
+                        explained = json.loads(explained)
+                    plan = explained[0]["Plan"]
+                    if scanned := seq_scans(plan):
+                        failures += 1
+                        print(f"FAIL {name}: Seq Scan on {', '.join(scanned)}")
+                        print(f"     {' '.join(statement.split())}")
+                    else:
+                        print(f"ok   {name}")
+        finally:
+            await session.rollback()
+
+    await async_engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
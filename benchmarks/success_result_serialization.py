@@ -0,0 +1,108 @@
+"""
+Benchmark: SuccessResult serialization, previous dict + stdlib json path vs.
+the pydantic-core bytes path, for PostPublic payloads with large bodies.
+
+Usage (from the repository root):
+    python -m benchmarks.success_result_serialization
+"""
+
+import datetime
+import statistics
+import time
+
+from fastapi.responses import JSONResponse
+from starlette.requests import Request
+
+from src.auth.schemas import UserPublic
+from src.category.schemas import CategoryPublic
+from src.common.http_responses.success_response import SuccessResponse
+from src.common.http_responses.success_result import SuccessResult
+from src.post.schemas import PostPublic
+from src.tag.schemas import TagPublic
+
+ITERATIONS = 500
+BODY_SIZES = (1_000, 50_000, 500_000)
+
+
+def make_post(body_size: int) -> PostPublic:
+    """
+    Build a validated PostPublic with a body of roughly body_size characters.
+    """
+    return PostPublic(
+        id=1,
+        title="Benchmark post",
+        summary="Summary",
+        body="Lorem ipsum dolor sit amet. " * (body_size // 28),
+        featured_image="images/cover.png",
+        slug="benchmark-post",
+        published_at=datetime.datetime.now(datetime.timezone.utc),
+        view_count=42,
+        categories=[
+            CategoryPublic(id=i, name=f"c{i}", slug=f"c{i}", description=None)
+            for i in range(5)
+        ],
+        tags=[TagPublic(id=i, name=f"t{i}", slug=f"t{i}") for i in range(15)],
+        author_id=1,
+        author=UserPublic(
+            id=1,
+            email="author@example.com",
+            fname="Author",
+            lname="Name",
+            role="ADMIN",
+            is_active=True,
+        ),
+    )
+
+
+def previous_path(result: SuccessResult, request: Request) -> bytes:
+    """
+    The original implementation: build the model, dump to a dict, json.dumps it.
+    """
+    model = SuccessResponse[PostPublic](
+        code=result.code,
+        message=result.message,
+        status=result.status_code,
+        data=result.data,
+        timestamp=datetime.datetime.now(datetime.timezone.utc),
+        path=request.url.path,
+    )
+    return JSONResponse(
+        status_code=result.status_code, content=model.model_dump(mode="json")
+    ).body
+
+
+def fast_path(result: SuccessResult, request: Request) -> bytes:
+    """
+    The current implementation.
+    """
+    return result.to_json_response(request).body
+
+
+def measure(fn, result: SuccessResult, request: Request) -> float:
+    """
+    Median time per call in microseconds.
+    """
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        fn(result, request)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    request = Request(
+        {"type": "http", "path": "/post/1", "query_string": b"", "headers": []}
+    )
+    for body_size in BODY_SIZES:
+        result = SuccessResult[PostPublic](data=make_post(body_size))
+        previous = measure(previous_path, result, request)
+        fast = measure(fast_path, result, request)
+        print(
+            f"body={body_size:>7} chars  previous={previous:9.1f}us "
+            f"fast={fast:9.1f}us  speedup={previous / fast:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
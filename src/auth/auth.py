@@ -2,10 +2,11 @@ from datetime import datetime, timedelta, timezone
 from functools import lru_cache, wraps
 from typing import Annotated
 
-import bcrypt
 import jwt
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
 from jwt.exceptions import (
     ExpiredSignatureError,
     InvalidSignatureError,
@@ -13,7 +14,7 @@ from jwt.exceptions import (
 )
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..common.deps import AsyncSessionDep
+from ..common.deps import AsyncSessionDep, ReadSessionDep
 from ..common.exceptions.exceptions import (
     ForbiddenException,
     InternalException,
@@ -21,14 +22,106 @@ from ..common.exceptions.exceptions import (
     InvalidTokenException,
     UnauthorizedException,
 )
-from ..common.handle_sync import _handle_sync
+from ..common.handle_sync import SyncPolicy, _handle_sync
 from ..common.settings import settings
+from ..common.ttl_cache import TTLCache
 from .models import User
+from .password import check_password, hash_password
 from .repository import UserRepository, get_UserRepository
 from .schemas import TokenData
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+# Same scheme for routes where authentication is optional
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token", auto_error=False)
+
+# Authenticated users keyed by token subject (email), so hot users skip the DB
+user_cache: TTLCache[str, User] = TTLCache(
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+
+def cache_user(user: User) -> User:
+    """
+    Cache a detached copy of a user, so it is not tied to the request session.
+
+    Args:
+        user (User): The user loaded from the database.
+
+    Returns:
+        User: The user that was passed in.
+    """
+    if settings.AUTH_USER_CACHE_TTL_SECONDS > 0:
+        cached = User(**user.model_dump())
+        make_transient_to_detached(cached)
+        user_cache.set(user.email, cached)
+    return user
+
+
+def invalidate_cached_user(email: str) -> None:
+    """
+    Drop a user from the authentication cache.
+
+    Args:
+        email (str): The user's email (token subject).
+    """
+    user_cache.delete(email)
+
+
+# session.info key collecting the emails of users changed in the transaction
+CHANGED_USER_EMAILS = "changed_user_emails"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def collect_changed_user(mapper, connection, target: User):
+    """
+    SQLAlchemy event listener recording a changed user for cache invalidation.
+
+    The cache entry is dropped once the transaction commits, not at flush
+    time: a concurrent request in between would read the old row and cache
+    it again. Covers is_active/role changes made outside UserService as well.
+
+    Args:
+        mapper: SQLAlchemy mapper.
+        connection: Database connection.
+        target (User): The User instance being persisted.
+    """
+    history = inspect(target).attrs.email.history
+    emails = {*history.deleted, target.email}
+    session = object_session(target)
+    if session is None:
+        for email in emails:
+            invalidate_cached_user(email)
+        return
+    session.info.setdefault(CHANGED_USER_EMAILS, set()).update(emails)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_changed_users(session: Session):
+    """
+    SQLAlchemy event listener dropping users changed in a committed transaction
+    from the cache.
+
+    Args:
+        session (Session): The session whose transaction committed.
+    """
+    for email in session.info.pop(CHANGED_USER_EMAILS, ()):
+        invalidate_cached_user(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changed_users(session: Session):
+    """
+    SQLAlchemy event listener forgetting users changed in a rolled back
+    transaction; the cached rows are still current.
+
+    Args:
+        session (Session): The session whose transaction rolled back.
+    """
+    session.info.pop(CHANGED_USER_EMAILS, None)
+
 
 class AuthService:
     """
@@ -38,35 +131,33 @@ class AuthService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    @_handle_sync
-    def verify_password(self, plain_password: str, hashed_password: str):
+    async def verify_password(self, plain_password: str, hashed_password: str):
         """
         Verify a plain password against a hashed password.
+
+        Raises:
+            ServiceUnavailableException: If the password hashing pool is saturated.
         """
-        plain_password_byte_enc = plain_password.encode("utf-8")
-        hashed_password_byte_enc = hashed_password.encode("utf-8")
-        return bcrypt.checkpw(
-            password=plain_password_byte_enc, hashed_password=hashed_password_byte_enc
-        )
-
-    @_handle_sync
-    def get_password_hash(self, password: str):
+        return await check_password(plain_password, hashed_password)
+
+    async def get_password_hash(self, password: str):
         """
         Hash a password using bcrypt.
+
+        Raises:
+            ServiceUnavailableException: If the password hashing pool is saturated.
         """
-        pwd_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(password=pwd_bytes, salt=salt)
-        return hashed_password.decode("utf-8")
+        return await hash_password(password)
 
-    @_handle_sync
+    # HMAC signing takes microseconds; a thread hop would cost more than the work
+    @_handle_sync(policy=SyncPolicy.INLINE)
     def encode_jwt(self, data: dict):
         """
         Encode data into a JWT token.
         """
         return jwt.encode(data, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
-    @_handle_sync
+    @_handle_sync(policy=SyncPolicy.INLINE)
     def decode_jwt(self, token: str) -> dict:
         """
         Decode a JWT token.
@@ -103,10 +194,14 @@ class AuthService:
         except Exception:
             raise InternalException()
 
+        cached_user = user_cache.get(token_data.username)
+        if cached_user is not None:
+            return cached_user
+
         user = await self.user_repository.get_by_email(token_data.username, session)
         if user is None:
             raise UnauthorizedException()
-        return user
+        return cache_user(user)
 
     async def authenticate_user(self, email: str, password: str, session: AsyncSession):
         """
@@ -154,6 +249,25 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_optional_active_user(
+    token: Annotated[str | None, Depends(optional_oauth2_scheme)],
+    session: ReadSessionDep,
+    auth_service: Annotated[AuthService, Depends(get_AuthService)],
+) -> User | None:
+    """
+    Dependency to get the current active user if a token is sent, else None.
+
+    Uses the read-only session, so public read routes can depend on it
+    without opening a write transaction. An invalid token is still rejected.
+    """
+    if token is None:
+        return None
+    user = await auth_service.verify_user(token, session)
+    if not user.is_active:
+        raise UnauthorizedException()
+    return user
+
+
 def authorize(role: list):
     """
     Decorator to enforce role-based access control.
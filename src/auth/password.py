@@ -0,0 +1,142 @@
+"""
+Password hashing on a dedicated, bounded process pool.
+
+bcrypt is deliberately slow CPU work. Running it in its own processes keeps it
+off the shared anyio thread limiter and away from the event loop's GIL, and
+the pending-task cap turns a signup flood into fast 503s instead of a queue
+that starves every other endpoint.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import wraps
+from typing import Awaitable, Callable, ParamSpec, TypeVar
+
+import bcrypt
+
+from ..common.bounded_executor import BoundedExecutor
+from ..common.exceptions.exceptions import ServiceUnavailableException
+from ..common.handle_sync import SyncPolicy, _handle_sync
+from ..common.settings import settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_password_executor: BoundedExecutor | None = None
+
+
+def get_password_executor() -> BoundedExecutor:
+    """
+    Get the password hashing executor, creating it on first use.
+
+    Returns:
+        BoundedExecutor: The bounded process pool for bcrypt.
+    """
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = BoundedExecutor(
+            ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            ),
+            max_pending=settings.PASSWORD_HASH_WORKERS
+            + settings.PASSWORD_HASH_MAX_QUEUE,
+            name="password_hash",
+        )
+    return _password_executor
+
+
+def _init_worker() -> None:
+    """
+    Process pool initializer. Unpickling it in a new worker imports this
+    module, and with it bcrypt and the hashing functions.
+    """
+
+
+async def warm_up_password_executor() -> None:
+    """
+    Spawn the hashing workers and wait for them to run a first task.
+
+    Workers only start on submit, and a spawned worker then imports the
+    application before it can hash; doing that here keeps it out of the first
+    login. One task per worker makes the pool start all of them.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_password_executor()
+    await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, _init_worker)
+            for _ in range(settings.PASSWORD_HASH_WORKERS)
+        )
+    )
+
+
+def shutdown_password_executor() -> None:
+    """
+    Shut down the password hashing executor, if it was started.
+    """
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=True, cancel_futures=True)
+        _password_executor = None
+
+
+def _replace_broken_pool(
+    func: Callable[P, Awaitable[T]],
+) -> Callable[P, Awaitable[T]]:
+    """
+    Recover from a worker dying (e.g. OOM-killed) mid-task.
+
+    A ProcessPoolExecutor whose worker dies is broken for good: every later
+    submit fails. The broken pool is dropped so the next call starts a fresh
+    one, and the affected call gets a 503 like a saturated pool.
+    """
+
+    @wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        global _password_executor
+        executor = get_password_executor()
+        try:
+            return await func(*args, **kwargs)
+        except BrokenProcessPool:
+            # Concurrent callers see the same broken pool; replace it once
+            if _password_executor is executor:
+                logger.error("Password hashing pool broke; starting a new one")
+                _password_executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise ServiceUnavailableException(
+                detail={"executor": executor.name, "reason": "worker restarted"}
+            )
+
+    return wrapper
+
+
+@_replace_broken_pool
+@_handle_sync(policy=SyncPolicy.PROCESS, executor=get_password_executor)
+def hash_password(password: str) -> str:
+    """
+    Hash a password using bcrypt.
+    """
+    pwd_bytes = password.encode("utf-8")
+    salt = bcrypt.gensalt()
+    hashed_password = bcrypt.hashpw(password=pwd_bytes, salt=salt)
+    return hashed_password.decode("utf-8")
+
+
+@_replace_broken_pool
+@_handle_sync(policy=SyncPolicy.PROCESS, executor=get_password_executor)
+def check_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plain password against a bcrypt hash.
+    """
+    plain_password_byte_enc = plain_password.encode("utf-8")
+    hashed_password_byte_enc = hashed_password.encode("utf-8")
+    return bcrypt.checkpw(
+        password=plain_password_byte_enc, hashed_password=hashed_password_byte_enc
+    )
@@ -26,6 +26,7 @@ UserServiceDep = Annotated[UserService, Depends(get_UserService)]
     responses={
         **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
         **ResponseErrorDoc.HTTP_409_CONFLICT(),
+        **ResponseErrorDoc.HTTP_503_SERVICE_UNAVAILABLE(),
     },
 )
 async def signup(
@@ -60,6 +61,7 @@ async def signup(
         **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
         **ResponseErrorDoc.HTTP_404_NOT_FOUND(),
         **ResponseErrorDoc.HTTP_401_UNAUTHORIZED(),
+        **ResponseErrorDoc.HTTP_503_SERVICE_UNAVAILABLE(),
     },
 )
 async def token(
@@ -83,6 +85,7 @@ async def token(
         **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
         **ResponseErrorDoc.HTTP_404_NOT_FOUND(),
         **ResponseErrorDoc.HTTP_401_UNAUTHORIZED(),
+        **ResponseErrorDoc.HTTP_503_SERVICE_UNAVAILABLE(),
     },
 )
 async def signin(
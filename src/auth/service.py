@@ -82,6 +82,7 @@ class UserService:
         Update user information by user ID.
         """
         user_data = update_data.model_dump(exclude_unset=True)
+        # The auth cache entry is dropped on commit (see collect_changed_user)
         updated_user = await self.repository.update(id, user_data, session)
 
         return updated_user
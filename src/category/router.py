@@ -9,13 +9,20 @@ from fastapi import APIRouter, Body, Depends, Request, status
 
 from ..auth.auth import authorize, get_current_active_user
 from ..auth.models import User
-from ..common.deps import AsyncSessionDep
+from ..common.db import release_connection
+from ..common.deps import AsyncSessionDep, ReadSessionDep
+from ..common.http_cache import (
+    not_modified_response,
+    records_etag,
+    with_cache_headers,
+)
 from ..common.http_responses.doc_responses import (
     ResponseErrorDoc,
     ResponseSuccessDoc,
 )
 from ..common.http_responses.success_response import SuccessCodes
 from ..common.http_responses.success_result import SuccessResult
+from ..common.query_budget import query_budget
 from ..common.user_role import UserRole
 from .schemas import CategoryPublic, CreateCategory, UpdateCategory
 from .service import CategoryService, get_CategoryService
@@ -178,9 +185,10 @@ async def delete_category(
         **ResponseErrorDoc.HTTP_404_NOT_FOUND(),
     },
 )
+@query_budget(1)
 async def get_category_by_id(
     category_id: int,
-    session: AsyncSessionDep,
+    session: ReadSessionDep,
     service: CategoryServiceDep,
     request: Request,
 ):
@@ -189,7 +197,7 @@ async def get_category_by_id(
 
     Args:
         category_id (int): The ID of the category to retrieve.
-        session (AsyncSessionDep): The database session.
+        session (ReadSessionDep): The read-only database session.
         service (CategoryServiceDep): The category service dependency.
         request (Request): The HTTP request object.
 
@@ -197,6 +205,11 @@ async def get_category_by_id(
         JSONResponse: The requested category wrapped in a SuccessResult.
     """
     category = await service.get_category_by_id(category_id, session)
+    await release_connection(session)
+
+    etag = records_etag([category])
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
 
     public_category = CategoryPublic.model_validate(category)
 
@@ -207,7 +220,7 @@ async def get_category_by_id(
         data=public_category,
     )
 
-    return result.to_json_response(request)
+    return with_cache_headers(result.to_json_response(request), request, etag)
 
 
 @router.get(
@@ -220,14 +233,15 @@ async def get_category_by_id(
         **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
     },
 )
+@query_budget(1)
 async def list_categories(
-    session: AsyncSessionDep, service: CategoryServiceDep, request: Request
+    session: ReadSessionDep, service: CategoryServiceDep, request: Request
 ):
     """
     Retrieve all categories.
 
     Args:
-        session (AsyncSessionDep): The database session.
+        session (ReadSessionDep): The read-only database session.
         service (CategoryServiceDep): The category service dependency.
         request (Request): The HTTP request object.
 
@@ -235,6 +249,11 @@ async def list_categories(
         JSONResponse: A list of categories wrapped in a SuccessResult.
     """
     categories = await service.get_all_categories(session)
+    await release_connection(session)
+
+    etag = records_etag(categories)
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
 
     public_categories = [
         CategoryPublic.model_validate(category) for category in categories
@@ -247,4 +266,4 @@ async def list_categories(
         data=public_categories,
     )
 
-    return result.to_json_response(request)
+    return with_cache_headers(result.to_json_response(request), request, etag)
@@ -4,32 +4,53 @@ Handles business logic and error handling for category CRUD operations.
 """
 
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, Sequence
 
 from fastapi import Depends
 from sqlalchemy.exc import IntegrityError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..common.db import after_commit
 from ..common.exceptions.exceptions import (
     DuplicateEntryException,
     EntityNotFoundException,
     InternalException,
 )
+from ..common.settings import settings
+from ..common.versioned_cache import (
+    VersionedCache,
+    get_cache_backend,
+    model_list_codec,
+)
 from .models import Category
 from .repository import CategoryRepository, get_CategoryRepository
 from .schemas import CreateCategory, UpdateCategory
 
+_dump_categories, _load_categories = model_list_codec(Category)
+
+# Taxonomy is read on nearly every page and written rarely
+category_list_cache: VersionedCache[list[Category]] = VersionedCache(
+    get_cache_backend(),
+    namespace="categories",
+    ttl_seconds=settings.TAXONOMY_CACHE_TTL_SECONDS,
+    dump=_dump_categories,
+    load=_load_categories,
+)
+
 
 class CategoryService:
     """
     Service class for managing Category entities.
     """
 
-    def __init__(self, repo: CategoryRepository):
+    def __init__(
+        self, repo: CategoryRepository, list_cache: VersionedCache[list[Category]]
+    ):
         """
-        Initialize the CategoryService with a repository.
+        Initialize the CategoryService with a repository and the list cache.
         """
         self.repository = repo
+        self.list_cache = list_cache
 
     async def create_category(
         self, data: CreateCategory, session: AsyncSession
@@ -64,6 +85,7 @@ class CategoryService:
                 message="An unexpected error occurred while creating the category.",
                 underlying_error=e,
             )
+        after_commit(session, self.list_cache.invalidate)
         return category_record
 
     async def update_category(
@@ -98,6 +120,7 @@ class CategoryService:
                 message="An unexpected error occurred while updating the category.",
                 underlying_error=e,
             )
+        after_commit(session, self.list_cache.invalidate)
         return updated_category
 
     async def delete_category(self, id: int, session: AsyncSession) -> Category:
@@ -112,6 +135,7 @@ class CategoryService:
             Category: The deleted category instance.
         """
         result = await self.repository.delete(id, session)
+        after_commit(session, self.list_cache.invalidate)
         return result
 
     async def get_category_by_id(self, id: int, session: AsyncSession) -> Category:
@@ -133,6 +157,44 @@ class CategoryService:
             raise EntityNotFoundException(str(id), Category.__name__)
         return result
 
+    async def get_categories_by_ids(
+        self, ids: Sequence[int], session: AsyncSession
+    ) -> list[Category]:
+        """
+        Retrieve several categories by ID in a single query.
+
+        Args:
+            ids (Sequence[int]): IDs of the categories.
+            session (AsyncSession): Database session.
+
+        Returns:
+            list[Category]: The categories, in the order of ids.
+
+        Raises:
+            EntityNotFoundException: If any of the IDs does not exist.
+        """
+        records, missing = await self.repository.get_many_by_ids(ids, session)
+        if missing:
+            raise EntityNotFoundException(
+                Category.__name__, ", ".join(str(id) for id in missing)
+            )
+        return records
+
+    async def get_category_ids_by_slugs(
+        self, slugs: Sequence[str], session: AsyncSession
+    ) -> dict[str, int]:
+        """
+        Resolve several category slugs to IDs in a single query.
+
+        Args:
+            slugs (Sequence[str]): Slugs of the categories.
+            session (AsyncSession): Database session.
+
+        Returns:
+            dict[str, int]: Category IDs keyed by slug; unknown slugs are absent.
+        """
+        return await self.repository.get_ids_by(Category.slug, slugs, session)
+
     async def get_all_categories(self, session: AsyncSession) -> list[Category]:
         """
         Retrieve all categories.
@@ -141,9 +203,11 @@ class CategoryService:
             session (AsyncSession): Database session.
 
         Returns:
-            list[Category]: List of all categories.
+            list[Category]: All categories, cached until a write or the TTL.
         """
-        return await self.repository.get_all(session)
+        return await self.list_cache.get_or_load(
+            "all", lambda: self.repository.get_all(session)
+        )
 
 
 @lru_cache
@@ -153,4 +217,4 @@ def get_CategoryService(
     """
     Dependency injector for CategoryService.
     """
-    return CategoryService(categoryRepository)
+    return CategoryService(categoryRepository, category_list_cache)
@@ -3,6 +3,7 @@ SQLModel definition for Comment.
 Represents the comment entity in the database.
 """
 
+from sqlalchemy import Index, text
 from sqlmodel import Field
 
 from ..common.generic_model import GenericModel
@@ -14,6 +15,22 @@ class Comment(GenericModel, table=True):
     """
 
     __tablename__: str = "comments"  # type: ignore
+    __table_args__ = (
+        # Listing and counting per post, keyset on (created_at, id)
+        Index("ix_comments_post_id_created_at_id", "post_id", "created_at", "id"),
+        # Same for the default, approved-only view and the thread roots
+        Index(
+            "ix_comments_approved_post_id_created_at_id",
+            "post_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_approved"),
+        ),
+        # Walking replies in the thread CTE and counting them
+        Index("ix_comments_parent_comment_id", "parent_comment_id"),
+        # users foreign key (ON DELETE CASCADE)
+        Index("ix_comments_user_id", "user_id"),
+    )
 
     post_id: int = Field(foreign_key="posts.id", nullable=False)
     author_name: str = Field(nullable=False)
@@ -3,14 +3,35 @@ Repository layer for Comment.
 Handles direct database operations for Comment entities.
 """
 
+from datetime import datetime
 from functools import lru_cache
+from typing import Any, NamedTuple
 
+from sqlalchemy import Integer, false, func, literal_column, true, tuple_
+from sqlalchemy.orm import aliased
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..common.generic_repository import GenericRepository
 from .models import Comment
 
 
+class ThreadRow(NamedTuple):
+    """
+    A comment loaded as part of a thread page.
+
+    Attributes:
+        comment (Comment): The comment.
+        depth (int): 0 for top-level comments, parent's depth + 1 for replies.
+        reply_count (int): Number of direct approved replies, including those
+            below the depth limit that were not loaded.
+    """
+
+    comment: Comment
+    depth: int
+    reply_count: int
+
+
 class CommentRepository(GenericRepository[Comment]):
     """
     Repository for Comment model, inherits generic CRUD operations.
@@ -19,21 +40,165 @@ class CommentRepository(GenericRepository[Comment]):
     def __init__(self):
         super().__init__(Comment)
 
-    async def get_by_post_id(self, post_id: int, session):
+    async def get_by_post_id(
+        self,
+        post_id: int,
+        session: AsyncSession,
+        *,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        is_approved: bool | None = None,
+    ) -> tuple[list[Comment], tuple[Any, ...] | None]:
+        """
+        Get one page of comments for a post, oldest first, keyed on (created_at, id).
+
+        Args:
+            post_id (int): The ID of the post.
+            session (AsyncSession): Database session.
+            limit (int): Page size.
+            after (tuple[datetime, int] | None): Key of the last comment of the
+                previous page.
+            is_approved (bool | None): Only comments with this approval state,
+                or all comments if None.
+
+        Returns:
+            tuple[list[Comment], tuple[Any, ...] | None]: The comments and the
+            key of the last one if more comments follow.
         """
-        Retrieve all comments for a given post ID.
+        return await self.get_page(
+            session,
+            keyset=(Comment.created_at, Comment.id),
+            limit=limit,
+            after=after,
+            filters=self._post_filters(post_id, is_approved),
+            descending=False,
+        )
+
+    async def count_by_post_id(
+        self, post_id: int, session: AsyncSession, is_approved: bool | None = None
+    ) -> int:
+        """
+        Count the comments of a post.
 
         Args:
             post_id (int): The ID of the post.
-            session: Database session.
+            session (AsyncSession): Database session.
+            is_approved (bool | None): Only comments with this approval state,
+                or all comments if None.
 
         Returns:
-            list[Comment]: List of comments for the post.
+            int: The number of matching comments.
         """
-        result = await session.exec(
-            select(self.model).where(self.model.post_id == post_id)
+        statement = select(func.count()).where(
+            *self._post_filters(post_id, is_approved)
+        )
+        return (await session.exec(statement)).one()
+
+    @staticmethod
+    def _post_filters(post_id: int, is_approved: bool | None) -> list[Any]:
+        filters: list[Any] = [Comment.post_id == post_id]
+        if is_approved is not None:
+            # Literal predicates (no bind parameter) so the partial index applies
+            filters.append(
+                Comment.is_approved == true()
+                if is_approved
+                else Comment.is_approved == false()
+            )
+        return filters
+
+    async def get_thread_page(
+        self,
+        post_id: int,
+        session: AsyncSession,
+        *,
+        limit: int,
+        max_depth: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> tuple[list[ThreadRow], tuple[Any, ...] | None]:
+        """
+        Load a page of top-level threads and their approved replies in one query.
+
+        A recursive CTE starts from up to limit + 1 top-level comments, oldest
+        first, keyed on (created_at, id), and walks down parent_comment_id up
+        to max_depth levels. The extra top-level comment only signals that
+        another page exists, so its replies are not walked. Rows come back in
+        (created_at, id) order, so every parent precedes its replies.
+
+        Args:
+            post_id (int): The ID of the post.
+            session (AsyncSession): Database session.
+            limit (int): Number of top-level threads per page.
+            max_depth (int): Levels of replies to load below top-level comments.
+            after (tuple[datetime, int] | None): Key of the last top-level
+                comment of the previous page.
+
+        Returns:
+            tuple[list[ThreadRow], tuple[Any, ...] | None]: The page's comments
+            and the key of its last top-level comment if more threads follow.
+        """
+        roots = select(Comment.id, Comment.created_at).where(
+            Comment.post_id == post_id,
+            Comment.parent_comment_id.is_(None),  # type: ignore
+            Comment.is_approved == true(),
+        )
+        if after is not None:
+            roots = roots.where(tuple_(Comment.created_at, Comment.id) > tuple_(*after))
+        roots = (
+            roots.order_by(Comment.created_at, Comment.id)  # type: ignore
+            .limit(limit + 1)
+            .subquery("roots")
+        )
+
+        thread = select(
+            roots.c.id,
+            literal_column("0", Integer).label("depth"),
+            func.row_number()
+            .over(order_by=(roots.c.created_at, roots.c.id))
+            .label("root_rank"),
+        ).cte("thread", recursive=True)
+        thread = thread.union_all(
+            select(
+                Comment.id,
+                (thread.c.depth + 1).label("depth"),
+                thread.c.root_rank,
+            )
+            .join(thread, Comment.parent_comment_id == thread.c.id)
+            .where(
+                thread.c.depth < max_depth,
+                thread.c.root_rank <= limit,
+                Comment.is_approved == true(),
+            )
+        )
+
+        replies = aliased(Comment)
+        reply_count = (
+            select(func.count())
+            .where(
+                replies.parent_comment_id == Comment.id,
+                replies.is_approved == true(),
+            )
+            .scalar_subquery()
+        )
+        statement = (
+            select(Comment, thread.c.depth, thread.c.root_rank, reply_count)
+            .join(thread, Comment.id == thread.c.id)
+            .order_by(Comment.created_at, Comment.id)  # type: ignore
+        )
+
+        rows = (await session.exec(statement)).all()
+        page = [
+            ThreadRow(comment, depth, count)
+            for comment, depth, root_rank, count in rows
+            if root_rank <= limit
+        ]
+        if len(rows) == len(page):
+            return page, None
+
+        last_root = max(
+            (row.comment for row in page if row.depth == 0),
+            key=lambda comment: (comment.created_at, comment.id),
         )
-        return list(result)
+        return page, (last_root.created_at, last_root.id)
 
 
 @lru_cache
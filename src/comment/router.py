@@ -3,21 +3,40 @@ API router for Comment endpoints.
 Handles HTTP requests for comment CRUD operations.
 """
 
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Request, status
+from fastapi import APIRouter, Body, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 
-from ..auth.auth import authorize, get_current_active_user
+from ..auth.auth import (
+    authorize,
+    get_current_active_user,
+    get_optional_active_user,
+)
 from ..auth.models import User
-from ..common.deps import AsyncSessionDep
+from ..common.db import ReadSessionLocal, release_connection
+from ..common.exceptions.exceptions import ForbiddenException
+from ..common.deps import AsyncSessionDep, ReadSessionDep
 from ..common.http_responses.doc_responses import (
     ResponseErrorDoc,
     ResponseSuccessDoc,
 )
 from ..common.http_responses.success_response import SuccessCodes
 from ..common.http_responses.success_result import SuccessResult
+from ..common.ndjson import ndjson_response
+from ..common.pagination import CursorPage
+from ..common.query_budget import query_budget
+from ..common.settings import settings
 from ..common.user_role import UserRole
-from .schemas import CommentPublic, CreateComment
+from .schemas import (
+    CommentApproval,
+    CommentExport,
+    CommentNode,
+    CommentPage,
+    CommentPublic,
+    CreateComment,
+)
 from .service import CommentService, get_CommentService
 
 router = APIRouter(prefix="/comment", tags=["comment"])
@@ -72,41 +91,201 @@ async def create_comment(
 
 @router.get(
     "/by-post/{post_id}",
-    response_model=SuccessResult[list[CommentPublic]],
+    response_model=SuccessResult[CommentPage],
     responses={
-        **ResponseSuccessDoc.HTTP_200_OK(
-            "Comments fetched successfully", CommentPublic
+        **ResponseSuccessDoc.HTTP_200_OK("Comments fetched successfully", CommentPage),
+        **ResponseErrorDoc.HTTP_400_BAD_REQUEST("Invalid pagination cursor"),
+        **ResponseErrorDoc.HTTP_403_FORBIDDEN(
+            "Only admins may list pending or all comments"
         ),
         **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
         **ResponseErrorDoc.HTTP_404_NOT_FOUND(),
     },
 )
+# Page, count, and the user lookup when a token misses the auth cache
+@query_budget(3)
 async def list_comments(
-    post_id: int, session: AsyncSessionDep, service: CommentServiceDep, request: Request
+    post_id: int,
+    session: ReadSessionDep,
+    service: CommentServiceDep,
+    request: Request,
+    current_user: Annotated[User | None, Depends(get_optional_active_user)],
+    limit: int = Query(
+        settings.PAGE_SIZE_DEFAULT,
+        ge=1,
+        le=settings.PAGE_SIZE_MAX,
+        description="Page size",
+    ),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    approval: CommentApproval = Query(
+        CommentApproval.APPROVED, description="Approval state to filter on"
+    ),
+    include_total: bool = Query(False, description="Include the total count"),
 ):
     """
-    Retrieve all comments for a given post.
+    Retrieve comments for a given post, oldest first, with cursor pagination.
 
     Args:
         post_id (int): The ID of the post to fetch comments for.
-        session (AsyncSessionDep): The database session.
+        session (ReadSessionDep): The read-only database session.
         service (CommentServiceDep): The comment service dependency.
         request (Request): The HTTP request object.
+        current_user (User | None): The current authenticated user, if any.
+        limit (int): Page size.
+        cursor (str | None): Cursor from the previous page.
+        approval (CommentApproval): Approval state filter; anything but
+            APPROVED requires an admin.
+        include_total (bool): Whether to include the (cached) total count.
 
     Returns:
-        JSONResponse: A list of comments wrapped in a SuccessResult.
+        JSONResponse: A page of comments wrapped in a SuccessResult.
+
+    Raises:
+        ForbiddenException: If a non-admin asks for unmoderated comments.
     """
-    comments = await service.get_comments_by_post(post_id, session)
-    public_comments = [CommentPublic.model_validate(comment) for comment in comments]
-    result = SuccessResult[list[CommentPublic]](
+    if approval != CommentApproval.APPROVED and (
+        current_user is None or current_user.role != UserRole.ADMIN
+    ):
+        raise ForbiddenException()
+    comments, next_cursor = await service.get_comments_by_post(
+        post_id,
+        session,
+        limit=limit,
+        cursor=cursor,
+        is_approved=approval.is_approved,
+    )
+    total = (
+        await service.count_comments_by_post(post_id, session, approval.is_approved)
+        if include_total
+        else None
+    )
+    await release_connection(session)
+    page = CommentPage(
+        items=[CommentPublic.model_validate(comment) for comment in comments],
+        next_cursor=next_cursor,
+        total=total,
+    )
+    result = SuccessResult[CommentPage](
         code=SuccessCodes.SUCCESS,
         message="Comments fetched successfully",
         status_code=status.HTTP_200_OK,
-        data=public_comments,
+        data=page,
     )
     return result.to_json_response(request)
 
 
+@router.get(
+    "/post/{post_id}/tree",
+    response_model=SuccessResult[CursorPage[CommentNode]],
+    responses={
+        **ResponseSuccessDoc.HTTP_200_OK(
+            "Comment tree fetched successfully", CursorPage[CommentNode]
+        ),
+        **ResponseErrorDoc.HTTP_400_BAD_REQUEST("Invalid pagination cursor"),
+        **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
+    },
+)
+@query_budget(1)
+async def get_comment_tree(
+    post_id: int,
+    session: ReadSessionDep,
+    service: CommentServiceDep,
+    request: Request,
+    limit: int = Query(
+        settings.PAGE_SIZE_DEFAULT,
+        ge=1,
+        le=settings.PAGE_SIZE_MAX,
+        description="Top-level threads per page",
+    ),
+    depth: int = Query(
+        settings.COMMENT_TREE_DEPTH_DEFAULT,
+        ge=0,
+        le=settings.COMMENT_TREE_DEPTH_MAX,
+        description="Levels of replies to include below top-level comments",
+    ),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+):
+    """
+    Retrieve approved comments for a post as threads, oldest first.
+
+    Args:
+        post_id (int): The ID of the post to fetch comments for.
+        session (ReadSessionDep): The read-only database session.
+        service (CommentServiceDep): The comment service dependency.
+        request (Request): The HTTP request object.
+        limit (int): Top-level threads per page.
+        depth (int): Levels of replies to include.
+        cursor (str | None): Cursor from the previous page.
+
+    Returns:
+        JSONResponse: A page of comment threads wrapped in a SuccessResult.
+    """
+    threads, next_cursor = await service.get_comment_tree(
+        post_id, session, limit=limit, max_depth=depth, cursor=cursor
+    )
+    await release_connection(session)
+    result = SuccessResult[CursorPage[CommentNode]](
+        code=SuccessCodes.SUCCESS,
+        message="Comment tree fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data=CursorPage[CommentNode](items=threads, next_cursor=next_cursor),
+    )
+    return result.to_json_response(request)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        **ResponseSuccessDoc.HTTP_200_NDJSON(
+            "One CommentExport per line", CommentExport
+        ),
+        **ResponseErrorDoc.HTTP_403_FORBIDDEN(),
+    },
+)
+@authorize(role=[UserRole.ADMIN])
+async def export_comments(
+    service: CommentServiceDep,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    request: Request,
+    created_from: datetime | None = Query(
+        None, description="Only comments created at or after this time"
+    ),
+    created_before: datetime | None = Query(
+        None, description="Only comments created before this time"
+    ),
+):
+    """
+    Export all comments, approved or not, as NDJSON.
+
+    Rows are streamed from a server-side cursor as they are sent, so memory
+    use does not grow with the number of comments. The body is gzipped when
+    the client sends Accept-Encoding: gzip.
+
+    Args:
+        service (CommentServiceDep): The comment service dependency.
+        current_user (User): The current authenticated user.
+        request (Request): The HTTP request object.
+        created_from (datetime | None): Lower bound on created_at, inclusive.
+        created_before (datetime | None): Upper bound on created_at, exclusive.
+
+    Returns:
+        StreamingResponse: The NDJSON stream.
+    """
+
+    async def records():
+        # Request-scoped sessions are closed before the body is sent
+        async with ReadSessionLocal() as session:
+            async for record in service.export_comments(
+                session, created_from, created_before
+            ):
+                yield record
+
+    return ndjson_response(
+        request, records(), "comments.ndjson", settings.EXPORT_GZIP_LEVEL
+    )
+
+
 @router.delete(
     "/{comment_id}",
     response_model=SuccessResult[CommentPublic],
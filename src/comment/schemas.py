@@ -3,8 +3,13 @@ Pydantic schemas for Comment API.
 Defines request and response models for comment endpoints.
 """
 
+from datetime import datetime
+from enum import StrEnum
+
 from pydantic import BaseModel, EmailStr, Field
 
+from ..common.pagination import CursorPage
+
 
 class CreateComment(BaseModel):
     """
@@ -34,3 +39,72 @@ class CommentPublic(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class CommentExport(BaseModel):
+    """
+    Schema for one line of a comment export.
+    """
+
+    id: int
+    post_id: int
+    parent_comment_id: int | None
+    user_id: int | None
+    author_name: str
+    author_email: str
+    content: str
+    is_approved: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class CommentNode(CommentPublic):
+    """
+    A comment with its loaded replies, as part of a threaded view.
+
+    Attributes:
+        depth (int): 0 for top-level comments.
+        reply_count (int): Number of direct replies, including any not loaded
+            because of the depth limit.
+        replies (list[CommentNode]): Loaded direct replies, oldest first.
+    """
+
+    depth: int
+    reply_count: int
+    replies: list["CommentNode"] = Field(default_factory=list)
+
+
+class CommentApproval(StrEnum):
+    """
+    Approval filter for comment listings.
+    """
+
+    APPROVED = "APPROVED"
+    PENDING = "PENDING"
+    ALL = "ALL"
+
+    @property
+    def is_approved(self) -> bool | None:
+        """
+        The is_approved value to filter on, or None for no filter.
+        """
+        return {
+            CommentApproval.APPROVED: True,
+            CommentApproval.PENDING: False,
+            CommentApproval.ALL: None,
+        }[self]
+
+
+class CommentPage(CursorPage[CommentPublic]):
+    """
+    A page of comments for a post.
+
+    Attributes:
+        total (int | None): Number of matching comments, if requested. May lag
+            behind recent changes by up to COMMENT_COUNT_CACHE_TTL_SECONDS.
+    """
+
+    total: int | None = None
@@ -3,17 +3,45 @@ Service layer for Comment operations.
 Handles business logic and error handling for comment CRUD operations.
 """
 
+from datetime import datetime
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 from fastapi import Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..auth.models import User
+from ..common.db import after_commit
 from ..common.exceptions.exceptions import EntityNotFoundException, InternalException
+from ..common.pagination import decode_cursor, encode_cursor
+from ..common.settings import settings
+from ..common.utils import to_naive_utc
+from ..common.versioned_cache import VersionedCache, get_cache_backend
 from .models import Comment
 from .repository import CommentRepository, get_CommentRepository
-from .schemas import CreateComment
+from .schemas import CommentExport, CommentNode, CreateComment
+
+
+def comment_count_cache(post_id: int) -> VersionedCache[int]:
+    """
+    Get the cache of comment counts for a post.
+
+    Each post has its own namespace, so a new comment only invalidates the
+    counts of the post it belongs to.
+
+    Args:
+        post_id (int): The ID of the post.
+
+    Returns:
+        VersionedCache[int]: Cache keyed by approval filter.
+    """
+    return VersionedCache(
+        get_cache_backend(),
+        namespace=f"comment_count:{post_id}",
+        ttl_seconds=settings.COMMENT_COUNT_CACHE_TTL_SECONDS,
+        dump=lambda count: str(count).encode(),
+        load=int,
+    )
 
 
 class CommentService:
@@ -75,22 +103,113 @@ class CommentService:
                 message="An unexpected error occurred while creating the comment.",
                 underlying_error=e,
             )
+        after_commit(session, comment_count_cache(comment_record.post_id).invalidate)
         return comment_record
 
     async def get_comments_by_post(
-        self, post_id: int, session: AsyncSession
-    ) -> list[Comment]:
+        self,
+        post_id: int,
+        session: AsyncSession,
+        limit: int,
+        cursor: str | None = None,
+        is_approved: bool | None = True,
+    ) -> tuple[list[Comment], str | None]:
+        """
+        Retrieve comments for a given post, oldest first, one page at a time.
+
+        Args:
+            post_id (int): The ID of the post.
+            session (AsyncSession): Database session.
+            limit (int): Page size.
+            cursor (str | None): Cursor returned with the previous page.
+            is_approved (bool | None): Only comments with this approval state,
+                or all comments if None.
+
+        Returns:
+            tuple[list[Comment], str | None]: The comments and the cursor for
+            the next page.
+
+        Raises:
+            InvalidRequestException: If the cursor is malformed.
+        """
+        after = decode_cursor(cursor, tuple[datetime, int]) if cursor else None
+        comments, next_key = await self.repository.get_by_post_id(
+            post_id,
+            session,
+            limit=limit,
+            after=after,  # type: ignore
+            is_approved=is_approved,
+        )
+        return comments, encode_cursor(next_key) if next_key else None
+
+    async def count_comments_by_post(
+        self, post_id: int, session: AsyncSession, is_approved: bool | None = True
+    ) -> int:
+        """
+        Count the comments of a post, served from the count cache when warm.
+
+        Args:
+            post_id (int): The ID of the post.
+            session (AsyncSession): Database session.
+            is_approved (bool | None): Only comments with this approval state,
+                or all comments if None.
+
+        Returns:
+            int: The number of matching comments.
         """
-        Retrieve all comments for a given post.
+        return await comment_count_cache(post_id).get_or_load(
+            str(is_approved),
+            lambda: self.repository.count_by_post_id(post_id, session, is_approved),
+        )
+
+    async def get_comment_tree(
+        self,
+        post_id: int,
+        session: AsyncSession,
+        limit: int,
+        max_depth: int,
+        cursor: str | None = None,
+    ) -> tuple[list[CommentNode], str | None]:
+        """
+        Retrieve a page of threaded comments for a post.
 
         Args:
             post_id (int): The ID of the post.
             session (AsyncSession): Database session.
+            limit (int): Number of top-level threads per page.
+            max_depth (int): Levels of replies to include below top-level comments.
+            cursor (str | None): Cursor returned with the previous page.
 
         Returns:
-            list[Comment]: List of comments for the post.
+            tuple[list[CommentNode], str | None]: The top-level comments with
+            their nested replies, and the cursor for the next page.
+
+        Raises:
+            InvalidRequestException: If the cursor is malformed.
         """
-        return await self.repository.get_by_post_id(post_id, session)
+        after = decode_cursor(cursor, tuple[datetime, int]) if cursor else None
+        rows, next_key = await self.repository.get_thread_page(
+            post_id,
+            session,
+            limit=limit,
+            max_depth=max_depth,
+            after=after,  # type: ignore
+        )
+
+        # Parents always precede their replies, so one pass builds the tree
+        nodes: dict[int, CommentNode] = {}
+        threads: list[CommentNode] = []
+        for comment, depth, reply_count in rows:
+            node = CommentNode.model_validate(
+                {**comment.model_dump(), "depth": depth, "reply_count": reply_count}
+            )
+            nodes[node.id] = node
+            if depth == 0:
+                threads.append(node)
+            else:
+                nodes[comment.parent_comment_id].replies.append(node)  # type: ignore
+
+        return threads, encode_cursor(next_key) if next_key else None
 
     async def delete_comment(
         self,
@@ -118,8 +237,35 @@ class CommentService:
             )
 
         await session.delete(comment)
+        after_commit(session, comment_count_cache(comment.post_id).invalidate)
         return comment
 
+    async def export_comments(
+        self,
+        session: AsyncSession,
+        created_from: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> AsyncIterator[CommentExport]:
+        """
+        Stream all comments, approved or not, in ID order.
+
+        Args:
+            session (AsyncSession): A session dedicated to the export.
+            created_from (datetime | None): Only comments created at or after this.
+            created_before (datetime | None): Only comments created before this.
+
+        Yields:
+            CommentExport: The comments.
+        """
+        comments = self.repository.stream(
+            session,
+            created_from=created_from and to_naive_utc(created_from),
+            created_before=created_before and to_naive_utc(created_before),
+            yield_per=settings.EXPORT_BATCH_SIZE,
+        )
+        async for comment in comments:
+            yield CommentExport.model_validate(comment)
+
 
 @lru_cache
 def get_CommentService(
@@ -0,0 +1,72 @@
+"""
+Executor wrapper that rejects work instead of queueing it without bound.
+"""
+
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable
+
+from .exceptions.exceptions import ServiceUnavailableException
+
+
+class BoundedExecutor(Executor):
+    """
+    Executor that caps the number of submitted-but-unfinished tasks.
+
+    Once max_pending tasks are running or queued, submit() raises
+    ServiceUnavailableException (503) so callers shed load immediately
+    instead of piling up behind a saturated pool.
+
+    Args:
+        executor (Executor): The executor doing the work.
+        max_pending (int): Maximum number of running plus queued tasks.
+        name (str): Name used in error details.
+    """
+
+    def __init__(self, executor: Executor, max_pending: int, name: str):
+        self._executor = executor
+        self.max_pending = max_pending
+        self.name = name
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of running plus queued tasks.
+        """
+        return self._pending
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """
+        Submit a task, or reject it if the executor is saturated.
+
+        Raises:
+            ServiceUnavailableException: If max_pending tasks are already pending.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise ServiceUnavailableException(
+                    detail={"executor": self.name, "pending": self._pending}
+                )
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Shut down the wrapped executor.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -2,25 +2,94 @@
 Database engine and session management for SQLModel and SQLAlchemy.
 """
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+import logging
+from typing import Awaitable, Callable
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from .metrics import registry
+from .pool_metrics import InstrumentedAsyncQueuePool
+from .query_metrics import instrument_engine
+from .read_routing import reads_from_primary
 from .settings import settings
 
-DATABASE_URL = f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-
-async_engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    echo_pool=False,
-    future=True,
-    pool_size=20,
-    max_overflow=20,
-    pool_recycle=3600,
-    pool_pre_ping=True,
+logger = logging.getLogger(__name__)
+
+# session.info key holding callbacks to run once the transaction commits
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+def _database_url(host: str, port: int) -> str:
+    return f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{host}:{port}/{settings.POSTGRES_DB}"
+
+
+def pool_sizing() -> tuple[int, int]:
+    """
+    Get this worker's pool size and max overflow.
+
+    With DB_CONNECTION_BUDGET set, each of the WEB_CONCURRENCY workers gets an
+    equal share of it: the pool is capped at the share and overflow fills the
+    rest, so all workers together never exceed the budget.
+
+    Returns:
+        tuple[int, int]: pool_size and max_overflow for each engine.
+    """
+    pool_size, max_overflow = settings.DB_POOL_SIZE, settings.DB_POOL_MAX_OVERFLOW
+    if settings.DB_CONNECTION_BUDGET is None:
+        return pool_size, max_overflow
+
+    share = max(1, settings.DB_CONNECTION_BUDGET // settings.WEB_CONCURRENCY)
+    pool_size = min(pool_size, share)
+    return pool_size, min(max_overflow, share - pool_size)
+
+
+def _create_engine(url: str, name: str) -> AsyncEngine:
+    pool_size, max_overflow = pool_sizing()
+    engine = create_async_engine(
+        url,
+        echo=False,
+        echo_pool=settings.DB_ECHO_POOL,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_logging_name=name,
+    )
+    instrument_engine(engine, name)
+    return engine
+
+
+DATABASE_URL = _database_url(settings.POSTGRES_HOST, settings.POSTGRES_PORT)
+
+async_engine = _create_engine(DATABASE_URL, "primary")
+
+# Without a configured replica, reads share the primary's pool
+replica_engine = (
+    _create_engine(
+        _database_url(
+            settings.POSTGRES_REPLICA_HOST,
+            settings.POSTGRES_REPLICA_PORT or settings.POSTGRES_PORT,
+        ),
+        "replica",
+    )
+    if settings.POSTGRES_REPLICA_HOST
+    else async_engine
 )
 
+
+def _refresh_pool_gauges() -> None:
+    for engine in dict.fromkeys((async_engine, replica_engine)):
+        engine.sync_engine.pool.refresh_gauges()  # type: ignore[attr-defined]
+
+
+registry.register_collector(_refresh_pool_gauges)
+
 SessionLocal = async_sessionmaker(
     autocommit=False,
     autoflush=True,
@@ -29,6 +98,22 @@ SessionLocal = async_sessionmaker(
     class_=AsyncSession,
 )
 
+# Read sessions run in READ ONLY transactions, on the replica or the primary
+ReadSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=replica_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+)
+PrimaryReadSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=async_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+)
+
 
 async def create_db_and_tables():
     """
@@ -43,8 +128,84 @@ async def get_session():
     """
     Dependency for getting an async database session.
 
+    The transaction is committed when the request succeeds, then callbacks
+    registered with after_commit() run. No connection is checked out of the
+    pool until the first statement runs, so requests that fail before touching
+    the database never hold one.
+
     Yields:
         AsyncSession: The database session.
     """
     async with SessionLocal.begin() as session:
         yield session
+    await run_after_commit(session)
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Run a callback once the session's transaction has committed.
+
+    Use it for side effects that must not be seen before the data is, such
+    as cache invalidation: invalidating before the commit lets a concurrent
+    reader cache the old rows again under the new version.
+
+    Args:
+        session (AsyncSession): A session from get_session().
+        callback (Callable[[], Awaitable[None]]): Awaited after the commit; not
+            run if the transaction rolls back.
+    """
+    session.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """
+    Run and clear the callbacks registered with after_commit().
+
+    The data is already committed, so a failing callback is logged rather
+    than failing the request.
+
+    Args:
+        session (AsyncSession): The session whose transaction committed.
+    """
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS, []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("after_commit callback failed")
+
+
+async def get_read_session(request: Request):
+    """
+    Dependency for getting a read-only async database session.
+
+    Reads go to the replica unless the client wrote recently or asked for
+    primary reads (see read_routing). The transaction autobegins on the first
+    statement and has nothing to commit, so handlers may end it early with
+    release_connection().
+
+    Args:
+        request (Request): The incoming request.
+
+    Yields:
+        AsyncSession: The read-only database session.
+    """
+    session_factory = (
+        PrimaryReadSessionLocal if reads_from_primary(request) else ReadSessionLocal
+    )
+    async with session_factory() as session:
+        yield session
+
+
+async def release_connection(session: AsyncSession) -> None:
+    """
+    End a read-only session's transaction and return its connection to the pool.
+
+    Call this after the last query of a read handler so the connection is not
+    held while the response is serialized and sent. Objects already loaded
+    stay usable, but unloaded lazy attributes can no longer be fetched; a new
+    statement on the session checks out a connection again.
+
+    Args:
+        session (AsyncSession): The read-only session.
+    """
+    await session.close()
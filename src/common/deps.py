@@ -7,7 +7,10 @@ from typing import Annotated
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .db import get_session
+from .db import get_read_session, get_session
 
 # Alias for dependency-injected AsyncSession
 AsyncSessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+# Read-only session, served by a replica when one is configured
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
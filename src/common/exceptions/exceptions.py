@@ -112,6 +112,20 @@ class InvalidPayloadException(AppBaseException):
             payload = {1: "No payload provided"}
 
 
+class InvalidRequestException(AppBaseException):
+    """
+    Exception for malformed request parameters.
+    """
+
+    def __init__(self, message="Invalid request", detail: dict | None = None):
+        super().__init__(
+            code=ErrorCodes.INVALID_REQUEST,
+            message=message,
+            status_code=400,
+            detail=detail,
+        )
+
+
 class DuplicateEntryException(AppBaseException):
     """
     Exception for duplicate entry errors.
@@ -203,6 +217,26 @@ class ForbiddenException(AppBaseException):
         )
 
 
+class ServiceUnavailableException(AppBaseException):
+    """
+    Exception for requests rejected because a resource is saturated.
+    """
+
+    def __init__(
+        self,
+        detail=None,
+        message: str = "Service temporarily overloaded. Please retry later.",
+    ):
+        if detail is None:
+            detail = {}
+        super().__init__(
+            code=ErrorCodes.SERVICE_UNAVAILABLE,
+            message=message,
+            status_code=503,
+            detail=detail,
+        )
+
+
 class InternalException(AppBaseException):
     """
     Exception for unexpected internal errors.
@@ -2,8 +2,21 @@
 Generic repository for CRUD operations on SQLModel models.
 """
 
-from typing import Any, Dict, Generic, Optional, Type, TypeVar
-
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+from sqlalchemy import Integer, any_, bindparam, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -21,7 +34,8 @@ class GenericRepository(Generic[T]):
         model (Type[T]): The SQLModel model class.
 
     Methods:
-        create, get_by_id, get_all, update, delete
+        create, get_by_id, get_many_by_ids, get_ids_by, get_all, get_page,
+        stream, update, delete
     """
 
     def __init__(self, model: Type[T]):
@@ -60,20 +74,87 @@ class GenericRepository(Generic[T]):
         record = await self._create_record(data, session)
         return record
 
-    async def get_by_id(self, id: int, session: AsyncSession) -> Optional[T]:
+    async def get_by_id(
+        self,
+        id: int,
+        session: AsyncSession,
+        options: Sequence[ExecutableOption] | None = None,
+        populate_existing: bool = False,
+    ) -> Optional[T]:
         """
         Get a record by ID.
 
         Args:
             id (int): The record ID.
             session (AsyncSession): Database session.
+            options (Sequence[ExecutableOption] | None): Loader options
+                (e.g. selectinload/joinedload) applied to the query.
+            populate_existing (bool): Overwrite an instance already present in
+                the session with the freshly loaded row and relationships.
 
         Returns:
             Optional[T]: The record if found, else None.
         """
-        return (
-            await session.exec(select(self.model).where(self.model.id == id))
-        ).first()
+        statement = select(self.model).where(self.model.id == id)
+        if options:
+            statement = statement.options(*options)
+        if populate_existing:
+            statement = statement.execution_options(populate_existing=True)
+        return (await session.exec(statement)).first()
+
+    async def get_many_by_ids(
+        self, ids: Sequence[int], session: AsyncSession
+    ) -> tuple[list[T], list[int]]:
+        """
+        Get several records by ID in a single query.
+
+        The IDs are sent as one array parameter (id = ANY($1)), so the statement
+        text does not change with the number of IDs.
+
+        Args:
+            ids (Sequence[int]): The record IDs; duplicates are ignored.
+            session (AsyncSession): Database session.
+
+        Returns:
+            tuple[list[T], list[int]]: The found records in the order of their
+            first appearance in ids, and the IDs that do not exist.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return [], []
+
+        statement = select(self.model).where(
+            self.model.id == any_(bindparam(None, unique_ids, type_=ARRAY(Integer)))
+        )
+        found = {record.id: record for record in (await session.exec(statement)).all()}
+
+        records = [found[id] for id in unique_ids if id in found]
+        missing = [id for id in unique_ids if id not in found]
+        return records, missing
+
+    async def get_ids_by(
+        self, column: Any, values: Sequence[Any], session: AsyncSession
+    ) -> dict[Any, int]:
+        """
+        Map values of a unique column to record IDs in a single query.
+
+        Args:
+            column (Any): A unique model column, e.g. Model.slug.
+            values (Sequence[Any]): The values to look up.
+            session (AsyncSession): Database session.
+
+        Returns:
+            dict[Any, int]: Record IDs keyed by column value; values that do
+            not exist are absent.
+        """
+        unique_values = list(dict.fromkeys(values))
+        if not unique_values:
+            return {}
+
+        statement = select(column, self.model.id).where(
+            column == any_(bindparam(None, unique_values, type_=ARRAY(column.type)))
+        )
+        return {value: id for value, id in (await session.exec(statement)).all()}
 
     async def get_all(self, session: AsyncSession) -> list[T]:
         """
@@ -87,6 +168,103 @@ class GenericRepository(Generic[T]):
         """
         return list((await session.exec(select(self.model))).all())
 
+    async def get_page(
+        self,
+        session: AsyncSession,
+        *,
+        keyset: Sequence[Any],
+        limit: int,
+        after: Sequence[Any] | None = None,
+        filters: Sequence[Any] = (),
+        options: Sequence[ExecutableOption] | None = None,
+        descending: bool = True,
+    ) -> tuple[list[T], tuple[Any, ...] | None]:
+        """
+        Get one page of records using keyset pagination.
+
+        The keyset columns must be non-nullable for the filtered rows and the
+        last column must be unique (usually the primary key) so the ordering
+        is total.
+
+        Args:
+            session (AsyncSession): Database session.
+            keyset (Sequence[Any]): Model columns defining the sort order.
+            limit (int): Maximum number of records to return.
+            after (Sequence[Any] | None): Sort key of the last record of the
+                previous page, or None for the first page.
+            filters (Sequence[Any]): Extra WHERE clauses.
+            options (Sequence[ExecutableOption] | None): Loader options.
+            descending (bool): Sort newest/largest first.
+
+        Returns:
+            tuple[list[T], tuple[Any, ...] | None]: The records and the sort key
+            of the last one if more records follow, else None.
+        """
+        statement = select(self.model).where(*filters)
+        if after is not None:
+            row_key, after_key = tuple_(*keyset), tuple_(*after)
+            statement = statement.where(
+                row_key < after_key if descending else row_key > after_key
+            )
+        statement = statement.order_by(
+            *(column.desc() if descending else column.asc() for column in keyset)
+        ).limit(limit + 1)  # One extra row tells us whether another page exists
+        if options:
+            statement = statement.options(*options)
+
+        records = list((await session.exec(statement)).all())
+        if len(records) <= limit:
+            return records, None
+
+        records = records[:limit]
+        last = records[-1]
+        return records, tuple(getattr(last, column.key) for column in keyset)
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        *,
+        created_from: datetime | None = None,
+        created_before: datetime | None = None,
+        filters: Sequence[Any] = (),
+        options: Sequence[ExecutableOption] | None = None,
+        yield_per: int = 1000,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over all matching records in ID order through a server-side cursor.
+
+        Rows are fetched yield_per at a time, so memory stays constant however
+        many records match. The session's connection is held until iteration
+        ends; use a dedicated session rather than a request-scoped one.
+
+        Args:
+            session (AsyncSession): Database session.
+            created_from (datetime | None): Only records created at or after this.
+            created_before (datetime | None): Only records created before this.
+            filters (Sequence[Any]): Extra WHERE clauses.
+            options (Sequence[ExecutableOption] | None): Loader options; eager
+                loaders must be compatible with yield_per (e.g. selectinload).
+            yield_per (int): Rows fetched per round trip.
+
+        Yields:
+            T: The records.
+        """
+        filters = list(filters)
+        if created_from is not None:
+            filters.append(self.model.created_at >= created_from)
+        if created_before is not None:
+            filters.append(self.model.created_at < created_before)
+
+        statement = select(self.model).where(*filters).order_by(self.model.id)
+        if options:
+            statement = statement.options(*options)
+
+        result = await session.stream_scalars(
+            statement, execution_options={"yield_per": yield_per}
+        )
+        async for record in result:
+            yield record
+
     async def update(self, id: int, data: Dict[str, Any], session: AsyncSession) -> T:
         """
         Update a record by ID.
@@ -1,9 +1,13 @@
 """
-Decorator to run synchronous functions in a threadpool as async.
+Decorator to run synchronous functions as async, with a per-function execution policy.
 """
 
-from functools import wraps
-from typing import Awaitable, Callable, ParamSpec, TypeVar
+import asyncio
+import importlib
+from concurrent.futures import Executor
+from enum import StrEnum
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, ParamSpec, TypeVar, overload
 
 from fastapi.concurrency import run_in_threadpool
 
@@ -11,22 +15,128 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
-def _handle_sync(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+class SyncPolicy(StrEnum):
     """
-    Decorator to make a synchronous function run asynchronously in a threadpool.
+    Where a synchronous function decorated with _handle_sync runs.
+
+    INLINE runs it directly on the event loop; use it for CPU work that takes
+    microseconds, where a thread hop costs more than the call itself.
+    THREAD runs it in the anyio worker thread pool; use it for blocking I/O.
+    PROCESS runs it in the given process pool; use it for CPU-heavy work.
+    """
+
+    INLINE = "INLINE"
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+# Undecorated functions by (module, qualified name), so process pool workers can
+# find them after importing the defining module (the decorated name is the wrapper)
+_process_targets: dict[tuple[str, str], Callable[..., Any]] = {}
+
+
+def _run_process_target(key: tuple[str, str], args: tuple, kwargs: dict) -> Any:
+    """
+    Entry point executed inside a process pool worker.
+    """
+    if key not in _process_targets:
+        # Spawned workers start empty; importing the module re-registers it
+        importlib.import_module(key[0])
+    return _process_targets[key](*args, **kwargs)
+
+
+@overload
+def _handle_sync(func: Callable[P, T]) -> Callable[P, Awaitable[T]]: ...
+
+
+@overload
+def _handle_sync(
+    func: None = None,
+    *,
+    policy: SyncPolicy = SyncPolicy.THREAD,
+    executor: Callable[[], Executor] | None = None,
+) -> Callable[[Callable[P, T]], Callable[P, Awaitable[T]]]: ...
+
+
+def _handle_sync(
+    func: Callable[P, T] | None = None,
+    *,
+    policy: SyncPolicy = SyncPolicy.THREAD,
+    executor: Callable[[], Executor] | None = None,
+):
+    """
+    Decorator to make a synchronous function awaitable.
+
+    Can be used bare (thread pool) or with a policy:
+
+        @_handle_sync
+        def blocking_io(): ...
+
+        @_handle_sync(policy=SyncPolicy.INLINE)
+        def cheap_cpu(): ...
 
     Args:
-        func (Callable[P, T]): The synchronous function.
+        func (Callable[P, T] | None): The synchronous function.
+        policy (SyncPolicy): Where the function runs.
+        executor (Callable[[], Executor] | None): Factory for the executor to
+            run in. Required for PROCESS, where it should be a process pool
+            using the "spawn" start method (forking a threaded event loop
+            process is unsafe), and arguments (including self for methods)
+            must be picklable. For THREAD it replaces the anyio thread pool,
+            e.g. to give blocking I/O its own bounded pool.
 
     Returns:
         Callable[P, Awaitable[T]]: An async wrapper for the function.
+
+    Raises:
+        ValueError: If policy is PROCESS and no executor is given.
     """
 
-    @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        try:
+    def decorator(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+        if policy == SyncPolicy.INLINE:
+
+            @wraps(func)
+            async def inline_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                return func(*args, **kwargs)
+
+            return inline_wrapper
+
+        if policy == SyncPolicy.PROCESS:
+            if executor is None:
+                raise ValueError(
+                    f"{func.__qualname__}: SyncPolicy.PROCESS needs an executor"
+                )
+            key = (func.__module__, func.__qualname__)
+            _process_targets[key] = func
+            get_executor = executor
+
+            @wraps(func)
+            async def process_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    get_executor(), partial(_run_process_target, key, args, kwargs)
+                )
+
+            return process_wrapper
+
+        if executor is not None:
+            get_thread_executor = executor
+
+            @wraps(func)
+            async def executor_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    get_thread_executor(), partial(func, *args, **kwargs)
+                )
+
+            return executor_wrapper
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             return await run_in_threadpool(func, *args, **kwargs)
-        except Exception as e:
-            raise e
 
-    return wrapper
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -0,0 +1,116 @@
+"""
+HTTP caching helpers: ETags, conditional GET (If-None-Match) and Cache-Control.
+
+Response envelopes carry a per-request timestamp, so representations are never
+byte-identical and the ETags are weak (W/"..."). Weak validators are exactly
+what If-None-Match compares, so browsers and CDNs still revalidate with 304s.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable
+
+from fastapi import Request, Response, status
+
+from .settings import settings
+
+
+def compute_etag(parts: Iterable[Any]) -> str:
+    """
+    Build a weak ETag from the values identifying a representation's version.
+
+    Args:
+        parts (Iterable[Any]): Values that change whenever the content changes.
+
+    Returns:
+        str: The weak ETag, quoted.
+    """
+    digest = hashlib.blake2b(
+        "|".join(map(str, parts)).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _timestamp(value: datetime | None) -> str:
+    return value.isoformat() if value is not None else ""
+
+
+def records_etag(records: Iterable[Any]) -> str:
+    """
+    Build an ETag from the identity and updated_at of the records in a response.
+
+    Args:
+        records (Iterable[Any]): GenericModel instances rendered in the response.
+
+    Returns:
+        str: The weak ETag, quoted.
+    """
+    return compute_etag(
+        f"{record.__tablename__}:{record.id}:{_timestamp(record.updated_at)}"
+        for record in records
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an ETag against an If-None-Match header value.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cache_control_for(request: Request) -> str:
+    """
+    Get the Cache-Control value configured for the matched route.
+
+    Args:
+        request (Request): The FastAPI request.
+
+    Returns:
+        str: The Cache-Control header value.
+    """
+    route = request.scope.get("route")
+    name = getattr(route, "name", None)
+    return settings.HTTP_CACHE_CONTROL.get(name, settings.HTTP_CACHE_CONTROL_DEFAULT)
+
+
+def not_modified_response(request: Request, etag: str) -> Response | None:
+    """
+    Build a 304 response if the client already has this version.
+
+    Args:
+        request (Request): The FastAPI request.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        Response | None: A 304 response, or None if the body must be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None or not _etag_matches(if_none_match, etag):
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control_for(request)},
+    )
+
+
+def with_cache_headers(response: Response, request: Request, etag: str) -> Response:
+    """
+    Add ETag and Cache-Control headers to a response.
+
+    Args:
+        response (Response): The response to decorate.
+        request (Request): The FastAPI request.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        Response: The same response.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control_for(request)
+    return response
@@ -0,0 +1,94 @@
+"""
+Helpers for HTTP conditional and range requests (RFC 9110, sections 13 and 14).
+"""
+
+RANGE_UNIT = "bytes"
+
+
+class RangeNotSatisfiableError(ValueError):
+    """
+    A syntactically valid Range header selects no byte of the representation.
+    """
+
+
+def parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range Range header against a representation of known size.
+
+    Only one range is supported. Multiple ranges, other units and malformed
+    headers are ignored, which the RFC allows: the full representation is
+    served instead.
+
+    Args:
+        header (str | None): The Range header value.
+        size (int): Length of the representation, in bytes.
+
+    Returns:
+        tuple[int, int] | None: First and last byte positions (inclusive),
+        clamped to the representation, or None to serve all of it.
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts past the end.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != RANGE_UNIT or "," in spec:
+        return None
+    first, separator, last = spec.strip().partition("-")
+    if not separator or not (first or last):
+        return None
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if first:
+        start = int(first)
+        end = int(last) if last else max(start, size - 1)
+        if end < start:
+            return None
+    else:
+        # Suffix range: the last N bytes
+        suffix_length = int(last)
+        if suffix_length == 0:
+            raise RangeNotSatisfiableError(header)
+        start = max(size - suffix_length, 0)
+        end = size - 1
+
+    if start >= size:
+        raise RangeNotSatisfiableError(header)
+    return start, min(end, size - 1)
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag (weak comparison).
+
+    Args:
+        header (str | None): The If-None-Match header value.
+        etag (str): The current entity tag, quoted.
+
+    Returns:
+        bool: True if the header is "*" or lists the tag.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def if_range_matches(header: str | None, etag: str) -> bool:
+    """
+    Check whether a Range header should be honoured given If-Range.
+
+    Only entity tags are compared (strongly); an If-Range date never matches,
+    so the client gets the full, current representation.
+
+    Args:
+        header (str | None): The If-Range header value.
+        etag (str): The current entity tag, quoted.
+
+    Returns:
+        bool: True if there is no If-Range or it names the current tag.
+    """
+    return header is None or header.strip() == etag
@@ -21,6 +21,17 @@ class ResponseSuccessDoc:
             200: {"model": SuccessResponse[response_type], "description": description}
         }
 
+    @staticmethod
+    def HTTP_200_NDJSON(description: str, item_type: type[BaseModel]) -> dict:
+        return {
+            200: {
+                "description": description,
+                "content": {
+                    "application/x-ndjson": {"schema": item_type.model_json_schema()}
+                },
+            }
+        }
+
     @staticmethod
     def HTTP_201_CREATED(description: str, response_type: type[BaseModel]) -> dict:
         return {
@@ -88,3 +99,9 @@ class ResponseErrorDoc:
     @staticmethod
     def HTTP_500_INTERNAL_SERVER_ERROR(description: str = "Internal Exception") -> dict:
         return {500: {"model": ErrorResponseWrapper, "description": description}}
+
+    @staticmethod
+    def HTTP_503_SERVICE_UNAVAILABLE(
+        description: str = "Service temporarily overloaded",
+    ) -> dict:
+        return {503: {"model": ErrorResponseWrapper, "description": description}}
@@ -28,6 +28,7 @@ class ErrorCodes(StrEnum):
     FORBIDDEN = "FORBIDDEN"
     DATABASE_ERROR = "DATABASE_ERROR"
     VALIDATION_ERROR = "VALIDATION_ERROR"
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
 
 
 class ErrorResponse(BaseResponse):
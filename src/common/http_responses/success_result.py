@@ -4,16 +4,38 @@ SuccessResult dataclass for wrapping successful API responses.
 
 import datetime
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, TypeVar, get_args
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
 from .success_response import SuccessCodes, SuccessResponse
 
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=256)
+def _response_serializer(
+    data_type: Any,
+) -> tuple[type[SuccessResponse], TypeAdapter]:
+    """
+    Get the cached SuccessResponse[data_type] model and its TypeAdapter.
+
+    Parametrizing the generic model and building its serializer is expensive,
+    so it is done once per data type rather than once per response.
+
+    Args:
+        data_type (Any): The type of the response data.
+
+    Returns:
+        tuple[type[SuccessResponse], TypeAdapter]: The model class and adapter.
+    """
+    response_type = SuccessResponse[data_type]
+    return response_type, TypeAdapter(response_type)
+
+
 @dataclass
 class SuccessResult(Generic[T]):
     """
@@ -28,8 +50,8 @@ class SuccessResult(Generic[T]):
     Methods:
         to_response_model(path: str) -> SuccessResponse[T]:
             Convert to a SuccessResponse model.
-        to_json_response(request: Request) -> JSONResponse:
-            Convert to a FastAPI JSONResponse.
+        to_json_response(request: Request) -> Response:
+            Serialize straight to JSON bytes in a FastAPI Response.
     """
 
     def __init__(
@@ -66,18 +88,40 @@ class SuccessResult(Generic[T]):
             path=path,
         )
 
-    def to_json_response(self, request: Request) -> JSONResponse:
+    def _data_type(self) -> Any:
+        """
+        The T this result was parametrized with, e.g. SuccessResult[PostPublic].
         """
-        Convert to a FastAPI JSONResponse.
+        orig_class = getattr(self, "__orig_class__", None)
+        args = get_args(orig_class) if orig_class is not None else ()
+        return args[0] if args else Any
+
+    def to_json_response(self, request: Request) -> Response:
+        """
+        Serialize to JSON bytes in a FastAPI Response.
+
+        The data is expected to be validated already (e.g. via
+        PostPublic.model_validate), so the envelope is built without
+        re-validation and encoded in one pass by pydantic-core, skipping the
+        intermediate dict and the stdlib json encoder.
 
         Args:
             request (Request): The FastAPI request.
 
         Returns:
-            JSONResponse: The JSON response.
+            Response: The JSON response.
         """
-        model = self.to_response_model(path=request.url.path)
-        return JSONResponse(
+        response_type, adapter = _response_serializer(self._data_type())
+        model = response_type.model_construct(
+            code=self.code,
+            message=self.message,
+            status=self.status_code,
+            data=self.data,
+            timestamp=datetime.datetime.now(datetime.timezone.utc),
+            path=request.url.path,
+        )
+        return Response(
+            content=adapter.dump_json(model),
             status_code=self.status_code,
-            content=model.model_dump(mode="json"),
+            media_type="application/json",
         )
@@ -0,0 +1,244 @@
+"""
+Minimal in-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms with labels, kept per worker process. Each
+worker serves its own numbers on /metrics, so scrape workers individually (or
+run a single worker per container) rather than through a load balancer.
+"""
+
+import bisect
+import math
+import threading
+from typing import Callable, Iterable, Sequence, TypeVar
+
+# Request latency buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[str, ...]
+M = TypeVar("M", bound="Metric")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """
+    Base class for a labelled metric family.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        labelnames (Sequence[str]): Label names, in the order values are given.
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def samples(self) -> Iterable[tuple[str, Labels, Labels, float]]:
+        """
+        Yield (suffix, extra label names, label values, value) for every series.
+        """
+        raise NotImplementedError
+
+    def render(self) -> Iterable[str]:
+        """
+        Yield the metric family in Prometheus text format.
+        """
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for suffix, extra_names, values, value in self.samples():
+            labels = _format_labels((*self.labelnames, *extra_names), values)
+            yield f"{self.name}{suffix}{labels} {_format_value(value)}"
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing count per label set.
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """
+        Increase the counter for a label set.
+
+        Args:
+            labels (Labels): Label values.
+            amount (float): Amount to add.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield "_total", (), labels, value
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down per label set.
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """
+        Increase the gauge for a label set.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        """
+        Decrease the gauge for a label set.
+        """
+        self.inc(labels, -amount)
+
+    def set(self, labels: Labels, value: float) -> None:
+        """
+        Set the gauge for a label set.
+        """
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield "", (), labels, value
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in fixed buckets per label set.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the buckets, ascending.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            labels (Labels): Label values.
+            value (float): The observed value.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(
+                labels, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def samples(self):
+        with self._lock:
+            items = [
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in self._values.items()
+            ]
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield "_bucket", ("le",), (*labels, _format_value(bound)), cumulative
+            yield "_sum", (), labels, total
+            yield "_count", (), labels, cumulative
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together on /metrics.
+
+    Collectors are callables run at scrape time, before rendering, to update
+    gauges whose values live elsewhere (e.g. connection pool state).
+    """
+
+    def __init__(self):
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: M) -> M:
+        """
+        Add a metric to the registry.
+
+        Args:
+            metric (M): The metric.
+
+        Returns:
+            M: The same metric, for assignment at module level.
+        """
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """
+        Add a scrape-time collector.
+
+        Args:
+            collector (Callable[[], None]): Updates metrics before rendering.
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        for collector in self._collectors:
+            collector()
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,156 @@
+"""
+Newline-delimited JSON (NDJSON) helpers for streaming request and response bodies.
+"""
+
+import zlib
+from typing import AsyncIterable, AsyncIterator
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from .exceptions.exceptions import InvalidRequestException
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Encoded lines are sent in chunks of about this size
+CHUNK_BYTES = 64 * 1024
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int
+) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    Split a byte stream into NDJSON lines as it arrives.
+
+    Only the current partial line is buffered, so arbitrarily large bodies are
+    processed in constant memory. Blank lines are skipped but still counted.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The body, e.g. request.stream().
+        max_line_bytes (int): Longest accepted line.
+
+    Yields:
+        tuple[int, bytes]: The 1-based line number and the line, without the
+        trailing newline.
+
+    Raises:
+        InvalidRequestException: If a line is longer than max_line_bytes.
+    """
+    buffer = bytearray()
+    line_number = 0
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line_number += 1
+            _check_length(line_number, end - start, max_line_bytes)
+            line = bytes(buffer[start:end]).strip()
+            start = end + 1
+            if line:
+                yield line_number, line
+        del buffer[:start]
+        # Fail fast on an unterminated line instead of buffering it whole
+        _check_length(line_number + 1, len(buffer), max_line_bytes)
+
+    if line := bytes(buffer).strip():
+        yield line_number + 1, line
+
+
+def _check_length(line_number: int, length: int, max_line_bytes: int) -> None:
+    if length > max_line_bytes:
+        raise InvalidRequestException(
+            message=f"NDJSON line {line_number} is longer than {max_line_bytes} bytes"
+        )
+
+
+async def encode_ndjson(
+    items: AsyncIterable[BaseModel], chunk_bytes: int = CHUNK_BYTES
+) -> AsyncIterator[bytes]:
+    """
+    Serialize models to NDJSON, coalescing lines into chunks of about chunk_bytes.
+
+    Args:
+        items (AsyncIterable[BaseModel]): The models to serialize.
+        chunk_bytes (int): Chunk size to aim for.
+
+    Yields:
+        bytes: Chunks of complete lines.
+    """
+    buffer = bytearray()
+    async for item in items:
+        buffer += item.__pydantic_serializer__.to_json(item)
+        buffer += b"\n"
+        if len(buffer) >= chunk_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes], level: int) -> AsyncIterator[bytes]:
+    """
+    Gzip a byte stream incrementally.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The uncompressed stream.
+        level (int): Compression level, 1 (fastest) to 9 (smallest).
+
+    Yields:
+        bytes: The gzip stream.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
+
+
+def accepts_gzip(request: Request) -> bool:
+    """
+    Check whether the client accepts a gzip-encoded response.
+
+    Args:
+        request (Request): The HTTP request.
+
+    Returns:
+        bool: True if Accept-Encoding lists gzip (or *) with a non-zero q.
+    """
+    qualities: dict[str, float] = {}
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        try:
+            quality = float(params.strip().lower().removeprefix("q=") or 1)
+        except ValueError:
+            quality = 0
+        qualities[name.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0)) > 0
+
+
+def ndjson_response(
+    request: Request,
+    items: AsyncIterable[BaseModel],
+    filename: str,
+    gzip_level: int,
+) -> StreamingResponse:
+    """
+    Stream models as an NDJSON attachment, gzipped if the client accepts it.
+
+    Args:
+        request (Request): The HTTP request, for content negotiation.
+        items (AsyncIterable[BaseModel]): The models to stream.
+        filename (str): Download file name.
+        gzip_level (int): Compression level when gzipping.
+
+    Returns:
+        StreamingResponse: The response.
+    """
+    body = encode_ndjson(items)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    if accepts_gzip(request):
+        body = gzip_chunks(body, gzip_level)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,76 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque, URL-safe strings encoding the sort key of the last item
+on a page. The next page is fetched with a row-value comparison against that
+key, so the cost of a page does not depend on how deep it is.
+"""
+
+import base64
+from functools import lru_cache
+from typing import Any, Generic, Sequence, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import to_json
+
+from .exceptions.exceptions import InvalidRequestException
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    A page of results from a keyset-paginated listing.
+
+    Attributes:
+        items (list[T]): The items on this page.
+        next_cursor (str | None): Cursor for the next page, None on the last page.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+@lru_cache
+def _key_adapter(key_type: Any) -> TypeAdapter:
+    """
+    Get a cached TypeAdapter for a cursor key type.
+    """
+    return TypeAdapter(key_type)
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """
+    Encode a sort key into an opaque cursor.
+
+    Args:
+        key (Sequence[Any]): The sort key values of the last item on a page.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    raw = to_json(list(key))
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, key_type: Any) -> tuple[Any, ...]:
+    """
+    Decode a cursor back into a typed sort key.
+
+    Args:
+        cursor (str): The cursor produced by encode_cursor.
+        key_type (Any): Tuple type describing the key, e.g. tuple[datetime, int].
+
+    Returns:
+        tuple[Any, ...]: The decoded sort key.
+
+    Raises:
+        InvalidRequestException: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return _key_adapter(key_type).validate_json(raw)
+    except (ValueError, ValidationError):
+        raise InvalidRequestException(
+            message="Invalid pagination cursor", detail={"cursor": cursor}
+        )
@@ -0,0 +1,210 @@
+"""
+Connection pool instrumentation: how long requests wait to get a connection.
+
+Pool exhaustion shows up as checkout latency long before Postgres itself is
+busy, so checkouts are timed at the pool and summarized per engine.
+"""
+
+import bisect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from .metrics import Counter, Gauge, Histogram, registry
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the checkout latency histogram buckets, in seconds
+CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+POOL_CHECKOUT_SECONDS = registry.register(
+    Histogram(
+        "db_pool_checkout_seconds",
+        "Time to check a connection out of the pool.",
+        ("engine",),
+        CHECKOUT_BUCKETS,
+    )
+)
+POOL_TIMEOUTS = registry.register(
+    Counter(
+        "db_pool_checkout_timeouts",
+        "Checkouts that timed out waiting for a connection.",
+        ("engine",),
+    )
+)
+POOL_PREPING_FAILURES = registry.register(
+    Counter(
+        "db_pool_preping_failures",
+        "Checkouts whose pre-ping found a dead connection.",
+        ("engine",),
+    )
+)
+POOL_CHECKED_OUT = registry.register(
+    Gauge("db_pool_checked_out", "Connections currently in use.", ("engine",))
+)
+POOL_OVERFLOW = registry.register(
+    Gauge(
+        "db_pool_overflow",
+        "Connections open beyond pool_size (negative until the pool is full).",
+        ("engine",),
+    )
+)
+POOL_SIZE = registry.register(
+    Gauge("db_pool_size", "Configured pool_size.", ("engine",))
+)
+
+
+@dataclass
+class PoolWaitStats:
+    """
+    Running totals of connection checkouts for one pool.
+
+    Attributes:
+        checkouts (int): Successful checkouts.
+        timeouts (int): Checkouts that gave up after the pool timeout.
+        slow_checkouts (int): Checkouts slower than DB_POOL_SLOW_CHECKOUT_MS.
+        total_wait_seconds (float): Time spent in all successful checkouts.
+        max_wait_seconds (float): Slowest successful checkout.
+        preping_failures (int): Checkouts whose pre-ping found a dead connection.
+        invalidations (int): Connections discarded after a disconnect.
+        bucket_counts (list[int]): Checkouts per CHECKOUT_BUCKETS bucket, the
+            last entry counting those slower than every bound.
+    """
+
+    checkouts: int = 0
+    timeouts: int = 0
+    slow_checkouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    preping_failures: int = 0
+    invalidations: int = 0
+    bucket_counts: list[int] = field(
+        default_factory=lambda: [0] * (len(CHECKOUT_BUCKETS) + 1)
+    )
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one successful checkout.
+
+        Args:
+            seconds (float): Time from asking the pool to holding a connection.
+        """
+        self.checkouts += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        self.bucket_counts[bisect.bisect_left(CHECKOUT_BUCKETS, seconds)] += 1
+        if seconds * 1000 >= settings.DB_POOL_SLOW_CHECKOUT_MS:
+            self.slow_checkouts += 1
+
+    def histogram(self) -> dict[str, int]:
+        """
+        Get the checkout latency histogram with cumulative counts.
+
+        Returns:
+            dict[str, int]: Checkouts at or under each bound, keyed by the
+            bound in seconds, plus "+Inf" for all checkouts.
+        """
+        bounds = (*map(str, CHECKOUT_BUCKETS), "+Inf")
+        cumulative, total = {}, 0
+        for bound, count in zip(bounds, self.bucket_counts):
+            total += count
+            cumulative[bound] = total
+        return cumulative
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get the totals, the mean checkout time and the latency histogram.
+
+        Returns:
+            dict[str, Any]: The stats as a plain dict.
+        """
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "slow_checkouts": self.slow_checkouts,
+            "total_wait_seconds": self.total_wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+            "mean_wait_seconds": (
+                self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+            ),
+            "preping_failures": self.preping_failures,
+            "invalidations": self.invalidations,
+            "checkout_latency_seconds": self.histogram(),
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times every checkout.
+
+    The time covers waiting for a free slot plus opening or pre-pinging the
+    connection, i.e. everything a request waits for before its first query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+        # Set from create_async_engine(pool_logging_name=...)
+        self.engine_name = self._orig_logging_name or "default"
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.wait_stats.timeouts += 1
+            POOL_TIMEOUTS.inc((self.engine_name,))
+            logger.warning(f"Connection pool exhausted: {self.status()}")
+            raise
+        elapsed = time.perf_counter() - start
+        self.wait_stats.observe(elapsed)
+        POOL_CHECKOUT_SECONDS.observe((self.engine_name,), elapsed)
+        return connection
+
+    def _invalidate(self, connection, exception=None, _checkin=True) -> None:
+        # Pre-ping failures surface here as DisconnectionError raised on checkout;
+        # disconnects found while running a statement carry the DBAPI error
+        self.wait_stats.invalidations += 1
+        if isinstance(exception, DisconnectionError):
+            self.wait_stats.preping_failures += 1
+            POOL_PREPING_FAILURES.inc((self.engine_name,))
+        super()._invalidate(connection, exception, _checkin)
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # engine.dispose() swaps in a new pool; keep the running totals
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats  # type: ignore[attr-defined]
+        return pool  # type: ignore[return-value]
+
+    def status_snapshot(self) -> dict[str, Any]:
+        """
+        Get the pool's configuration, current usage and checkout stats.
+
+        Returns:
+            dict[str, Any]: Size, in-use and overflow gauges plus wait stats.
+        """
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout_seconds": self.timeout(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            # Negative while the pool has not yet opened pool_size connections
+            "overflow": self.overflow(),
+            **self.wait_stats.snapshot(),
+        }
+
+    def refresh_gauges(self) -> None:
+        """
+        Copy the pool's current usage into the Prometheus gauges.
+        """
+        labels = (self.engine_name,)
+        POOL_CHECKED_OUT.set(labels, self.checkedout())
+        POOL_OVERFLOW.set(labels, self.overflow())
+        POOL_SIZE.set(labels, self.size())
@@ -0,0 +1,128 @@
+"""
+Per-request SQL query budgets and N+1 detection.
+
+Handlers declare how many statements they may issue with @query_budget(n).
+QueryBudgetMiddleware counts the statements of every request and:
+
+- in development, adds X-DB-Query-Count and Server-Timing headers with the
+  count and total database time, so the numbers show up in browser devtools;
+- logs a warning when a route exceeds its budget or repeats one statement
+  N_PLUS_ONE_THRESHOLD times or more (a loop issuing one query per item);
+- when QUERY_BUDGET_ENFORCE is set (or PYTHON_ENV is "test"), raises
+  QueryBudgetExceededError instead of only logging a budget overrun, so a
+  TestClient call on a route that regressed fails the test. The check runs
+  when the response starts, before anything is sent, so outside tests the
+  client gets a 500 rather than a 200 followed by a server error. Queries a
+  streaming body makes after that point can only be logged.
+"""
+
+import logging
+from typing import Callable, TypeVar
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .query_metrics import QueryStats, track_queries
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+QUERY_BUDGET_ATTRIBUTE = "__query_budget__"
+
+
+class QueryBudgetExceededError(AssertionError):
+    """
+    A route issued more statements than its declared budget.
+    """
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Decorator declaring the maximum number of statements a route may issue.
+
+    Apply it under @router.get(...) and above @authorize(...), or anywhere the
+    attribute survives functools.wraps.
+
+    Args:
+        max_queries (int): The statement budget for one request.
+
+    Returns:
+        Callable[[F], F]: The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        setattr(func, QUERY_BUDGET_ATTRIBUTE, max_queries)
+        return func
+
+    return decorator
+
+
+class QueryBudgetMiddleware:
+    """
+    ASGI middleware enforcing query budgets and reporting per-request query counts.
+
+    Args:
+        app (ASGIApp): The wrapped application.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.debug_headers = settings.PYTHON_ENV == "development"
+        self.enforce = settings.QUERY_BUDGET_ENFORCE or settings.PYTHON_ENV == "test"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            checked_count: int | None = None
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal checked_count
+                if message["type"] == "http.response.start":
+                    # Nothing is sent yet, so an enforced overrun becomes a 500
+                    checked_count = stats.count
+                    self._check_budget(scope, stats, enforce=self.enforce)
+                    if self.debug_headers:
+                        duration_ms = stats.seconds * 1000
+                        headers = MutableHeaders(scope=message)
+                        headers["X-DB-Query-Count"] = str(stats.count)
+                        headers.append(
+                            "Server-Timing",
+                            f'db;dur={duration_ms:.2f};desc="{stats.count} queries"',
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+            self._check_repeats(scope, stats)
+            if checked_count is None or stats.count > checked_count:
+                # Statements issued while streaming the body: too late to fail
+                self._check_budget(scope, stats, enforce=False)
+
+    def _check_repeats(self, scope: Scope, stats: QueryStats) -> None:
+        for statement, count in stats.repeated(settings.N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                f"Possible N+1 on {scope['method']} {_route_path(scope)}: statement "
+                f"executed {count} times: {' '.join(statement.split())[:200]}"
+            )
+
+    def _check_budget(self, scope: Scope, stats: QueryStats, enforce: bool) -> None:
+        endpoint = getattr(scope.get("route"), "endpoint", None)
+        budget = getattr(endpoint, QUERY_BUDGET_ATTRIBUTE, None)
+        if budget is None or stats.count <= budget:
+            return
+
+        message = (
+            f"{scope['method']} {_route_path(scope)} issued {stats.count} queries, "
+            f"budget is {budget}"
+        )
+        if enforce:
+            raise QueryBudgetExceededError(message)
+        logger.warning(message)
+
+
+def _route_path(scope: Scope) -> str:
+    return getattr(scope.get("route"), "path", scope["path"])
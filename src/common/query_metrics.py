@@ -0,0 +1,125 @@
+"""
+Database query metrics, in total per engine and per HTTP request.
+
+SQLAlchemy cursor events time every statement. Totals go to the metrics
+registry; the request being served (tracked in a context variable by the
+metrics middleware) also gets its own count and time, since the greenlets
+SQLAlchemy runs statements in inherit the caller's context.
+"""
+
+import time
+from collections import Counter as StatementCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .metrics import Counter, Histogram, registry
+
+# Upper bounds of the query duration buckets, in seconds
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+DB_QUERIES = registry.register(
+    Counter("db_queries", "Statements executed.", ("engine",))
+)
+DB_QUERY_SECONDS = registry.register(
+    Histogram(
+        "db_query_duration_seconds",
+        "Statement execution time.",
+        ("engine",),
+        QUERY_BUCKETS,
+    )
+)
+
+
+@dataclass
+class QueryStats:
+    """
+    Statements executed while serving one request.
+
+    Attributes:
+        count (int): Number of statements.
+        seconds (float): Total execution time.
+        statements (Counter[str]): Executions per SQL text. Parameters are
+            bound separately, so a statement repeated with different values
+            (the N+1 pattern) counts under one key.
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+    statements: StatementCounter[str] = field(default_factory=StatementCounter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Get statements executed at least threshold times.
+
+        Args:
+            threshold (int): Minimum number of executions.
+
+        Returns:
+            list[tuple[str, int]]: The statements and their counts, most frequent first.
+        """
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect the statements executed in this context.
+
+    Nested uses share the outermost QueryStats, so several middlewares can
+    read the same request's numbers.
+
+    Yields:
+        QueryStats: The stats for the current request.
+    """
+    stats = current_query_stats.get()
+    if stats is not None:
+        yield stats
+        return
+
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """
+    Time every statement an engine executes.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+        name (str): Value of the engine label.
+    """
+    labels = (name,)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started_at
+        DB_QUERIES.inc(labels)
+        DB_QUERY_SECONDS.observe(labels, elapsed)
+
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+            stats.statements[statement] += 1
@@ -0,0 +1,62 @@
+"""
+Routing of read-only requests between the primary and the read replicas.
+
+Replicas lag behind the primary, so a client that has just written would not
+see its own change if its next read went to a replica. After a successful
+write the client gets a short-lived cookie, and reads carrying it (or the
+X-Read-Consistency: primary header, for non-browser clients) go to the primary.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .settings import settings
+
+READ_PRIMARY_COOKIE = "read_primary"
+READ_CONSISTENCY_HEADER = "x-read-consistency"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def reads_from_primary(connection: HTTPConnection) -> bool:
+    """
+    Whether a request must read from the primary to see its client's writes.
+
+    Args:
+        connection (HTTPConnection): The incoming request.
+
+    Returns:
+        bool: True if the request asked for primary reads or wrote recently.
+    """
+    return (
+        connection.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary"
+        or READ_PRIMARY_COOKIE in connection.cookies
+    )
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware marking clients that just wrote, so they read from the primary.
+
+    Successful responses to unsafe methods set a cookie that expires after
+    READ_YOUR_WRITES_SECONDS, which should exceed the usual replica lag.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.cookie = (
+            f"{READ_PRIMARY_COOKIE}=1; Max-Age={settings.READ_YOUR_WRITES_SECONDS}; "
+            "Path=/; HttpOnly; SameSite=lax"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("set-cookie", self.cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,98 @@
+"""
+HTTP request metrics middleware.
+
+Records, per method and route template (e.g. /post/{post_id}), the request
+count by status, latency, requests in flight, and the number and total time
+of database statements each request executed.
+"""
+
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import Counter, Gauge, Histogram, registry
+from .query_metrics import track_queries
+
+# Requests that match no route share one label to keep cardinality bounded
+UNMATCHED_ROUTE = "<unmatched>"
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+HTTP_REQUESTS = registry.register(
+    Counter("http_requests", "Requests served.", ("method", "route", "status"))
+)
+HTTP_REQUEST_SECONDS = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time to serve a request, until the last body chunk is sent.",
+        ("method", "route"),
+    )
+)
+HTTP_IN_PROGRESS = registry.register(
+    Gauge("http_requests_in_progress", "Requests being served.", ("method", "route"))
+)
+HTTP_REQUEST_DB_QUERIES = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "Database statements executed per request.",
+        ("method", "route"),
+        QUERY_COUNT_BUCKETS,
+    )
+)
+HTTP_REQUEST_DB_SECONDS = registry.register(
+    Histogram(
+        "http_request_db_duration_seconds",
+        "Time spent executing database statements per request.",
+        ("method", "route"),
+    )
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request and per-request database metrics.
+
+    Args:
+        app (ASGIApp): The wrapped application.
+        excluded_paths (frozenset[str]): Paths not recorded, e.g. /metrics.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: frozenset[str] = frozenset()):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    def _route_template(self, scope: Scope) -> str:
+        # Routing happens inside the app; match up front so the in-flight
+        # gauge can carry the route label too
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path", UNMATCHED_ROUTE)
+        return UNMATCHED_ROUTE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        labels = (scope["method"], self._route_template(scope))
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc(labels)
+        start = time.perf_counter()
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                HTTP_REQUEST_SECONDS.observe(labels, time.perf_counter() - start)
+                HTTP_IN_PROGRESS.dec(labels)
+                HTTP_REQUESTS.inc((*labels, str(status_code)))
+                HTTP_REQUEST_DB_QUERIES.observe(labels, stats.count)
+                HTTP_REQUEST_DB_SECONDS.observe(labels, stats.seconds)
@@ -20,15 +20,66 @@ class Settings(BaseSettings):
         POSTGRES_DB (str): PostgreSQL database name.
         POSTGRES_USER (str): PostgreSQL user.
         POSTGRES_PASSWORD (str): PostgreSQL password.
+        POSTGRES_REPLICA_HOST (str | None): Read replica host; reads use the primary if unset.
+        POSTGRES_REPLICA_PORT (int | None): Read replica port, defaults to POSTGRES_PORT.
+        READ_YOUR_WRITES_SECONDS (int): How long a client reads from the primary after a write.
+        DB_POOL_SIZE (int): Connections kept open per engine in each worker.
+        DB_POOL_MAX_OVERFLOW (int): Extra connections per engine in each worker under load.
+        DB_POOL_TIMEOUT_SECONDS (float): Wait for a free connection before failing.
+        DB_POOL_RECYCLE_SECONDS (int): Reopen connections older than this.
+        DB_POOL_PRE_PING (bool): Test connections on checkout.
+        DB_ECHO_POOL (bool): Log pool checkouts and checkins.
+        DB_CONNECTION_BUDGET (int | None): Connections all workers may open per
+            database; caps each worker's pool at its share when set.
+        WEB_CONCURRENCY (int): Number of worker processes sharing the budget.
+        DB_POOL_SLOW_CHECKOUT_MS (float): Checkouts slower than this are counted as slow.
         SECRET_KEY (str): Secret key for JWT.
         ALGORITHM (str): JWT algorithm.
         ACCESS_TOKEN_EXPIRE_MINUTES (int): JWT token expiry.
+        AUTH_USER_CACHE_TTL_SECONDS (int): Lifetime of a cached authenticated user.
+        AUTH_USER_CACHE_MAX_SIZE (int): Maximum number of cached authenticated users.
+        PASSWORD_HASH_WORKERS (int): Processes dedicated to bcrypt hashing.
+        PASSWORD_HASH_MAX_QUEUE (int): Hashing tasks allowed to wait before 503.
         MINIO_SECURE (bool): Use HTTPS for MinIO.
         MINIO_ENDPOINT (str): MinIO endpoint.
         MINIO_PORT (int): MinIO port.
         MINIO_ACCESS_KEY (str): MinIO access key.
         MINIO_SECRET_KEY (str): MinIO secret key.
         MINIO_BUCKET_NAMES (list[str]): List of MinIO bucket names.
+        MINIO_REGION (str): Region used for signing; set so presigning needs
+            no bucket-location request.
+        STORAGE_WORKERS (int): Threads dedicated to blocking MinIO calls.
+        STORAGE_MAX_QUEUE (int): MinIO calls allowed to wait before 503.
+        STORAGE_TIMEOUT_SECONDS (float): Connect and read timeout for MinIO.
+        DOWNLOAD_URL_BATCH_MAX (int): Objects per batch download URL request.
+        DOWNLOAD_URL_CACHE_WINDOW_SECONDS (int): Download URLs are signed as of
+            the start of a window this long and reused within it (0 disables).
+        DOWNLOAD_URL_CACHE_MAX_ENTRIES (int): Cached download URLs per worker.
+        FILE_PROXY_ENABLED (bool): Serve objects through GET /file/{bucket}/{object}.
+        FILE_PROXY_CHUNK_BYTES (int): Bytes read from storage per proxied chunk.
+        FILE_PROXY_MAX_STREAMS (int): Concurrent proxied downloads per worker;
+            more are rejected with 503.
+        FILE_PROXY_MAX_AGE_SECONDS (int): Cache-Control max-age of proxied objects.
+        PAGE_SIZE_DEFAULT (int): Default page size for paginated listings.
+        PAGE_SIZE_MAX (int): Maximum page size for paginated listings.
+        COMMENT_TREE_DEPTH_DEFAULT (int): Reply levels loaded by default in comment trees.
+        COMMENT_TREE_DEPTH_MAX (int): Maximum reply levels a client may request.
+        COMMENT_COUNT_CACHE_TTL_SECONDS (int): Lifetime of cached comment counts.
+        CACHE_MAX_ENTRIES (int): Maximum entries in the in-memory cache backend.
+        TAXONOMY_CACHE_TTL_SECONDS (int): Lifetime of cached category/tag lists.
+        VIEW_COUNT_FLUSH_INTERVAL_SECONDS (float): Time between view count flushes.
+        POST_IMPORT_BATCH_SIZE (int): Posts validated and copied per batch.
+        POST_IMPORT_MAX_ERRORS (int): Rejected lines listed in an import report.
+        POST_IMPORT_MAX_LINE_BYTES (int): Longest accepted NDJSON import line.
+        EXPORT_BATCH_SIZE (int): Rows fetched per round trip by NDJSON exports.
+        EXPORT_GZIP_LEVEL (int): Compression level of gzipped exports.
+        METRICS_ENABLED (bool): Record request metrics for /metrics.
+        QUERY_BUDGET_ENFORCE (bool): Raise when a route exceeds its query budget
+            (always on when PYTHON_ENV is "test").
+        N_PLUS_ONE_THRESHOLD (int): Repeats of one statement in a request that
+            are logged as a possible N+1.
+        HTTP_CACHE_CONTROL_DEFAULT (str): Cache-Control for cacheable routes.
+        HTTP_CACHE_CONTROL (dict[str, str]): Cache-Control overrides by route name.
     """
 
     app_name: str = "Blog"
@@ -43,10 +94,26 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = Field(min_length=1)
     POSTGRES_USER: str = Field(min_length=1)
     POSTGRES_PASSWORD: str = Field(min_length=1)
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = Field(default=None, gt=1, lt=65536)
+    READ_YOUR_WRITES_SECONDS: int = Field(default=5, ge=1)
+    DB_POOL_SIZE: int = Field(default=20, ge=1)
+    DB_POOL_MAX_OVERFLOW: int = Field(default=20, ge=0)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(default=30, gt=0)
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=3600, ge=-1)
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO_POOL: bool = False
+    DB_CONNECTION_BUDGET: int | None = Field(default=None, ge=1)
+    WEB_CONCURRENCY: int = Field(default=1, ge=1)
+    DB_POOL_SLOW_CHECKOUT_MS: float = Field(default=50, gt=0)
 
     SECRET_KEY: str = Field(min_length=12)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(ge=10)
+    AUTH_USER_CACHE_TTL_SECONDS: int = Field(default=30, ge=0)
+    AUTH_USER_CACHE_MAX_SIZE: int = Field(default=1024, ge=1)
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1)
+    PASSWORD_HASH_MAX_QUEUE: int = Field(default=32, ge=0)
 
     MINIO_SECURE: bool = Field(default=False)
     MINIO_ENDPOINT: str = Field(min_length=1)
@@ -54,6 +121,45 @@ class Settings(BaseSettings):
     MINIO_ACCESS_KEY: str = Field(min_length=1)
     MINIO_SECRET_KEY: str = Field(min_length=1)
     MINIO_BUCKET_NAMES: list[str] = ["images", "files"]
+    MINIO_REGION: str = "us-east-1"
+    STORAGE_WORKERS: int = Field(default=8, ge=1)
+    STORAGE_MAX_QUEUE: int = Field(default=64, ge=0)
+    STORAGE_TIMEOUT_SECONDS: float = Field(default=10, gt=0)
+    DOWNLOAD_URL_BATCH_MAX: int = Field(default=100, ge=1)
+    DOWNLOAD_URL_CACHE_WINDOW_SECONDS: int = Field(default=300, ge=0)
+    DOWNLOAD_URL_CACHE_MAX_ENTRIES: int = Field(default=10_000, ge=1)
+    FILE_PROXY_ENABLED: bool = False
+    FILE_PROXY_CHUNK_BYTES: int = Field(default=256 * 1024, ge=1024)
+    FILE_PROXY_MAX_STREAMS: int = Field(default=32, ge=1)
+    FILE_PROXY_MAX_AGE_SECONDS: int = Field(default=365 * 24 * 3600, ge=0)
+
+    PAGE_SIZE_DEFAULT: int = Field(default=20, ge=1)
+    PAGE_SIZE_MAX: int = Field(default=100, ge=1)
+
+    COMMENT_TREE_DEPTH_DEFAULT: int = Field(default=3, ge=0)
+    COMMENT_TREE_DEPTH_MAX: int = Field(default=10, ge=0)
+    COMMENT_COUNT_CACHE_TTL_SECONDS: int = Field(default=60, ge=0)
+
+    CACHE_MAX_ENTRIES: int = Field(default=1024, ge=1)
+    TAXONOMY_CACHE_TTL_SECONDS: int = Field(default=300, ge=0)
+
+    VIEW_COUNT_FLUSH_INTERVAL_SECONDS: float = Field(default=10, gt=0)
+
+    POST_IMPORT_BATCH_SIZE: int = Field(default=1000, ge=1)
+    POST_IMPORT_MAX_ERRORS: int = Field(default=1000, ge=0)
+    POST_IMPORT_MAX_LINE_BYTES: int = Field(default=1_048_576, ge=1)
+    EXPORT_BATCH_SIZE: int = Field(default=1000, ge=1)
+    EXPORT_GZIP_LEVEL: int = Field(default=6, ge=1, le=9)
+
+    METRICS_ENABLED: bool = True
+    QUERY_BUDGET_ENFORCE: bool = False
+    N_PLUS_ONE_THRESHOLD: int = Field(default=5, ge=2)
+
+    HTTP_CACHE_CONTROL_DEFAULT: str = "public, no-cache"
+    HTTP_CACHE_CONTROL: dict[str, str] = {
+        "list_categories": "public, max-age=60, stale-while-revalidate=300",
+        "list_tags": "public, max-age=60, stale-while-revalidate=300",
+    }
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -0,0 +1,86 @@
+"""
+Bounded in-process cache with per-entry time-to-live.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Args:
+        max_size (int): Maximum number of entries; the least recently used
+            entry is evicted when full.
+        ttl_seconds (float): Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a live entry.
+
+        Args:
+            key (K): The cache key.
+
+        Returns:
+            V | None: The cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """
+        Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key (K): The cache key.
+            value (V): The value to cache.
+            ttl_seconds (float | None): Lifetime of this entry; defaults to the
+                cache's TTL.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key (K): The cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
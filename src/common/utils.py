@@ -3,6 +3,7 @@ Utility classes and helpers for the application.
 """
 
 import threading
+from datetime import datetime, timezone
 
 
 class Singleton:
@@ -37,3 +38,21 @@ class Singleton:
                 if cls._instance is None:
                     cls._instance = super(Singleton, cls).__new__(cls)
         return cls._instance
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime for comparison with timestamp-without-time-zone columns.
+
+    Aware datetimes are converted to UTC and stripped of their tzinfo; naive
+    ones are assumed to be UTC already and returned unchanged.
+
+    Args:
+        value (datetime): The datetime.
+
+    Returns:
+        datetime: A naive datetime in UTC.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,194 @@
+"""
+Versioned read-through cache on top of a pluggable key-value backend.
+
+Each namespace has a version counter. Values are stored under keys that embed
+the current version, so invalidating a namespace is a single counter bump:
+readers immediately miss and old entries simply age out. The backend interface
+is small enough to be served by a shared store (e.g. Redis) in multi-worker
+deployments; InMemoryCacheBackend is the process-local stand-in.
+"""
+
+import itertools
+import math
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from pydantic_core import from_json, to_json
+
+from .generic_model import GenericModel
+from .settings import settings
+from .ttl_cache import TTLCache
+
+T = TypeVar("T")
+M = TypeVar("M", bound=GenericModel)
+
+
+class CacheBackend(ABC):
+    """
+    Key-value store used by VersionedCache.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """
+        Get a value, or None if missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Store a value with a time-to-live.
+        """
+
+    @abstractmethod
+    async def get_version(self, key: str) -> int:
+        """
+        Get a version counter.
+
+        A backend that may drop counters must not hand out a number that values
+        could still be stored under once a counter is gone.
+        """
+
+    @abstractmethod
+    async def incr_version(self, key: str) -> int:
+        """
+        Atomically move a version counter to a new value and return it.
+        """
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Process-local CacheBackend. Each worker process has its own copy.
+
+    Version counters are bounded like the values (LRU), since namespaces can
+    be per entity. Versions come from one process-wide sequence, so a counter
+    that was evicted restarts at a number no value was ever stored under.
+
+    Args:
+        max_entries (int): Maximum number of cached values, and separately of
+            version counters (LRU eviction).
+    """
+
+    def __init__(self, max_entries: int):
+        self._values: TTLCache[str, bytes] = TTLCache(max_entries, ttl_seconds=0)
+        self._versions: TTLCache[str, int] = TTLCache(max_entries, ttl_seconds=math.inf)
+        self._next_version = itertools.count(1)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._values.set(key, value, ttl_seconds=ttl_seconds)
+
+    async def get_version(self, key: str) -> int:
+        version = self._versions.get(key)
+        if version is None:
+            version = await self.incr_version(key)
+        return version
+
+    async def incr_version(self, key: str) -> int:
+        # No await between read and write, so this is atomic on the event loop
+        version = next(self._next_version)
+        self._versions.set(key, version)
+        return version
+
+
+@lru_cache
+def get_cache_backend() -> CacheBackend:
+    """
+    Get the application's cache backend.
+
+    Returns:
+        CacheBackend: The shared backend instance.
+    """
+    return InMemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+class VersionedCache(Generic[T]):
+    """
+    Read-through cache for one namespace, invalidated by bumping its version.
+
+    Args:
+        backend (CacheBackend): Where values and the version counter live.
+        namespace (str): Prefix for this cache's keys.
+        ttl_seconds (float): Lifetime of cached values; also bounds staleness
+            if an invalidation is missed. Writers invalidate through
+            common.db.after_commit, so readers cannot re-cache the old rows
+            under the new version.
+        dump (Callable[[T], bytes]): Serializes a value for the backend.
+        load (Callable[[bytes], T]): Deserializes a value from the backend.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        ttl_seconds: float,
+        dump: Callable[[T], bytes],
+        load: Callable[[bytes], T],
+    ):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._dump = dump
+        self._load = load
+
+    @property
+    def _version_key(self) -> str:
+        return f"{self.namespace}:version"
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Get a cached value, loading and storing it on a miss.
+
+        Args:
+            key (str): Key within the namespace.
+            loader (Callable[[], Awaitable[T]]): Produces the value on a miss.
+
+        Returns:
+            T: The cached or freshly loaded value.
+        """
+        if self.ttl_seconds <= 0:
+            return await loader()
+
+        version = await self.backend.get_version(self._version_key)
+        versioned_key = f"{self.namespace}:v{version}:{key}"
+
+        raw = await self.backend.get(versioned_key)
+        if raw is not None:
+            return self._load(raw)
+
+        value = await loader()
+        await self.backend.set(versioned_key, self._dump(value), self.ttl_seconds)
+        return value
+
+    async def invalidate(self) -> None:
+        """
+        Invalidate every entry in the namespace.
+        """
+        await self.backend.incr_version(self._version_key)
+
+
+def model_list_codec(
+    model: type[M],
+) -> tuple[Callable[[list[M]], bytes], Callable[[bytes], list[M]]]:
+    """
+    Build dump/load functions caching a list of table models as JSON.
+
+    Loaded instances are transient copies, not attached to any session.
+
+    Args:
+        model (type[M]): The SQLModel table class.
+
+    Returns:
+        tuple[Callable[[list[M]], bytes], Callable[[bytes], list[M]]]: dump and load.
+    """
+
+    def dump(records: list[M]) -> bytes:
+        return to_json([record.model_dump() for record in records])
+
+    def load(raw: bytes) -> list[M]:
+        return [model.model_validate(data) for data in from_json(raw)]
+
+    return dump, load
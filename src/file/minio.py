@@ -1,16 +1,25 @@
 """
 MinioService: Service for interacting with MinIO storage.
 Provides methods for bucket management, presigned URL generation, file deletion, notifications, and health checks.
+
+The minio client is synchronous. Calls that reach the server run on a
+dedicated, bounded thread pool so they neither take tokens from the shared
+anyio limiter nor queue without limit when storage is slow. Presigned URLs
+and POST policies are signed in-process by S3Presigner, inline on the event
+loop.
 """
 
 import logging
+import os
 import threading
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from functools import lru_cache, wraps
 from typing import Any, Dict, List
 
+import certifi
+import urllib3
 from minio import Minio
-from minio.datatypes import PostPolicy
 from minio.deleteobjects import DeleteObject
 from minio.error import InvalidResponseError, S3Error
 from minio.notificationconfig import (
@@ -19,14 +28,86 @@ from minio.notificationconfig import (
     QueueConfig,
     SuffixFilterRule,
 )
+from urllib3 import BaseHTTPResponse
 
-from ..common.exceptions.exceptions import EntityNotFoundException, InternalException
-from ..common.handle_sync import _handle_sync
+from ..common.bounded_executor import BoundedExecutor
+from ..common.exceptions.exceptions import (
+    AppBaseException,
+    EntityNotFoundException,
+    InternalException,
+)
+from ..common.handle_sync import SyncPolicy, _handle_sync
 from ..common.settings import settings
+from .signer import S3Presigner
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_storage_executor: BoundedExecutor | None = None
+
+
+def get_storage_executor() -> BoundedExecutor:
+    """
+    Get the executor for blocking MinIO calls, creating it on first use.
+
+    Returns:
+        BoundedExecutor: The bounded thread pool for storage I/O.
+    """
+    global _storage_executor
+    if _storage_executor is None:
+        _storage_executor = BoundedExecutor(
+            ThreadPoolExecutor(
+                max_workers=settings.STORAGE_WORKERS, thread_name_prefix="storage"
+            ),
+            max_pending=settings.STORAGE_WORKERS + settings.STORAGE_MAX_QUEUE,
+            name="storage",
+        )
+    return _storage_executor
+
+
+def shutdown_storage_executor() -> None:
+    """
+    Shut down the storage executor, if it was started.
+    """
+    global _storage_executor
+    if _storage_executor is not None:
+        _storage_executor.shutdown(wait=True, cancel_futures=True)
+        _storage_executor = None
+
+
+_stream_executor: ThreadPoolExecutor | None = None
+
+
+def get_stream_executor() -> ThreadPoolExecutor:
+    """
+    Get the executor for proxied object downloads, creating it on first use.
+
+    Downloads take one of FILE_PROXY_MAX_STREAMS slots before they start and
+    have at most one call in flight, so a thread per slot means calls never
+    queue. Unlike the storage executor it never rejects: a rejected chunk
+    read would truncate a response whose headers are already sent.
+
+    Returns:
+        ThreadPoolExecutor: The thread pool for object downloads.
+    """
+    global _stream_executor
+    if _stream_executor is None:
+        _stream_executor = ThreadPoolExecutor(
+            max_workers=settings.FILE_PROXY_MAX_STREAMS,
+            thread_name_prefix="storage-stream",
+        )
+    return _stream_executor
+
+
+def shutdown_stream_executor() -> None:
+    """
+    Shut down the object download executor, if it was started.
+    """
+    global _stream_executor
+    if _stream_executor is not None:
+        _stream_executor.shutdown(wait=True, cancel_futures=True)
+        _stream_executor = None
+
 
 class MinioServiceError(Exception):
     """Custom exception for MinIO service errors."""
@@ -72,7 +153,7 @@ class MinioService:
             secure (bool | None): Use HTTPS if True, HTTP if False.
 
         Raises:
-            MinioServiceError: If credentials are missing or connection fails.
+            MinioServiceError: If credentials are missing.
         """
 
         print("MINIO SERVICE CREATION")
@@ -91,26 +172,41 @@ class MinioService:
         if not self.access_key or not self.secret_key:
             raise MinioServiceError("MinIO access key and secret key must be provided")
 
-        try:
-            # Initialize MinIO client
-            self.client = Minio(
-                endpoint=self.endpoint,
-                access_key=self.access_key,
-                secret_key=self.secret_key,
-                secure=self.secure,
-            )
-
-            # Test connection
-            self.client.list_buckets()
-            logger.info(f"Successfully connected to MinIO at {self.endpoint}")
-
-        except Exception as e:
-            logger.error(f"Failed to initialize MinIO client: {str(e)}")
-            raise MinioServiceError(f"Failed to connect to MinIO: {str(e)}")
-
-        # Ensure all buckets exist at startup
-        if self.bucket_names:
-            self.ensure_buckets_exist(self.bucket_names)
+        # No network I/O here: connectivity and buckets are checked by
+        # initialize_storage() at application startup
+        proxy_streams = (
+            settings.FILE_PROXY_MAX_STREAMS if settings.FILE_PROXY_ENABLED else 0
+        )
+        timeout = urllib3.Timeout(
+            connect=settings.STORAGE_TIMEOUT_SECONDS,
+            read=settings.STORAGE_TIMEOUT_SECONDS,
+        )
+        self.client = Minio(
+            endpoint=self.endpoint,
+            access_key=self.access_key,
+            secret_key=self.secret_key,
+            secure=self.secure,
+            region=settings.MINIO_REGION,
+            # One pooled connection per storage thread and proxied download,
+            # and request timeouts
+            # bounded well below the client's 5 minute default
+            http_client=urllib3.PoolManager(
+                timeout=timeout,
+                maxsize=settings.STORAGE_WORKERS + proxy_streams,
+                cert_reqs="CERT_REQUIRED",
+                ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+                retries=urllib3.Retry(
+                    total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+                ),
+            ),
+        )
+        self.presigner = S3Presigner(
+            endpoint=self.endpoint,
+            access_key=self.access_key,
+            secret_key=self.secret_key,
+            region=settings.MINIO_REGION,
+            secure=self.secure,
+        )
 
         self._initialized = True
 
@@ -122,6 +218,9 @@ class MinioService:
         def wrapper(self, *args, **kwargs):
             try:
                 return func(self, *args, **kwargs)
+            except AppBaseException:
+                # Already mapped to an HTTP error (e.g. not found)
+                raise
             except S3Error as e:
                 logger.error(f"MinIO S3 error in {func.__name__}: {e}")
                 raise InternalException(message=f"Storage error: {e}")
@@ -134,6 +233,26 @@ class MinioService:
 
         return wrapper
 
+    @_handle_sync(executor=get_storage_executor)
+    def initialize_storage(self) -> None:
+        """
+        Check that MinIO is reachable and create any missing buckets.
+
+        Called once from the application lifespan, before requests are served.
+
+        Raises:
+            MinioServiceError: If MinIO cannot be reached.
+        """
+        try:
+            self.client.list_buckets()
+            logger.info(f"Successfully connected to MinIO at {self.endpoint}")
+        except Exception as e:
+            logger.error(f"Failed to connect to MinIO: {str(e)}")
+            raise MinioServiceError(f"Failed to connect to MinIO: {str(e)}")
+
+        if self.bucket_names:
+            self.ensure_buckets_exist(self.bucket_names)
+
     @_handle_minio_errors
     def ensure_buckets_exist(self, bucket_names: List[str]) -> Dict[str, bool]:
         """
@@ -186,7 +305,7 @@ class MinioService:
             return False
         return bucket_name.replace("-", "").replace(".", "").isalnum()
 
-    @_handle_sync
+    @_handle_sync(policy=SyncPolicy.INLINE)
     @_handle_minio_errors
     def create_presigned_upload_url(
         self,
@@ -210,22 +329,13 @@ class MinioService:
         Raises:
             InternalException: If URL creation fails.
         """
-        # Convert to datetime by adding to current time
-        expiration_time = datetime.now(timezone.utc) + expires
-
-        # Create PostPolicy object
-        policy = PostPolicy(bucket_name, expiration_time)
-        policy.add_equals_condition("key", object_name)
-        policy.add_content_length_range_condition(1, max_file_size)
-
-        # if allowed_content_types:
-        #     for content_type in allowed_content_types:
-        #         policy.add_starts_with_condition(
-        #             "content-type", content_type.split("/")[0]
-        #         )
-
         try:
-            presigned_post = self.client.presigned_post_policy(policy)
+            presigned_post = self.presigner.presign_post_policy(
+                bucket_name,
+                object_name,
+                expires=expires,
+                content_length_range=(1, max_file_size),
+            )
 
             logger.info(f"Created presigned upload URL for {bucket_name}/{object_name}")
 
@@ -238,13 +348,14 @@ class MinioService:
             logger.error(f"Failed to create presigned upload URL: {e}")
             raise InternalException(message="Failed to create upload URL")
 
-    @_handle_sync
+    @_handle_sync(policy=SyncPolicy.INLINE)
     @_handle_minio_errors
     def create_presigned_download_url(
         self,
         bucket_name: str,
         object_name: str,
         expires: timedelta = timedelta(hours=1),
+        request_date: datetime | None = None,
     ) -> Dict[str, Any]:
         """
         Create a presigned URL for file download.
@@ -252,43 +363,34 @@ class MinioService:
         Args:
             bucket_name (str): Name of the bucket.
             object_name (str): Name of the object to download.
-            expires (timedelta): URL expiration time.
+            expires (timedelta): URL expiration time, counted from request_date.
+            request_date (datetime | None): Signing time; defaults to now.
 
         Returns:
             Dict[str, Any]: Presigned download URL and metadata.
 
         Raises:
-            EntityNotFoundException: If the object does not exist.
+            EntityNotFoundException: If the bucket is not a configured bucket.
         """
-        # Bucket existence is ensured at startup; no per-operation check needed
+        # Signed locally without a stat round trip: fetching a missing object
+        # with the URL returns 404 from storage
+        if bucket_name not in self.bucket_names:
+            raise EntityNotFoundException(resource="Bucket", resource_id=bucket_name)
 
-        try:
-            # Check if object exists
-            self.client.stat_object(bucket_name, object_name)
+        presigned_url = self.presigner.presign_url(
+            "GET", bucket_name, object_name, expires=expires, now=request_date
+        )
 
-            presigned_url = self.client.presigned_get_object(
-                bucket_name=bucket_name, object_name=object_name, expires=expires
-            )
-
-            logger.info(
-                f"Created presigned download URL for {bucket_name}/{object_name}"
-            )
-
-            return {
-                "url": presigned_url,
-                "expires_in_seconds": int(expires.total_seconds()),
-                "object_name": object_name,
-                "bucket_name": bucket_name,
-            }
+        logger.debug(f"Created presigned download URL for {bucket_name}/{object_name}")
 
-        except S3Error as e:
-            if e.code == "NoSuchKey":
-                raise EntityNotFoundException(
-                    resource="Object", resource_id=object_name
-                )
-            raise
+        return {
+            "url": presigned_url,
+            "expires_in_seconds": int(expires.total_seconds()),
+            "object_name": object_name,
+            "bucket_name": bucket_name,
+        }
 
-    @_handle_sync
+    @_handle_sync(executor=get_storage_executor)
     @_handle_minio_errors
     def delete_file(self, bucket_name: str, object_name: str) -> bool:
         """
@@ -317,7 +419,7 @@ class MinioService:
                 return False
             raise
 
-    @_handle_sync
+    @_handle_sync(executor=get_storage_executor)
     @_handle_minio_errors
     def delete_files(
         self, bucket_name: str, object_names: List[str]
@@ -359,7 +461,7 @@ class MinioService:
             # Return False for all objects if bulk operation fails
             return {obj_name: False for obj_name in object_names}
 
-    @_handle_sync
+    @_handle_sync(executor=get_storage_executor)
     @_handle_minio_errors
     def setup_bucket_notification(
         self,
@@ -411,7 +513,7 @@ class MinioService:
             logger.error(f"Failed to set up bucket notification: {e}")
             return False
 
-    @_handle_sync
+    @_handle_sync(executor=get_storage_executor)
     @_handle_minio_errors
     def list_objects(
         self,
@@ -467,7 +569,7 @@ class MinioService:
             logger.error(f"Failed to list objects: {e}")
             raise InternalException(message="Failed to list objects")
 
-    @_handle_sync
+    @_handle_sync(executor=get_storage_executor)
     @_handle_minio_errors
     def get_object_info(self, bucket_name: str, object_name: str) -> Dict[str, Any]:
         """
@@ -508,7 +610,60 @@ class MinioService:
                 )
             raise
 
-    @_handle_sync
+    @_handle_sync(executor=get_stream_executor)
+    @_handle_minio_errors
+    def open_object(
+        self, bucket_name: str, object_name: str, offset: int = 0, length: int = 0
+    ) -> BaseHTTPResponse:
+        """
+        Start downloading an object, without reading the body.
+
+        The caller reads the body with read_object_chunk() and must close the
+        response and release its connection when done.
+
+        Args:
+            bucket_name (str): Name of the bucket.
+            object_name (str): Name of the object.
+            offset (int): First byte to download.
+            length (int): Bytes to download; 0 for the rest of the object.
+
+        Returns:
+            BaseHTTPResponse: The open response from storage.
+
+        Raises:
+            EntityNotFoundException: If the bucket or the object does not exist.
+        """
+        if bucket_name not in self.bucket_names:
+            raise EntityNotFoundException(resource="Bucket", resource_id=bucket_name)
+
+        try:
+            return self.client.get_object(
+                bucket_name, object_name, offset=offset, length=length
+            )
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                raise EntityNotFoundException(
+                    resource="Object",
+                    resource_id=object_name,
+                )
+            raise
+
+    @_handle_sync(executor=get_stream_executor)
+    @_handle_minio_errors
+    def read_object_chunk(self, response: BaseHTTPResponse, amount: int) -> bytes:
+        """
+        Read the next chunk of an object opened with open_object().
+
+        Args:
+            response (BaseHTTPResponse): The open response.
+            amount (int): Maximum number of bytes to read.
+
+        Returns:
+            bytes: The chunk; empty at the end of the object.
+        """
+        return response.read(amount)
+
+    @_handle_sync(executor=get_storage_executor)
     @_handle_minio_errors
     def health_check(self) -> Dict[str, Any]:
         """
@@ -537,7 +692,7 @@ class MinioService:
                 "secure": self.secure,
             }
 
-    @_handle_sync
+    @_handle_sync(policy=SyncPolicy.INLINE)
     @_handle_minio_errors
     def create_presigned_put_upload_url(
         self,
@@ -566,10 +721,8 @@ class MinioService:
         # Bucket existence is ensured at startup; no per-operation check needed
 
         try:
-            url = self.client.presigned_put_object(
-                bucket_name=bucket_name,
-                object_name=object_name,
-                expires=expires,
+            url = self.presigner.presign_url(
+                "PUT", bucket_name, object_name, expires=expires
             )
             return {
                 "url": url,
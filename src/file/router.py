@@ -5,11 +5,15 @@ Handles HTTP endpoints for generating presigned upload and download URLs.
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Request, Response
 
 from ..auth.auth import authorize, get_current_user
 from ..auth.models import User
+from ..common.exceptions.exceptions import EntityNotFoundException
+from ..common.http_responses.doc_responses import ResponseErrorDoc
+from ..common.settings import settings
 from ..common.user_role import UserRole
+from .schemas import DownloadUrlsRequest, DownloadUrlsResponse
 from .service import FileService, get_FileService
 
 router = APIRouter(prefix="/file", tags=["file"])
@@ -83,3 +87,67 @@ async def get_download_url(
     return await file_service.create_download_url(
         bucket_name, object_name, expires_seconds
     )
+
+
+@router.post(
+    "/download-urls",
+    response_model=DownloadUrlsResponse,
+    responses={**ResponseErrorDoc.HTTP_422_UNPROCESSABLE_ENTITY("Invalid batch")},
+)
+async def get_download_urls(
+    batch: Annotated[DownloadUrlsRequest, Body()],
+    file_service: FileService = Depends(get_FileService),
+):
+    """
+    Generate presigned download URLs for several objects in one request.
+
+    Args:
+        batch (DownloadUrlsRequest): The objects and the URL expiry.
+        file_service (FileService): The file service dependency.
+
+    Returns:
+        DownloadUrlsResponse: A URL or an error per object, in request order.
+    """
+    items = await file_service.create_download_urls(
+        batch.objects, batch.expires_seconds
+    )
+    return DownloadUrlsResponse(items=items)
+
+
+@router.get(
+    "/{bucket_name}/{object_name:path}",
+    response_class=Response,
+    include_in_schema=settings.FILE_PROXY_ENABLED,
+    responses={
+        200: {"description": "The object", "content": {"*/*": {}}},
+        206: {"description": "The requested byte range", "content": {"*/*": {}}},
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
+        416: {"description": "Range not satisfiable"},
+        **ResponseErrorDoc.HTTP_404_NOT_FOUND("Object not found"),
+    },
+)
+async def get_object(
+    request: Request,
+    bucket_name: str,
+    object_name: str,
+    file_service: FileService = Depends(get_FileService),
+):
+    """
+    Stream an object from storage, for a reverse proxy or CDN to cache.
+
+    Only available when FILE_PROXY_ENABLED is set.
+
+    Args:
+        request (Request): The HTTP request, for Range and If-None-Match.
+        bucket_name (str): The bucket name.
+        object_name (str): The object name; may contain slashes.
+        file_service (FileService): The file service dependency.
+
+    Returns:
+        Response: The object, a byte range of it, or 304.
+    """
+    if not settings.FILE_PROXY_ENABLED:
+        raise EntityNotFoundException()
+    return await file_service.object_response(
+        bucket_name, object_name, request.headers
+    )
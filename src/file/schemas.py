@@ -0,0 +1,60 @@
+"""
+Pydantic schemas for file API.
+Defines request and response models for batch file endpoints.
+"""
+
+from pydantic import BaseModel, Field
+
+from ..common.settings import settings
+
+# Presigned URLs are valid for at most 7 days
+MAX_EXPIRES_SECONDS = 7 * 24 * 3600
+
+
+class ObjectRef(BaseModel):
+    """
+    Reference to a stored object.
+    """
+
+    bucket_name: str = Field(min_length=1)
+    object_name: str = Field(min_length=1)
+
+
+class DownloadUrlsRequest(BaseModel):
+    """
+    Schema for requesting download URLs for several objects at once.
+    """
+
+    objects: list[ObjectRef] = Field(
+        min_length=1, max_length=settings.DOWNLOAD_URL_BATCH_MAX
+    )
+    expires_seconds: int = Field(default=3600, ge=1, le=MAX_EXPIRES_SECONDS)
+
+
+class ItemError(BaseModel):
+    """
+    Why one item of a batch failed.
+    """
+
+    code: str
+    message: str
+
+
+class DownloadUrlResult(BaseModel):
+    """
+    The download URL for one requested object, or the error for it.
+    """
+
+    bucket_name: str
+    object_name: str
+    url: str | None = None
+    expires_in_seconds: int | None = None
+    error: ItemError | None = None
+
+
+class DownloadUrlsResponse(BaseModel):
+    """
+    Download URLs in the order the objects were requested.
+    """
+
+    items: list[DownloadUrlResult]
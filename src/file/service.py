@@ -3,14 +3,61 @@ Service layer for file operations using MinIO.
 Handles business logic for generating presigned URLs for uploads and downloads.
 """
 
+import asyncio
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
-from fastapi import Depends
+from fastapi import Depends, Response
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+from urllib3 import BaseHTTPResponse
 
+from ..common.exceptions.exceptions import (
+    AppBaseException,
+    EntityNotFoundException,
+    ServiceUnavailableException,
+)
+from ..common.http_conditional import (
+    RANGE_UNIT,
+    RangeNotSatisfiableError,
+    etag_matches,
+    if_range_matches,
+    parse_byte_range,
+)
+from ..common.metrics import Counter, Gauge, registry
+from ..common.settings import settings
+from ..common.ttl_cache import TTLCache
 from .minio import MinioService, get_MinioService
+from .schemas import DownloadUrlResult, ItemError, ObjectRef
+
+# Signed download URLs keyed by (bucket, object, expiry, window start)
+download_url_cache: TTLCache[tuple[str, str, int, int], dict] = TTLCache(
+    max_size=settings.DOWNLOAD_URL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.DOWNLOAD_URL_CACHE_WINDOW_SECONDS,
+)
+
+DOWNLOAD_URL_CACHE_LOOKUPS = registry.register(
+    Counter(
+        "download_url_cache_lookups",
+        "Presigned download URL cache lookups, by result (hit or miss).",
+        ("result",),
+    )
+)
+DOWNLOAD_URL_CACHE_ENTRIES = registry.register(
+    Gauge("download_url_cache_entries", "Presigned download URLs currently cached.")
+)
+registry.register_collector(
+    lambda: DOWNLOAD_URL_CACHE_ENTRIES.set((), len(download_url_cache))
+)
+
+# Proxied downloads in progress; each holds a storage connection and a
+# stream executor thread
+proxy_stream_slots = asyncio.Semaphore(settings.FILE_PROXY_MAX_STREAMS)
 
 
 class FileService:
@@ -91,20 +138,218 @@ class FileService:
         """
         Create a presigned URL for downloading a file from the specified bucket.
 
+        URLs are signed as of the start of the current cache window and reused
+        until it ends, so repeated requests for an object get the same URL
+        (from every worker) and CDNs can cache what it points to. The window
+        is at most half the expiry, so a URL always has at least half of its
+        lifetime left when handed out.
+
         Args:
             bucket_name (str): The bucket name.
             object_name (str): The object name.
             expires_seconds (int): Expiry time for the URL in seconds.
 
         Returns:
-            dict: Presigned download URL and metadata.
+            dict: Presigned download URL and metadata; expires_in_seconds is
+            the remaining lifetime.
         """
-        return await self.minio.create_presigned_download_url(
-            bucket_name=bucket_name,
-            object_name=object_name,
-            expires=timedelta(seconds=expires_seconds),
+        window = min(settings.DOWNLOAD_URL_CACHE_WINDOW_SECONDS, expires_seconds // 2)
+        if window < 1:
+            return await self.minio.create_presigned_download_url(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                expires=timedelta(seconds=expires_seconds),
+            )
+
+        now = time.time()
+        window_start = int(now // window) * window
+        key = (bucket_name, object_name, expires_seconds, window_start)
+        signed = download_url_cache.get(key)
+        if signed is None:
+            DOWNLOAD_URL_CACHE_LOOKUPS.inc(("miss",))
+            signed = await self.minio.create_presigned_download_url(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                expires=timedelta(seconds=expires_seconds),
+                request_date=datetime.fromtimestamp(window_start, timezone.utc),
+            )
+            download_url_cache.set(key, signed, ttl_seconds=window_start + window - now)
+        else:
+            DOWNLOAD_URL_CACHE_LOOKUPS.inc(("hit",))
+
+        return {
+            **signed,
+            "expires_in_seconds": window_start + expires_seconds - int(now),
+        }
+
+    async def create_download_urls(
+        self, objects: list[ObjectRef], expires_seconds: int = 3600
+    ) -> list[DownloadUrlResult]:
+        """
+        Create presigned download URLs for several objects.
+
+        A failure for one object is reported in its result and does not
+        affect the others.
+
+        Args:
+            objects (list[ObjectRef]): The objects, in response order.
+            expires_seconds (int): Expiry time for the URLs in seconds.
+
+        Returns:
+            list[DownloadUrlResult]: One result per object.
+        """
+        results = []
+        for ref in objects:
+            result = DownloadUrlResult(
+                bucket_name=ref.bucket_name, object_name=ref.object_name
+            )
+            try:
+                signed = await self.create_download_url(
+                    ref.bucket_name, ref.object_name, expires_seconds
+                )
+            except AppBaseException as e:
+                result.error = ItemError(code=e.code, message=e.message)
+            else:
+                result.url = signed["url"]
+                result.expires_in_seconds = signed["expires_in_seconds"]
+            results.append(result)
+        return results
+
+    async def object_response(
+        self, bucket_name: str, object_name: str, request_headers: Headers
+    ) -> Response:
+        """
+        Serve an object from storage, streamed in constant memory.
+
+        Object names are unique per upload, so responses are marked public and
+        immutable for a reverse proxy or browser to cache. The object's ETag
+        answers If-None-Match with 304, and a single byte Range (honouring
+        If-Range) is served as 206.
+
+        Args:
+            bucket_name (str): The bucket name.
+            object_name (str): The object name.
+            request_headers (Headers): The request headers.
+
+        Returns:
+            Response: 200 or 206 streaming the object, 304, or 416.
+
+        Raises:
+            EntityNotFoundException: If the bucket or the object does not exist.
+            ServiceUnavailableException: If FILE_PROXY_MAX_STREAMS downloads are
+                already in progress.
+        """
+        if bucket_name not in self.minio.bucket_names:
+            raise EntityNotFoundException(resource="Bucket", resource_id=bucket_name)
+
+        info = await self.minio.get_object_info(bucket_name, object_name)
+        size = info["size"]
+        etag = f'"{info["etag"]}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": (
+                f"public, max-age={settings.FILE_PROXY_MAX_AGE_SECONDS}, immutable"
+            ),
+            "Accept-Ranges": RANGE_UNIT,
+        }
+        if info["last_modified"]:
+            last_modified = datetime.fromisoformat(info["last_modified"])
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        byte_range = None
+        if if_range_matches(request_headers.get("if-range"), etag):
+            try:
+                byte_range = parse_byte_range(request_headers.get("range"), size)
+            except RangeNotSatisfiableError:
+                return Response(
+                    status_code=416,
+                    headers={**headers, "Content-Range": f"{RANGE_UNIT} */{size}"},
+                )
+
+        status_code = 200
+        offset, length = 0, size
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = 206
+            offset, length = start, end - start + 1
+            headers["Content-Range"] = f"{RANGE_UNIT} {start}-{end}/{size}"
+        headers["Content-Length"] = str(length)
+        headers["X-Content-Type-Options"] = "nosniff"
+        media_type = info["content_type"] or "application/octet-stream"
+
+        if length == 0:
+            # Empty object: nothing to fetch
+            return Response(status_code=200, headers=headers, media_type=media_type)
+
+        # Reject now, while a 503 can still be sent; once streaming, the
+        # download's reads are never rejected
+        if proxy_stream_slots.locked():
+            raise ServiceUnavailableException(
+                detail={"limit": "FILE_PROXY_MAX_STREAMS"}
+            )
+        await proxy_stream_slots.acquire()
+        try:
+            # Opened before responding, so a missing object is still a 404
+            storage_response = await self.minio.open_object(
+                bucket_name, object_name, offset=offset, length=length
+            )
+        except BaseException:
+            proxy_stream_slots.release()
+            raise
+
+        return _ProxiedObjectResponse(
+            storage_response,
+            self._iter_object(storage_response),
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
         )
 
+    async def _iter_object(self, response: BaseHTTPResponse) -> AsyncIterator[bytes]:
+        """
+        Yield an open storage response in chunks.
+
+        Args:
+            response (BaseHTTPResponse): The response from open_object().
+
+        Yields:
+            bytes: Chunks of at most FILE_PROXY_CHUNK_BYTES.
+        """
+        while chunk := await self.minio.read_object_chunk(
+            response, settings.FILE_PROXY_CHUNK_BYTES
+        ):
+            yield chunk
+
+
+class _ProxiedObjectResponse(StreamingResponse):
+    """
+    Streaming response for a proxied download that closes the storage
+    response and frees the download slot however sending ends: completed,
+    client gone before or during the body, or failed.
+
+    Args:
+        storage_response (BaseHTTPResponse): The response from open_object().
+        *args: Passed to StreamingResponse.
+        **kwargs: Passed to StreamingResponse.
+    """
+
+    def __init__(self, storage_response: BaseHTTPResponse, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.storage_response = storage_response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                self.storage_response.close()
+                self.storage_response.release_conn()
+            finally:
+                proxy_stream_slots.release()
+
 
 @lru_cache
 def get_FileService(
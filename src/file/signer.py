@@ -0,0 +1,205 @@
+"""
+In-process AWS Signature V4 presigning for S3-compatible storage.
+
+Presigned URLs and POST policies are pure computation: a few HMAC-SHA256
+rounds over strings. Signing them here, directly on the event loop, avoids
+both a thread hop and the minio client's per-call overhead. The signing key
+depends only on the secret, the day and the region, so it is derived once
+per day instead of four extra HMACs per URL.
+
+Output is byte-for-byte what the minio client produces for path-style
+requests, so storage servers accept either.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import quote
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+SERVICE = "s3"
+MAX_EXPIRES = timedelta(days=7)
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _uri_encode(value: str, safe: str = "") -> str:
+    # RFC 3986 unreserved characters stay as-is, everything else is escaped
+    return quote(value, safe=safe)
+
+
+def _utc(value: datetime | None) -> datetime:
+    if value is None:
+        return datetime.now(timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class S3Presigner:
+    """
+    Creates SigV4 presigned URLs and POST policies without network access.
+
+    Args:
+        endpoint (str): Storage host, with port if not the scheme default.
+        access_key (str): Access key ID.
+        secret_key (str): Secret access key.
+        region (str): Region the requests are signed for.
+        secure (bool): Build https URLs if True, http otherwise.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        access_key: str,
+        secret_key: str,
+        region: str,
+        secure: bool,
+    ):
+        scheme = "https" if secure else "http"
+        default_port = ":443" if secure else ":80"
+        self.host = endpoint.removesuffix(default_port)
+        self.base_url = f"{scheme}://{self.host}"
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        # Derived keys by date stamp; only today's (and yesterday's, around
+        # midnight) are ever in use
+        self._signing_keys: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def signing_key(self, date_stamp: str) -> bytes:
+        """
+        Get the SigV4 signing key for a day, deriving it on first use.
+
+        Args:
+            date_stamp (str): The day, as YYYYMMDD.
+
+        Returns:
+            bytes: The signing key for this presigner's secret and region.
+        """
+        key = self._signing_keys.get(date_stamp)
+        if key is None:
+            key = _hmac(("AWS4" + self.secret_key).encode(), date_stamp)
+            for part in (self.region, SERVICE, "aws4_request"):
+                key = _hmac(key, part)
+            with self._lock:
+                if len(self._signing_keys) >= 2:
+                    self._signing_keys.clear()
+                self._signing_keys[date_stamp] = key
+        return key
+
+    def _credential(self, date_stamp: str) -> str:
+        return f"{self.access_key}/{date_stamp}/{self.region}/{SERVICE}/aws4_request"
+
+    def presign_url(
+        self,
+        method: str,
+        bucket_name: str,
+        object_name: str,
+        expires: timedelta,
+        now: datetime | None = None,
+    ) -> str:
+        """
+        Create a presigned URL for one request on an object.
+
+        Args:
+            method (str): HTTP method the URL is valid for, e.g. "GET" or "PUT".
+            bucket_name (str): Name of the bucket.
+            object_name (str): Name of the object.
+            expires (timedelta): Validity, from 1 second to 7 days.
+            now (datetime | None): Signing time; defaults to the current time.
+
+        Returns:
+            str: The presigned URL.
+
+        Raises:
+            ValueError: If object_name is empty or expires is out of range.
+        """
+        if not object_name:
+            raise ValueError("object name cannot be empty")
+        if not timedelta(seconds=1) <= expires <= MAX_EXPIRES:
+            raise ValueError("expires must be between 1 second and 7 days")
+
+        now = _utc(now)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        path = f"/{bucket_name}/{_uri_encode(object_name, safe='/')}"
+        # Already in canonical (sorted) order
+        query = (
+            f"X-Amz-Algorithm={ALGORITHM}"
+            f"&X-Amz-Credential={_uri_encode(self._credential(date_stamp))}"
+            f"&X-Amz-Date={amz_date}"
+            f"&X-Amz-Expires={int(expires.total_seconds())}"
+            f"&X-Amz-SignedHeaders=host"
+        )
+        canonical_request = (
+            f"{method}\n{path}\n{query}\nhost:{self.host}\n\nhost\nUNSIGNED-PAYLOAD"
+        )
+        string_to_sign = (
+            f"{ALGORITHM}\n{amz_date}\n"
+            f"{date_stamp}/{self.region}/{SERVICE}/aws4_request\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        signature = hmac.new(
+            self.signing_key(date_stamp), string_to_sign.encode(), hashlib.sha256
+        ).hexdigest()
+        return f"{self.base_url}{path}?{query}&X-Amz-Signature={signature}"
+
+    def presign_post_policy(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expires: timedelta,
+        content_length_range: tuple[int, int],
+        now: datetime | None = None,
+    ) -> dict[str, str]:
+        """
+        Create form data for a browser POST upload of exactly one object.
+
+        Args:
+            bucket_name (str): Name of the bucket.
+            object_name (str): Key the upload must use.
+            expires (timedelta): Validity of the policy.
+            content_length_range (tuple[int, int]): Allowed size, in bytes.
+            now (datetime | None): Signing time; defaults to the current time.
+
+        Returns:
+            dict[str, str]: The x-amz-* fields, policy and signature to post
+            along with the file and the key.
+        """
+        now = _utc(now)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        credential = self._credential(date_stamp)
+        expiration = now + expires
+
+        policy: dict[str, Any] = {
+            "expiration": expiration.strftime("%Y-%m-%dT%H:%M:%S.")
+            + f"{expiration.microsecond // 1000:03d}Z",
+            "conditions": [
+                ["eq", "$bucket", bucket_name],
+                ["eq", "$key", object_name],
+                ["content-length-range", *content_length_range],
+                ["eq", "$x-amz-algorithm", ALGORITHM],
+                ["eq", "$x-amz-credential", credential],
+                ["eq", "$x-amz-date", amz_date],
+            ],
+        }
+        encoded_policy = base64.b64encode(json.dumps(policy).encode()).decode()
+        signature = hmac.new(
+            self.signing_key(date_stamp), encoded_policy.encode(), hashlib.sha256
+        ).hexdigest()
+        return {
+            "x-amz-algorithm": ALGORITHM,
+            "x-amz-credential": credential,
+            "x-amz-date": amz_date,
+            "policy": encoded_policy,
+            "x-amz-signature": signature,
+        }
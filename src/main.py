@@ -14,19 +14,30 @@ from typing import Annotated
 import anyio
 import anyio.to_thread
 from anyio.to_thread import current_default_thread_limiter
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Response
 
 from .auth.auth import authorize, get_current_active_user
 from .auth.models import User
+from .auth.password import shutdown_password_executor, warm_up_password_executor
 from .auth.router import router as auth_router
 from .category.router import router as category_router
 from .comment.router import router as comment_router
 from .common.exceptions.register_exceptions import register_exception_handlers
+from .common.metrics import registry
+from .common.query_budget import QueryBudgetMiddleware
+from .common.read_routing import ReadYourWritesMiddleware
+from .common.request_metrics import MetricsMiddleware
 from .common.settings import settings
 from .common.user_role import UserRole
 from .configure_logging import configure_logging
+from .file.minio import (
+    get_MinioService,
+    shutdown_storage_executor,
+    shutdown_stream_executor,
+)
 from .file.router import router as file_router
 from .post.router import router as post_router
+from .post.view_counter import get_ViewCounter
 from .tag.router import router as tag_router
 
 if settings.PYTHON_ENV == "development":
@@ -61,17 +72,39 @@ async def lifespan_with_db_cleanup(app: FastAPI):
     limiter = anyio.to_thread.current_default_thread_limiter()
     limiter.total_tokens = 100
 
+    # Spawn the bcrypt workers now so the first login does not pay for it
+    await warm_up_password_executor()
+
+    view_counter = get_ViewCounter()
+    view_counter.start()
+
+    # Check storage and create missing buckets now rather than inside the
+    # first request; keep serving non-file routes if MinIO is down
+    try:
+        await get_MinioService().initialize_storage()
+    except Exception as e:
+        logger.error(f"Storage is unavailable at startup: {e}")
+
     yield
 
+    # Drain buffered views while the engine is still available
+    await view_counter.stop()
+
+    shutdown_password_executor()
+    shutdown_storage_executor()
+    shutdown_stream_executor()
+
     # Shutdown - Database specific cleanup
     logger.info("Cleaning up database connections...")
 
     # If using SQLAlchemy async engine
-    from .common.db import async_engine
+    from .common.db import async_engine, replica_engine
 
     try:
         # Close all database connections
         await async_engine.dispose()
+        if replica_engine is not async_engine:
+            await replica_engine.dispose()
         logger.info("Database engine disposed")
     except Exception as e:
         logger.error(f"Error disposing database engine: {e}")
@@ -81,6 +114,14 @@ app = FastAPI(lifespan=lifespan_with_db_cleanup)
 
 register_exception_handlers(app)
 
+if settings.POSTGRES_REPLICA_HOST:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+app.add_middleware(QueryBudgetMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, excluded_paths=frozenset({"/metrics"}))
+
 
 @app.get("/health", tags=["Health Check"])
 async def health_check():
@@ -97,6 +138,19 @@ async def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus metrics for this worker process.
+
+    Returns:
+        Response: The metrics in Prometheus text exposition format.
+    """
+    return Response(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 app.include_router(auth_router)
 app.include_router(post_router)
 app.include_router(category_router)
@@ -134,3 +188,29 @@ async def get_active_threads(
     threads_in_use = limiter.borrowed_tokens
 
     return {"active_threads": threads_in_use, "total_tokens": limiter.total_tokens}
+
+
+@app.get("/db/pool")
+@authorize(role=[UserRole.ADMIN])
+async def get_db_pool_stats(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+):
+    """
+    Get connection pool usage and checkout latency for each database engine.
+
+    Args:
+        current_user (User): The current authenticated user.
+
+    Returns:
+        dict: Pool stats for the primary and, if configured, the replica.
+    """
+    from .common.db import async_engine, replica_engine
+
+    engines = {"primary": async_engine}
+    if replica_engine is not async_engine:
+        engines["replica"] = replica_engine
+
+    return {
+        name: engine.sync_engine.pool.status_snapshot()  # type: ignore[attr-defined]
+        for name, engine in engines.items()
+    }
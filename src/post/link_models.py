@@ -2,6 +2,7 @@
 Link models for many-to-many relationships between Post, Category, and Tag.
 """
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -10,6 +11,11 @@ class PostCategoryLink(SQLModel, table=True):
     Link table for Post and Category many-to-many relationship.
     """
 
+    # The primary key serves post -> categories; this serves category -> posts
+    __table_args__ = (
+        Index("ix_postcategorylink_category_id_post_id", "category_id", "post_id"),
+    )
+
     post_id: int = Field(foreign_key="posts.id", primary_key=True)
     category_id: int = Field(foreign_key="categories.id", primary_key=True)
 
@@ -19,5 +25,8 @@ class PostTagLink(SQLModel, table=True):
     Link table for Post and Tag many-to-many relationship.
     """
 
+    # The primary key serves post -> tags; this serves tag -> posts
+    __table_args__ = (Index("ix_posttaglink_tag_id_post_id", "tag_id", "post_id"),)
+
     post_id: int = Field(foreign_key="posts.id", primary_key=True)
     tag_id: int = Field(foreign_key="tags.id", primary_key=True)
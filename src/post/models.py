@@ -6,7 +6,7 @@ Includes slug generation event listeners and relationships.
 from datetime import datetime
 
 from slugify import slugify
-from sqlalchemy import event
+from sqlalchemy import Index, event, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship
 
@@ -26,6 +26,17 @@ class Post(GenericModel, table=True):
     """
 
     __tablename__: str = "posts"  #  type: ignore
+    __table_args__ = (
+        # Published listing, keyset on (published_at, id)
+        Index(
+            "ix_posts_published_at_id",
+            "published_at",
+            "id",
+            postgresql_where=text("published_at IS NOT NULL"),
+        ),
+        # Listing by author; also covers the users foreign key
+        Index("ix_posts_author_id_published_at_id", "author_id", "published_at", "id"),
+    )
 
     published_at: datetime | None = Field(default=None)
     title: str = Field(min_length=1)
@@ -3,12 +3,70 @@ Repository layer for Post.
 Handles direct database operations for Post entities.
 """
 
+from datetime import datetime
+from enum import StrEnum
 from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
 
+from sqlalchemy import Integer, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..category.models import Category
 from ..common.generic_repository import GenericRepository
+from ..tag.models import Tag
+from .link_models import PostCategoryLink, PostTagLink
 from .models import Post
 
 
+class PostLoadProfile(StrEnum):
+    """
+    Named eager-loading strategies for Post queries.
+
+    BASE loads only the post columns. DETAIL loads everything needed to build
+    a PostPublic: the author is joined into the main query (many-to-one, one
+    row) and categories/tags are fetched with one SELECT ... IN each, so the
+    statement count stays fixed regardless of how many relations a post has.
+    EXPORT loads categories/tags the same way, one SELECT ... IN per batch
+    when streaming.
+    """
+
+    BASE = "BASE"
+    DETAIL = "DETAIL"
+    EXPORT = "EXPORT"
+
+
+POST_LOADER_OPTIONS: dict[PostLoadProfile, tuple[ExecutableOption, ...]] = {
+    PostLoadProfile.BASE: (),
+    PostLoadProfile.DETAIL: (
+        joinedload(Post.author),  # type: ignore
+        selectinload(Post.categories),  # type: ignore
+        selectinload(Post.tags),  # type: ignore
+    ),
+    PostLoadProfile.EXPORT: (
+        selectinload(Post.categories),  # type: ignore
+        selectinload(Post.tags),  # type: ignore
+    ),
+}
+
+# Columns written by copy_posts, in COPY order
+POST_COPY_COLUMNS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "published_at",
+    "title",
+    "slug",
+    "summary",
+    "featured_image",
+    "view_count",
+    "body",
+    "author_id",
+)
+
+
 class PostRepository(GenericRepository[Post]):
     """
     Repository for Post model, inherits generic CRUD operations.
@@ -17,6 +75,117 @@ class PostRepository(GenericRepository[Post]):
     def __init__(self):
         super().__init__(Post)
 
+    @staticmethod
+    def loader_options(profile: PostLoadProfile) -> tuple[ExecutableOption, ...]:
+        """
+        Get the loader options for a load profile.
+
+        Args:
+            profile (PostLoadProfile): The load profile.
+
+        Returns:
+            tuple[ExecutableOption, ...]: Loader options for the query.
+        """
+        return POST_LOADER_OPTIONS[profile]
+
+    async def get_by_id(
+        self,
+        id: int,
+        session: AsyncSession,
+        options=None,
+        populate_existing: bool = False,
+        profile: PostLoadProfile = PostLoadProfile.DETAIL,
+    ) -> Optional[Post]:
+        """
+        Get a post by ID, eager-loading relationships for the given profile.
+
+        Args:
+            id (int): The post ID.
+            session (AsyncSession): Database session.
+            options: Extra loader options, applied after the profile's options.
+            populate_existing (bool): Overwrite an instance already in the session.
+            profile (PostLoadProfile): The load profile to apply.
+
+        Returns:
+            Optional[Post]: The post if found, else None.
+        """
+        return await super().get_by_id(
+            id,
+            session,
+            options=(*self.loader_options(profile), *(options or ())),
+            populate_existing=populate_existing,
+        )
+
+    async def list_published(
+        self,
+        session: AsyncSession,
+        *,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        category_slug: str | None = None,
+        tag_slug: str | None = None,
+        author_id: int | None = None,
+        profile: PostLoadProfile = PostLoadProfile.DETAIL,
+    ) -> tuple[list[Post], tuple[Any, ...] | None]:
+        """
+        Get one page of published posts, newest first, keyed on (published_at, id).
+
+        Posts whose published_at is in the future (scheduled) are excluded.
+
+        Args:
+            session (AsyncSession): Database session.
+            limit (int): Page size.
+            after (tuple[datetime, int] | None): Key of the last post of the previous page.
+            category_slug (str | None): Only posts in this category.
+            tag_slug (str | None): Only posts with this tag.
+            author_id (int | None): Only posts by this author.
+            profile (PostLoadProfile): The load profile to apply.
+
+        Returns:
+            tuple[list[Post], tuple[Any, ...] | None]: The posts and the key of
+            the last one if more posts follow.
+        """
+        filters: list[Any] = [
+            Post.published_at.is_not(None),  # type: ignore
+            # Scheduled posts stay hidden until their time; published_at is
+            # naive UTC, so compare with the current UTC timestamp
+            Post.published_at <= func.timezone("UTC", func.now()),  # type: ignore
+        ]
+        if category_slug is not None:
+            filters.append(Post.categories.any(Category.slug == category_slug))  # type: ignore
+        if tag_slug is not None:
+            filters.append(Post.tags.any(Tag.slug == tag_slug))  # type: ignore
+        if author_id is not None:
+            filters.append(Post.author_id == author_id)
+
+        return await self.get_page(
+            session,
+            keyset=(Post.published_at, Post.id),
+            limit=limit,
+            after=after,
+            filters=filters,
+            options=self.loader_options(profile),
+        )
+
+    async def create(self, data: Dict[str, Any], session: AsyncSession) -> Post:
+        """
+        Create a post and reload it with its relationships.
+
+        Args:
+            data (Dict[str, Any]): Data for the post, including relation lists.
+            session (AsyncSession): Database session.
+
+        Returns:
+            Post: The created post with author, categories and tags loaded.
+        """
+        record = self.model(**data)
+
+        session.add(record)
+        await session.flush()  # Flush to get the ID and other DB-generated values
+
+        # Re-select instead of refresh() so relationships come back eagerly loaded
+        return await self.get_by_id(record.id, session, populate_existing=True)  # type: ignore
+
     async def update_with_m2m(
         self,
         post,
@@ -51,8 +220,98 @@ class PostRepository(GenericRepository[Post]):
 
         session.add(post)
         await session.flush()
-        await session.refresh(post)
-        return post
+        return await self.get_by_id(post.id, session, populate_existing=True)
+
+    async def increment_view_counts(
+        self, counts: Dict[int, int], session: AsyncSession
+    ) -> None:
+        """
+        Add buffered view counts to several posts in one UPDATE.
+
+        Args:
+            counts (Dict[int, int]): Views to add, keyed by post ID.
+            session (AsyncSession): Database session.
+        """
+        ids = sorted(counts)
+        deltas = select(
+            func.unnest(bindparam("ids", ids, type_=ARRAY(Integer))).label("id"),
+            func.unnest(
+                bindparam("deltas", [counts[id] for id in ids], type_=ARRAY(Integer))
+            ).label("delta"),
+        ).subquery()
+
+        statement = (
+            update(Post)
+            .where(Post.id == deltas.c.id)  # type: ignore
+            .values(
+                view_count=Post.view_count + deltas.c.delta,
+                # A view is not an edit: keep updated_at (and ETags) unchanged
+                updated_at=Post.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(statement)
+
+    async def copy_posts(
+        self, rows: Sequence[Dict[str, Any]], session: AsyncSession
+    ) -> list[int]:
+        """
+        Insert posts and their category/tag links with COPY.
+
+        IDs are reserved from the posts sequence in one query so link rows can
+        be written without reading anything back. Bypasses the ORM: no slug
+        generation or other mapper events run, and nothing is added to the
+        session. Must run inside a transaction that has already started.
+
+        Args:
+            rows (Sequence[Dict[str, Any]]): One dict per post with the
+                POST_COPY_COLUMNS other than id/created_at/updated_at, plus
+                category_ids and tag_ids lists. body must be JSON text.
+            session (AsyncSession): Database session.
+
+        Returns:
+            list[int]: The new post IDs, in the order of rows.
+        """
+        if not rows:
+            return []
+
+        sequence = func.pg_get_serial_sequence(Post.__tablename__, "id")
+        reserved = (
+            await session.execute(
+                select(func.nextval(sequence), func.localtimestamp()).select_from(
+                    func.generate_series(1, len(rows))
+                )
+            )
+        ).all()
+        ids = [id for id, _ in reserved]
+        now = reserved[0][1]
+
+        post_records = [
+            (id, now, now, *(row[column] for column in POST_COPY_COLUMNS[3:]))
+            for id, row in zip(ids, rows)
+        ]
+        category_records = [
+            (id, category_id)
+            for id, row in zip(ids, rows)
+            for category_id in row["category_ids"]
+        ]
+        tag_records = [
+            (id, tag_id) for id, row in zip(ids, rows) for tag_id in row["tag_ids"]
+        ]
+
+        # COPY is not exposed by SQLAlchemy; use the asyncpg connection directly
+        connection = await session.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+        for table, columns, records in (
+            (Post.__tablename__, POST_COPY_COLUMNS, post_records),
+            (PostCategoryLink.__tablename__, ("post_id", "category_id"), category_records),
+            (PostTagLink.__tablename__, ("post_id", "tag_id"), tag_records),
+        ):
+            if records:
+                await driver.copy_records_to_table(  # type: ignore[union-attr]
+                    table, columns=columns, records=records
+                )
+        return ids
 
 
 @lru_cache
@@ -3,22 +3,42 @@ API router for Post endpoints.
 Handles HTTP requests for post CRUD operations.
 """
 
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Request, status
+from fastapi import APIRouter, Body, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from ..auth.auth import authorize, get_current_active_user
 from ..auth.models import User
-from ..common.deps import AsyncSessionDep
+from ..common.db import ReadSessionLocal, SessionLocal, release_connection
+from ..common.deps import AsyncSessionDep, ReadSessionDep
+from ..common.http_cache import (
+    not_modified_response,
+    records_etag,
+    with_cache_headers,
+)
 from ..common.http_responses.doc_responses import (
     ResponseErrorDoc,
     ResponseSuccessDoc,
 )
 from ..common.http_responses.success_response import SuccessCodes
 from ..common.http_responses.success_result import SuccessResult
+from ..common.ndjson import NDJSON_MEDIA_TYPE, iter_ndjson_lines, ndjson_response
+from ..common.pagination import CursorPage
+from ..common.query_budget import query_budget
+from ..common.settings import settings
 from ..common.user_role import UserRole
-from .schemas import CreatePost, PostPublic, UpdatePost
+from .schemas import (
+    CreatePost,
+    ImportPost,
+    ImportReport,
+    PostExport,
+    PostPublic,
+    UpdatePost,
+)
 from .service import PostService, get_PostService
+from .view_counter import ViewCounterDep
 
 router = APIRouter(prefix="/post", tags=["post"])
 
@@ -119,6 +139,175 @@ async def update_post(
     return result.to_json_response(request)
 
 
+@router.post(
+    "/import",
+    response_model=SuccessResult[ImportReport],
+    responses={
+        **ResponseSuccessDoc.HTTP_200_OK("Posts imported", ImportReport),
+        **ResponseErrorDoc.HTTP_400_BAD_REQUEST("Malformed NDJSON body"),
+        **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "description": "One ImportPost JSON object per line.",
+            "content": {NDJSON_MEDIA_TYPE: {"schema": ImportPost.model_json_schema()}},
+        }
+    },
+)
+@authorize(role=[UserRole.ADMIN])
+async def import_posts(
+    service: PostServiceDep,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    request: Request,
+):
+    """
+    Bulk-import posts from an NDJSON body.
+
+    The body is read and written in batches as it streams in, so archives of
+    any size can be sent in one request. Each batch is committed on its own
+    session, so no transaction stays open for the whole upload. Lines that
+    fail validation or reference unknown categories/tags are skipped and
+    listed in the report.
+
+    Args:
+        service (PostServiceDep): The post service dependency.
+        current_user (User): The current authenticated user, the posts' author.
+        request (Request): The HTTP request object.
+
+    Returns:
+        JSONResponse: The import report wrapped in a SuccessResult.
+    """
+    report = await service.import_posts(
+        iter_ndjson_lines(request.stream(), settings.POST_IMPORT_MAX_LINE_BYTES),
+        current_user,
+        SessionLocal,
+    )
+    result = SuccessResult[ImportReport](
+        code=SuccessCodes.SUCCESS,
+        message=f"Imported {report.imported} posts, rejected {report.failed} lines",
+        status_code=status.HTTP_200_OK,
+        data=report,
+    )
+    return result.to_json_response(request)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        **ResponseSuccessDoc.HTTP_200_NDJSON("One PostExport per line", PostExport),
+        **ResponseErrorDoc.HTTP_403_FORBIDDEN(),
+    },
+)
+@authorize(role=[UserRole.ADMIN])
+async def export_posts(
+    service: PostServiceDep,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    request: Request,
+    created_from: datetime | None = Query(
+        None, description="Only posts created at or after this time"
+    ),
+    created_before: datetime | None = Query(
+        None, description="Only posts created before this time"
+    ),
+):
+    """
+    Export all posts, with category and tag slugs, as NDJSON.
+
+    Rows are streamed from a server-side cursor as they are sent, so memory
+    use does not grow with the number of posts. The body is gzipped when
+    the client sends Accept-Encoding: gzip.
+
+    Args:
+        service (PostServiceDep): The post service dependency.
+        current_user (User): The current authenticated user.
+        request (Request): The HTTP request object.
+        created_from (datetime | None): Lower bound on created_at, inclusive.
+        created_before (datetime | None): Upper bound on created_at, exclusive.
+
+    Returns:
+        StreamingResponse: The NDJSON stream.
+    """
+
+    async def records():
+        # Request-scoped sessions are closed before the body is sent
+        async with ReadSessionLocal() as session:
+            async for record in service.export_posts(
+                session, created_from, created_before
+            ):
+                yield record
+
+    return ndjson_response(
+        request, records(), "posts.ndjson", settings.EXPORT_GZIP_LEVEL
+    )
+
+
+@router.get(
+    "/",
+    response_model=SuccessResult[CursorPage[PostPublic]],
+    responses={
+        **ResponseSuccessDoc.HTTP_200_OK(
+            "Posts fetched successfully", CursorPage[PostPublic]
+        ),
+        **ResponseErrorDoc.HTTP_400_BAD_REQUEST("Invalid pagination cursor"),
+        **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
+    },
+)
+@query_budget(3)
+async def list_posts(
+    session: ReadSessionDep,
+    service: PostServiceDep,
+    request: Request,
+    limit: int = Query(
+        settings.PAGE_SIZE_DEFAULT,
+        ge=1,
+        le=settings.PAGE_SIZE_MAX,
+        description="Page size",
+    ),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    category: str | None = Query(None, description="Category slug"),
+    tag: str | None = Query(None, description="Tag slug"),
+    author_id: int | None = Query(None, ge=1, description="Author ID"),
+):
+    """
+    List published posts, newest first, with cursor pagination.
+
+    Args:
+        session (ReadSessionDep): The read-only database session.
+        service (PostServiceDep): The post service dependency.
+        request (Request): The HTTP request object.
+        limit (int): Page size.
+        cursor (str | None): Cursor from the previous page.
+        category (str | None): Category slug filter.
+        tag (str | None): Tag slug filter.
+        author_id (int | None): Author filter.
+
+    Returns:
+        JSONResponse: A page of posts wrapped in a SuccessResult.
+    """
+    posts, next_cursor = await service.list_posts(
+        session,
+        limit=limit,
+        cursor=cursor,
+        category_slug=category,
+        tag_slug=tag,
+        author_id=author_id,
+    )
+    await release_connection(session)
+    page = CursorPage[PostPublic](
+        items=[PostPublic.model_validate(post) for post in posts],
+        next_cursor=next_cursor,
+    )
+    result = SuccessResult[CursorPage[PostPublic]](
+        code=SuccessCodes.SUCCESS,
+        message="Posts fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data=page,
+    )
+    return result.to_json_response(request)
+
+
 @router.get(
     "/{post_id}",
     response_model=SuccessResult[PostPublic],
@@ -128,16 +317,22 @@ async def update_post(
         **ResponseErrorDoc.HTTP_404_NOT_FOUND(),
     },
 )
+@query_budget(3)
 async def get_post_by_id(
-    post_id: int, session: AsyncSessionDep, service: PostServiceDep, request: Request
+    post_id: int,
+    session: ReadSessionDep,
+    service: PostServiceDep,
+    view_counter: ViewCounterDep,
+    request: Request,
 ):
     """
     Retrieve a post by its ID.
 
     Args:
         post_id (int): The ID of the post to retrieve.
-        session (AsyncSessionDep): The database session.
+        session (ReadSessionDep): The read-only database session.
         service (PostServiceDep): The post service dependency.
+        view_counter (ViewCounterDep): Buffers the view for a batched update.
         request (Request): The HTTP request object.
 
     Returns:
@@ -145,6 +340,14 @@ async def get_post_by_id(
     """
     # Retrieve the post using the service
     post = await service.get_post_by_id(post_id, session)
+    # Everything below works on loaded objects; free the connection
+    await release_connection(session)
+    # A revalidated (304) read is still a view
+    view_counter.record(post.id)  # type: ignore
+    # Skip serialization if the client already has this version
+    etag = records_etag([post, post.author, *post.categories, *post.tags])
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
     # Validate and serialize the retrieved post
     public_post = PostPublic.model_validate(post)
     # Prepare the success result
@@ -155,7 +358,7 @@ async def get_post_by_id(
         data=public_post,
     )
     # Return the success response
-    return result.to_json_response(request)
+    return with_cache_headers(result.to_json_response(request), request, etag)
 
 
 @router.delete(
@@ -4,13 +4,18 @@ Defines request and response models for post endpoints.
 """
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 from ..auth.schemas import UserPublic
 from ..category.schemas import CategoryPublic
+from ..common.utils import to_naive_utc
 from ..tag.schemas import TagPublic
 
+# posts.published_at is timestamp without time zone: store aware input as UTC
+NaiveUTCDatetime = Annotated[datetime, AfterValidator(to_naive_utc)]
+
 
 class CreatePost(BaseModel):
     """
@@ -21,6 +26,7 @@ class CreatePost(BaseModel):
     summary: str = Field(min_length=1)
     body: str = Field(min_length=1)
     featured_image: str = Field(min_length=1)
+    published_at: NaiveUTCDatetime | None = Field(default=None)
     category_ids: list[int] | None = Field(default=None)
     tag_ids: list[int] | None = Field(default=None)
 
@@ -34,6 +40,7 @@ class UpdatePost(BaseModel):
     summary: str | None = Field(default=None)
     body: str | None = Field(default=None)
     featured_image: str | None = Field(default=None)
+    published_at: NaiveUTCDatetime | None = Field(default=None)
     category_ids: list[int] | None = Field(default=None)
     tag_ids: list[int] | None = Field(default=None)
 
@@ -58,3 +65,57 @@ class PostPublic(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ImportPost(BaseModel):
+    """
+    Schema for one line of a bulk post import.
+
+    Categories and tags are referenced by slug; the post slug is derived from
+    the title as for a regular create.
+    """
+
+    title: str = Field(min_length=1)
+    summary: str = Field(min_length=1)
+    body: str = Field(min_length=1)
+    featured_image: str = Field(min_length=1)
+    published_at: datetime | None = Field(default=None)
+    view_count: int = Field(default=0, ge=0)
+    categories: list[str] = Field(default_factory=list)
+    tags: list[str] = Field(default_factory=list)
+
+
+class PostExport(ImportPost):
+    """
+    Schema for one line of a post export; re-importable as an ImportPost.
+    """
+
+    id: int
+    slug: str
+    author_id: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class ImportRowError(BaseModel):
+    """
+    A rejected line of a bulk post import.
+    """
+
+    line: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    """
+    Outcome of a bulk post import.
+
+    Attributes:
+        imported (int): Posts written.
+        failed (int): Lines rejected.
+        errors (list[ImportRowError]): The first rejected lines and why.
+    """
+
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = Field(default_factory=list)
@@ -3,11 +3,18 @@ Service layer for Post operations.
 Handles business logic and error handling for post CRUD operations.
 """
 
+import json
+import logging
+from datetime import datetime
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, Any, AsyncIterable, AsyncIterator
 
+from asyncpg import PostgresError, UniqueViolationError
 from fastapi import Depends
-from sqlalchemy.exc import IntegrityError
+from pydantic import ValidationError
+from slugify import slugify
+from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..auth.models import User
@@ -17,10 +24,22 @@ from ..common.exceptions.exceptions import (
     EntityNotFoundException,
     InternalException,
 )
+from ..common.pagination import decode_cursor, encode_cursor
+from ..common.settings import settings
+from ..common.utils import to_naive_utc
 from ..tag.service import TagService, get_TagService
 from .models import Post
-from .repository import PostRepository, get_PostRepository
-from .schemas import CreatePost, UpdatePost
+from .repository import PostLoadProfile, PostRepository, get_PostRepository
+from .schemas import (
+    CreatePost,
+    ImportPost,
+    ImportReport,
+    ImportRowError,
+    PostExport,
+    UpdatePost,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class PostService:
@@ -62,18 +81,13 @@ class PostService:
 
         Raises:
             DuplicateEntryException: If a post with the same title exists.
+            EntityNotFoundException: If any category or tag ID does not exist.
             InternalException: For unexpected errors.
         """
-        categories = []
-        for category_id in data.category_ids or []:
-            category = await self.category_service.get_category_by_id(
-                category_id, session
-            )
-            categories.append(category)
-        tags = []
-        for tag_id in data.tag_ids or []:
-            tag = await self.tag_service.get_tag_by_id(tag_id, session)
-            tags.append(tag)
+        categories = await self.category_service.get_categories_by_ids(
+            data.category_ids or [], session
+        )
+        tags = await self.tag_service.get_tags_by_ids(data.tag_ids or [], session)
 
         try:
             post_record = await self.repository.create(
@@ -115,31 +129,30 @@ class PostService:
 
         Raises:
             DuplicateEntryException: If a post with the same title exists.
-            EntityNotFoundException: If the post does not exist.
+            EntityNotFoundException: If the post or any category or tag ID does not exist.
             InternalException: For unexpected errors.
         """
         post_data = update_data.model_dump(exclude_unset=True)
         try:
-            updated_post = await self.repository.get_by_id(id, session)
+            # DETAIL profile: collections must be loaded before they are replaced
+            updated_post = await self.repository.get_by_id(
+                id, session, profile=PostLoadProfile.DETAIL
+            )
             if updated_post is None:
                 raise EntityNotFoundException(Post.__name__, str(id))
 
             # Prepare related records if provided
             categories = None
             if update_data.category_ids is not None:
-                categories = []
-                for category_id in update_data.category_ids:
-                    category = await self.category_service.get_category_by_id(
-                        category_id, session
-                    )
-                    categories.append(category)
+                categories = await self.category_service.get_categories_by_ids(
+                    update_data.category_ids, session
+                )
 
             tags = None
             if update_data.tag_ids is not None:
-                tags = []
-                for tag_id in update_data.tag_ids:
-                    tag = await self.tag_service.get_tag_by_id(tag_id, session)
-                    tags.append(tag)
+                tags = await self.tag_service.get_tags_by_ids(
+                    update_data.tag_ids, session
+                )
 
             # Pass everything to the repository
             result = await self.repository.update_with_m2m(
@@ -155,6 +168,8 @@ class PostService:
                 field="title",
                 value=update_data.title,
             )
+        except EntityNotFoundException:
+            raise
         except Exception as e:
             raise InternalException(
                 message="An unexpected error occurred while updating the post.",
@@ -191,13 +206,268 @@ class PostService:
         Raises:
             EntityNotFoundException: If the post does not exist.
         """
-        result = await self.repository.get_by_id(id, session)
+        result = await self.repository.get_by_id(
+            id, session, profile=PostLoadProfile.DETAIL
+        )
 
         if result is None:
             raise EntityNotFoundException(Post.__name__, str(id))
 
         return result
 
+    async def list_posts(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cursor: str | None = None,
+        category_slug: str | None = None,
+        tag_slug: str | None = None,
+        author_id: int | None = None,
+    ) -> tuple[list[Post], str | None]:
+        """
+        List published posts, newest first, one page at a time.
+
+        Args:
+            session (AsyncSession): Database session.
+            limit (int): Page size.
+            cursor (str | None): Cursor returned with the previous page.
+            category_slug (str | None): Only posts in this category.
+            tag_slug (str | None): Only posts with this tag.
+            author_id (int | None): Only posts by this author.
+
+        Returns:
+            tuple[list[Post], str | None]: The posts and the cursor for the next page.
+
+        Raises:
+            InvalidRequestException: If the cursor is malformed.
+        """
+        after = decode_cursor(cursor, tuple[datetime, int]) if cursor else None
+        posts, next_key = await self.repository.list_published(
+            session,
+            limit=limit,
+            after=after,  # type: ignore
+            category_slug=category_slug,
+            tag_slug=tag_slug,
+            author_id=author_id,
+        )
+        return posts, encode_cursor(next_key) if next_key else None
+
+    async def import_posts(
+        self,
+        lines: AsyncIterable[tuple[int, bytes]],
+        current_user: User,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> ImportReport:
+        """
+        Import posts from NDJSON lines, batch by batch.
+
+        Each batch is validated, its category and tag slugs are resolved with
+        one query each, and the valid posts are written with COPY. Invalid
+        lines are reported and skipped; they do not affect the other lines.
+
+        Every batch runs in its own session and transaction and is committed
+        before the next one is read, so no connection or transaction is held
+        while the body streams in and report.imported counts durable rows. If
+        the import stops early (a malformed body, a disconnect), the batches
+        already committed stay; sending the file again rejects them as
+        existing slugs.
+
+        Args:
+            lines (AsyncIterable[tuple[int, bytes]]): Line numbers and ImportPost JSON.
+            current_user (User): The importing user, who becomes the author.
+            session_factory (async_sessionmaker[AsyncSession]): Opens the
+                session of each batch.
+
+        Returns:
+            ImportReport: Counts and the first rejected lines.
+        """
+        report = ImportReport()
+        batch: list[tuple[int, bytes]] = []
+        async for line in lines:
+            batch.append(line)
+            if len(batch) >= settings.POST_IMPORT_BATCH_SIZE:
+                await self._import_batch(batch, current_user, session_factory, report)
+                batch = []
+        await self._import_batch(batch, current_user, session_factory, report)
+
+        report.errors.sort(key=lambda error: error.line)
+        return report
+
+    async def export_posts(
+        self,
+        session: AsyncSession,
+        created_from: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> AsyncIterator[PostExport]:
+        """
+        Stream all posts, with category and tag slugs, in ID order.
+
+        Args:
+            session (AsyncSession): A session dedicated to the export.
+            created_from (datetime | None): Only posts created at or after this.
+            created_before (datetime | None): Only posts created before this.
+
+        Yields:
+            PostExport: The posts.
+        """
+        posts = self.repository.stream(
+            session,
+            created_from=created_from and to_naive_utc(created_from),
+            created_before=created_before and to_naive_utc(created_before),
+            options=self.repository.loader_options(PostLoadProfile.EXPORT),
+            yield_per=settings.EXPORT_BATCH_SIZE,
+        )
+        async for post in posts:
+            yield PostExport(
+                id=post.id,  # type: ignore
+                slug=post.slug,
+                title=post.title,
+                summary=post.summary,
+                body=post.body,  # type: ignore
+                featured_image=post.featured_image,
+                published_at=post.published_at,
+                view_count=post.view_count,
+                author_id=post.author_id,
+                categories=[category.slug for category in post.categories],
+                tags=[tag.slug for tag in post.tags],
+                created_at=post.created_at,
+                updated_at=post.updated_at,
+            )
+
+    async def _import_batch(
+        self,
+        batch: list[tuple[int, bytes]],
+        current_user: User,
+        session_factory: async_sessionmaker[AsyncSession],
+        report: ImportReport,
+    ) -> None:
+        """
+        Validate, copy and commit one batch of import lines, recording results
+        in report.
+        """
+        posts: dict[str, tuple[int, ImportPost]] = {}
+        for line_number, raw in batch:
+            try:
+                post = ImportPost.model_validate_json(raw)
+            except ValidationError as e:
+                _reject(report, line_number, _validation_message(e))
+                continue
+            slug = slugify(post.title)
+            if not slug:
+                _reject(report, line_number, "title does not produce a slug")
+            elif slug in posts:
+                _reject(
+                    report,
+                    line_number,
+                    f"slug '{slug}' duplicates line {posts[slug][0]}",
+                )
+            else:
+                posts[slug] = (line_number, post)
+        if not posts:
+            return
+
+        async with session_factory() as session:
+            await self._copy_batch(posts, current_user, session, report)
+
+    async def _copy_batch(
+        self,
+        posts: dict[str, tuple[int, ImportPost]],
+        current_user: User,
+        session: AsyncSession,
+        report: ImportReport,
+    ) -> None:
+        """
+        Resolve references of validated posts, then copy and commit them.
+        """
+        # Taxonomy and existing slugs: one query each for the whole batch
+        category_ids = await self.category_service.get_category_ids_by_slugs(
+            [slug for _, post in posts.values() for slug in post.categories], session
+        )
+        tag_ids = await self.tag_service.get_tag_ids_by_slugs(
+            [slug for _, post in posts.values() for slug in post.tags], session
+        )
+        existing = await self.repository.get_ids_by(Post.slug, list(posts), session)
+
+        rows: list[dict[str, Any]] = []
+        row_lines: list[int] = []
+        for slug, (line_number, post) in posts.items():
+            unknown = [
+                *(f"category '{c}'" for c in post.categories if c not in category_ids),
+                *(f"tag '{t}'" for t in post.tags if t not in tag_ids),
+            ]
+            if slug in existing:
+                _reject(report, line_number, f"slug '{slug}' already exists")
+            elif unknown:
+                _reject(report, line_number, f"unknown {', '.join(unknown)}")
+            else:
+                rows.append(
+                    _import_row(post, slug, current_user, category_ids, tag_ids)
+                )
+                row_lines.append(line_number)
+        if not rows:
+            return
+
+        try:
+            await self.repository.copy_posts(rows, session)
+            await session.commit()
+        except (SQLAlchemyError, PostgresError) as e:
+            # Only this batch is lost; earlier ones are already committed
+            logger.exception("Post import batch write failed")
+            await session.rollback()
+            attempted = {slug: posts[slug] for slug in (row["slug"] for row in rows)}
+            if _is_unique_violation(e) and await self.repository.get_ids_by(
+                Post.slug, list(attempted), session
+            ):
+                # A concurrent insert took a slug after the check above; retry
+                # so those rows are rejected like any existing slug
+                await session.rollback()
+                await self._copy_batch(attempted, current_user, session, report)
+                return
+            for line_number in row_lines:
+                _reject(report, line_number, "batch write failed")
+            return
+        report.imported += len(rows)
+
+
+def _reject(report: ImportReport, line: int, error: str) -> None:
+    report.failed += 1
+    if len(report.errors) < settings.POST_IMPORT_MAX_ERRORS:
+        report.errors.append(ImportRowError(line=line, error=error))
+
+
+def _is_unique_violation(error: Exception) -> bool:
+    if isinstance(error, DBAPIError):
+        error = error.orig
+    return getattr(error, "sqlstate", None) == UniqueViolationError.sqlstate
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'line'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def _import_row(
+    post: ImportPost,
+    slug: str,
+    author: User,
+    category_ids: dict[str, int],
+    tag_ids: dict[str, int],
+) -> dict[str, Any]:
+    return {
+        "published_at": post.published_at and to_naive_utc(post.published_at),
+        "title": post.title,
+        "slug": slug,
+        "summary": post.summary,
+        "featured_image": post.featured_image,
+        "view_count": post.view_count,
+        "body": json.dumps(post.body),
+        "author_id": author.id,
+        "category_ids": list(dict.fromkeys(category_ids[c] for c in post.categories)),
+        "tag_ids": list(dict.fromkeys(tag_ids[t] for t in post.tags)),
+    }
+
 
 @lru_cache
 def get_PostService(
@@ -0,0 +1,118 @@
+"""
+Buffered, batched view counting for posts.
+
+Incrementing view_count on every read would turn the hottest read path into a
+row-locking write. Instead, views are tallied in memory per post and written
+periodically in a single UPDATE. Counts buffered in a worker that dies without
+a clean shutdown are lost, which is acceptable for popularity data.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..common.db import SessionLocal
+from ..common.settings import settings
+from .repository import PostRepository, get_PostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    Aggregates post views in memory and flushes them in batches.
+
+    Args:
+        repository (PostRepository): Repository performing the batched UPDATE.
+        session_factory (async_sessionmaker[AsyncSession]): Sessions for flushing.
+        flush_interval_seconds (float): Time between periodic flushes.
+    """
+
+    def __init__(
+        self,
+        repository: PostRepository,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval_seconds: float,
+    ):
+        self.repository = repository
+        self.session_factory = session_factory
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: Counter[int] = Counter()
+        self._task: asyncio.Task | None = None
+
+    def record(self, post_id: int) -> None:
+        """
+        Count one view of a post. Never touches the database.
+
+        Args:
+            post_id (int): ID of the viewed post.
+        """
+        self._pending[post_id] += 1
+
+    async def flush(self) -> None:
+        """
+        Write all buffered views in a single UPDATE.
+
+        On failure the counts are put back so the next flush retries them.
+        """
+        if not self._pending:
+            return
+
+        # Swap the buffer so views recorded during the UPDATE go to the next batch
+        counts, self._pending = self._pending, Counter()
+        try:
+            async with self.session_factory.begin() as session:
+                await self.repository.increment_view_counts(dict(counts), session)
+        except asyncio.CancelledError:
+            # Cancelled by stop(): keep the batch for the final drain
+            self._pending.update(counts)
+            raise
+        except Exception as e:
+            self._pending.update(counts)
+            logger.error(f"Failed to flush view counts for {len(counts)} posts: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    def start(self) -> None:
+        """
+        Start flushing periodically in the background.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="post-view-counter")
+
+    async def stop(self) -> None:
+        """
+        Stop the periodic flush and drain the remaining buffered views.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+@lru_cache
+def get_ViewCounter() -> ViewCounter:
+    """
+    Dependency injector for the process-wide ViewCounter.
+    """
+    return ViewCounter(
+        get_PostRepository(),
+        SessionLocal,
+        flush_interval_seconds=settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS,
+    )
+
+
+ViewCounterDep = Annotated[ViewCounter, Depends(get_ViewCounter)]
@@ -9,13 +9,20 @@ from fastapi import APIRouter, Body, Depends, Request, status
 
 from ..auth.auth import authorize, get_current_active_user
 from ..auth.models import User
-from ..common.deps import AsyncSessionDep
+from ..common.db import release_connection
+from ..common.deps import AsyncSessionDep, ReadSessionDep
+from ..common.http_cache import (
+    not_modified_response,
+    records_etag,
+    with_cache_headers,
+)
 from ..common.http_responses.doc_responses import (
     ResponseErrorDoc,
     ResponseSuccessDoc,
 )
 from ..common.http_responses.success_response import SuccessCodes
 from ..common.http_responses.success_result import SuccessResult
+from ..common.query_budget import query_budget
 from ..common.user_role import UserRole
 from .schemas import CreateTag, TagPublic, UpdateTag
 from .service import TagService, get_TagService
@@ -162,15 +169,16 @@ async def delete_tag(
         **ResponseErrorDoc.HTTP_404_NOT_FOUND(),
     },
 )
+@query_budget(1)
 async def get_tag_by_id(
-    tag_id: int, session: AsyncSessionDep, service: TagServiceDep, request: Request
+    tag_id: int, session: ReadSessionDep, service: TagServiceDep, request: Request
 ):
     """
     Retrieve a tag by its ID.
 
     Args:
         tag_id (int): The ID of the tag to retrieve.
-        session (AsyncSessionDep): The database session.
+        session (ReadSessionDep): The read-only database session.
         service (TagServiceDep): The tag service dependency.
         request (Request): The HTTP request object.
 
@@ -178,6 +186,10 @@ async def get_tag_by_id(
         JSONResponse: The requested tag wrapped in a SuccessResult.
     """
     tag = await service.get_tag_by_id(tag_id, session)
+    await release_connection(session)
+    etag = records_etag([tag])
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
     public_tag = TagPublic.model_validate(tag)
     result = SuccessResult[TagPublic](
         code=SuccessCodes.SUCCESS,
@@ -185,7 +197,7 @@ async def get_tag_by_id(
         status_code=status.HTTP_200_OK,
         data=public_tag,
     )
-    return result.to_json_response(request)
+    return with_cache_headers(result.to_json_response(request), request, etag)
 
 
 @router.get(
@@ -196,12 +208,13 @@ async def get_tag_by_id(
         **ResponseErrorDoc.HTTP_500_INTERNAL_SERVER_ERROR(),
     },
 )
-async def list_tags(session: AsyncSessionDep, service: TagServiceDep, request: Request):
+@query_budget(1)
+async def list_tags(session: ReadSessionDep, service: TagServiceDep, request: Request):
     """
     Retrieve all tags.
 
     Args:
-        session (AsyncSessionDep): The database session.
+        session (ReadSessionDep): The read-only database session.
         service (TagServiceDep): The tag service dependency.
         request (Request): The HTTP request object.
 
@@ -209,6 +222,10 @@ async def list_tags(session: AsyncSessionDep, service: TagServiceDep, request: R
         JSONResponse: A list of tags wrapped in a SuccessResult.
     """
     tags = await service.get_all_tags(session)
+    await release_connection(session)
+    etag = records_etag(tags)
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
     public_tags = [TagPublic.model_validate(tag) for tag in tags]
     result = SuccessResult[list[TagPublic]](
         code=SuccessCodes.SUCCESS,
@@ -216,4 +233,4 @@ async def list_tags(session: AsyncSessionDep, service: TagServiceDep, request: R
         status_code=status.HTTP_200_OK,
         data=public_tags,
     )
-    return result.to_json_response(request)
+    return with_cache_headers(result.to_json_response(request), request, etag)
@@ -4,35 +4,55 @@ Handles business logic and error handling for tag CRUD operations.
 """
 
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, Sequence
 
 from fastapi import Depends
 from sqlalchemy.exc import IntegrityError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..common.db import after_commit
 from ..common.exceptions.exceptions import (
     DuplicateEntryException,
     EntityNotFoundException,
     InternalException,
 )
+from ..common.settings import settings
+from ..common.versioned_cache import (
+    VersionedCache,
+    get_cache_backend,
+    model_list_codec,
+)
 from .models import Tag
 from .repository import TagRepository, get_TagRepository
 from .schemas import CreateTag, UpdateTag
 
+_dump_tags, _load_tags = model_list_codec(Tag)
+
+# Taxonomy is read on nearly every page and written rarely
+tag_list_cache: VersionedCache[list[Tag]] = VersionedCache(
+    get_cache_backend(),
+    namespace="tags",
+    ttl_seconds=settings.TAXONOMY_CACHE_TTL_SECONDS,
+    dump=_dump_tags,
+    load=_load_tags,
+)
+
 
 class TagService:
     """
     Service class for managing Tag entities.
     """
 
-    def __init__(self, repo: TagRepository):
+    def __init__(self, repo: TagRepository, list_cache: VersionedCache[list[Tag]]):
         """
         Initialize TagService with a repository.
 
         Args:
             repo (TagRepository): The repository instance for Tag.
+            list_cache (VersionedCache[list[Tag]]): Cache for the full tag list.
         """
         self.repository = repo
+        self.list_cache = list_cache
 
     async def create_tag(self, data: CreateTag, session: AsyncSession) -> Tag:
         """
@@ -60,6 +80,7 @@ class TagService:
                 message="An unexpected error occurred while creating the category.",
                 underlying_error=e,
             )
+        after_commit(session, self.list_cache.invalidate)
         return tag_record
 
     async def update_tag(
@@ -93,6 +114,7 @@ class TagService:
                 underlying_error=e,
             )
 
+        after_commit(session, self.list_cache.invalidate)
         return updated_tag
 
     async def delete_tag(self, id: int, session: AsyncSession) -> Tag:
@@ -107,6 +129,7 @@ class TagService:
             Tag: The deleted tag instance.
         """
         result = await self.repository.delete(id, session)
+        after_commit(session, self.list_cache.invalidate)
         return result
 
     async def get_tag_by_id(self, id: int, session: AsyncSession) -> Tag:
@@ -128,6 +151,44 @@ class TagService:
             raise EntityNotFoundException(Tag.__name__, str(id))
         return result
 
+    async def get_tags_by_ids(
+        self, ids: Sequence[int], session: AsyncSession
+    ) -> list[Tag]:
+        """
+        Retrieve several tags by ID in a single query.
+
+        Args:
+            ids (Sequence[int]): IDs of the tags.
+            session (AsyncSession): Database session.
+
+        Returns:
+            list[Tag]: The tags, in the order of ids.
+
+        Raises:
+            EntityNotFoundException: If any of the IDs does not exist.
+        """
+        records, missing = await self.repository.get_many_by_ids(ids, session)
+        if missing:
+            raise EntityNotFoundException(
+                Tag.__name__, ", ".join(str(id) for id in missing)
+            )
+        return records
+
+    async def get_tag_ids_by_slugs(
+        self, slugs: Sequence[str], session: AsyncSession
+    ) -> dict[str, int]:
+        """
+        Resolve several tag slugs to IDs in a single query.
+
+        Args:
+            slugs (Sequence[str]): Slugs of the tags.
+            session (AsyncSession): Database session.
+
+        Returns:
+            dict[str, int]: Tag IDs keyed by slug; unknown slugs are absent.
+        """
+        return await self.repository.get_ids_by(Tag.slug, slugs, session)
+
     async def get_all_tags(self, session: AsyncSession) -> list[Tag]:
         """
         Retrieve all tags.
@@ -136,9 +197,11 @@ class TagService:
             session (AsyncSession): Database session.
 
         Returns:
-            list[Tag]: List of all tags.
+            list[Tag]: All tags, cached until a write or the TTL.
         """
-        return await self.repository.get_all(session)
+        return await self.list_cache.get_or_load(
+            "all", lambda: self.repository.get_all(session)
+        )
 
 
 @lru_cache
@@ -154,4 +217,4 @@ def get_TagService(
     Returns:
         TagService: The TagService instance.
     """
-    return TagService(tagRepository)
+    return TagService(tagRepository, tag_list_cache)